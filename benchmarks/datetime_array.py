@@ -0,0 +1,45 @@
+"""
+DatetimeArray operations against a loop over the same Datetime instances.
+
+Run with `python benchmarks/datetime_array.py [elements]`, on two commits to compare
+them. UTC has a fixed offset; America/New_York has daylight saving changes.
+"""
+
+import sys
+import time
+
+import timeless
+
+
+ZONES = ["UTC", "America/New_York"]
+
+CASES = {
+    "add(days=1)": {"days": 1},
+    "get_month_start()": {},
+    "set(hour=0, zone=None)": {"hour": 0, "zone": None},
+}
+
+
+def bench(function: object) -> float:
+    """Time a single call."""
+    begin = time.perf_counter()
+    function()  # type: ignore[operator]
+    return time.perf_counter() - begin
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    print(f"{'zone':>18} {'case':>24} {'array s':>10} {'loop s':>10}")
+    for zone in ZONES:
+        start = timeless.datetime(2022, 1, 1, zone=zone)
+        items = list(
+            timeless.lazy_period(start, start.add(minutes=count - 1), "minutes")
+        )
+        array = timeless.datetime_array(items)
+
+        for name, kwargs in CASES.items():
+            method = name.split("(")[0]
+            vectorized = bench(lambda: getattr(array, method)(**kwargs))
+            loop = bench(lambda: [getattr(item, method)(**kwargs) for item in items])
+            print(f"{zone:>18} {name:>24} {vectorized:>10.3f} {loop:>10.3f}")
@@ -0,0 +1,39 @@
+"""
+Datetime construction and derivation time.
+
+Run with `python benchmarks/datetime_construction.py [repetitions]`, on two commits
+to compare them.
+"""
+
+import sys
+import timeit
+
+import timeless
+
+
+ZONE = "America/Sao_Paulo"
+
+CASES = {
+    "datetime(..., zone=key)": "timeless.datetime(2020, 1, 31, 12, zone=ZONE)",
+    "datetime(..., zone=tzinfo)": "timeless.datetime(2020, 1, 31, 12, zone=dt.tzinfo)",
+    "dt.add(days=1)": "dt.add(days=1)",
+    "dt.add(months=1)": "dt.add(months=1)",
+    "dt.set(hour=0, zone=None)": "dt.set(hour=0, zone=None)",
+    "dt.set_zero()": "dt.set_zero()",
+    "dt.get_month_end()": "dt.get_month_end()",
+}
+
+
+if __name__ == "__main__":
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    scope = {"timeless": timeless, "ZONE": ZONE}
+    scope["dt"] = timeless.datetime(2020, 1, 31, 12, zone=ZONE)
+
+    print(f"{'case':>28} {'us/call':>10}")
+    for name, statement in CASES.items():
+        try:
+            elapsed = timeit.timeit(statement, globals=scope, number=number)
+        except TypeError:
+            print(f"{name:>28} {'unsupported':>10}")
+            continue
+        print(f"{name:>28} {elapsed / number * 1e6:>10.2f}")
@@ -0,0 +1,50 @@
+"""
+Memory held by Datetime instances, against plain aware datetimes.
+
+Run with `python benchmarks/datetime_memory.py [instances]`, on two commits to compare
+them.
+"""
+
+import sys
+import tracemalloc
+
+from datetime import datetime
+from datetime import timedelta
+
+import timeless
+
+
+def measure(build: type, count: int) -> int:
+    """Bytes allocated by a list of instances one minute apart."""
+    zone = timeless.datetime(2000, 1, 1).tzinfo
+    start = datetime(2000, 1, 1)
+    values = [start + timedelta(minutes=minute) for minute in range(count)]
+
+    tracemalloc.start()
+    instances = [
+        build(
+            value.year,
+            value.month,
+            value.day,
+            value.hour,
+            value.minute,
+            0,
+            0,
+            zone,
+        )
+        for value in values
+    ]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert len(instances) == count
+    return size
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    print(f"{'instance':>10} {'bytes':>12} {'bytes/instance':>15}")
+    for build in (datetime, timeless.datetime):
+        size = measure(build, count)
+        print(f"{build.__name__:>10} {size:>12} {size / count:>15.1f}")
@@ -0,0 +1,35 @@
+"""
+Period construction time against its number of elements.
+
+Run with `python benchmarks/period_construction.py [max elements] [freq]`.
+"""
+
+import sys
+import time
+
+import timeless
+
+
+def bench(count: int, freq: str) -> float:
+    """Build an hourly (by default) Period with the given number of elements."""
+    start = timeless.datetime(2000, 1, 1)
+    end = start.add(**{freq: count - 1})
+
+    begin = time.perf_counter()
+    period = timeless.period(start, end, freq=freq)
+    elapsed = time.perf_counter() - begin
+
+    assert len(period) == count
+    return elapsed
+
+
+if __name__ == "__main__":
+    limit = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    freq = sys.argv[2] if len(sys.argv) > 2 else "hours"
+
+    print(f"{'elements':>10} {'seconds':>10} {'us/element':>12}")
+    count = 1_000
+    while count <= limit:
+        elapsed = bench(count, freq)
+        print(f"{count:>10} {elapsed:>10.3f} {elapsed / count * 1e6:>12.2f}")
+        count *= 10
@@ -0,0 +1,37 @@
+"""
+Memory held by a Period, a LazyPeriod and a CompactPeriod of the same time span.
+
+Run with `python benchmarks/period_memory.py [elements]`.
+"""
+
+import sys
+import tracemalloc
+
+import timeless
+
+
+def measure(period_class: type, count: int) -> int:
+    """Bytes allocated by a minutely period with the given number of elements."""
+    start = timeless.datetime(2000, 1, 1)
+    end = start.add(minutes=count - 1)
+
+    tracemalloc.start()
+    period = period_class(start, end, freq="minutes")
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert len(period) == count
+    return size
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    print(f"{'period':>14} {'bytes':>12} {'bytes/element':>14}")
+    for period_class in (
+        timeless.period,
+        timeless.lazy_period,
+        timeless.compact_period,
+    ):
+        size = measure(period_class, count)
+        print(f"{period_class.__name__:>14} {size:>12} {size / count:>14.1f}")
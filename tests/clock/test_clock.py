@@ -0,0 +1,85 @@
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from datetime import timezone
+
+import pytest
+import timeless
+
+
+INSTANT = datetime(2020, 1, 15, 23, 30, 15, 250, tzinfo=timezone.utc)
+
+
+def test_fixed_clock():
+    with timeless.use_clock(timeless.fixed_clock(INSTANT)):
+        assert timeless.now() == timeless.datetime(2020, 1, 15, 23, 30, 15)
+        assert timeless.now(microseconds=True) == INSTANT
+        assert timeless.now("Asia/Tokyo") == timeless.datetime(
+            2020, 1, 16, 8, 30, 15, zone="Asia/Tokyo"
+        )
+        assert timeless.today() == timeless.datetime(2020, 1, 15)
+        assert timeless.today("Asia/Tokyo") == timeless.datetime(
+            2020, 1, 16, zone="Asia/Tokyo"
+        )
+        assert timeless.datetime(2020, 1, 15, 23, 31).is_future()
+        assert timeless.datetime(2020, 1, 15, 23, 30).is_past()
+
+    assert timeless.now().year > 2020
+
+
+def test_clock_context_is_local():
+    with timeless.use_clock(timeless.fixed_clock(INSTANT)):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            year = executor.submit(lambda: timeless.now().year).result()
+
+    assert year > 2020
+
+
+def test_set_clock():
+    timeless.set_clock(timeless.fixed_clock(INSTANT.replace(tzinfo=None)))
+    try:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(timeless.now).result().year == 2020
+    finally:
+        timeless.set_clock()
+
+    assert timeless.get_clock() is timeless.system_clock
+
+
+@pytest.mark.parametrize("clock", [timeless.clock, timeless.coarse_clock, "UTC"])
+def test_set_clock_rejects_non_clocks(clock):
+    with pytest.raises(TypeError):
+        timeless.set_clock(clock)
+
+    with pytest.raises(TypeError):
+        with timeless.use_clock(clock):
+            pass
+
+    assert timeless.get_clock() is timeless.system_clock
+
+
+def test_coarse_clock():
+    clock = timeless.coarse_clock(tick=60)
+
+    with timeless.use_clock(clock):
+        first = timeless.now(microseconds=True)
+        time.sleep(0.01)
+        assert timeless.now(microseconds=True) == first
+        assert clock.now(timezone.utc) is clock.now(timezone.utc)
+
+    assert abs(first.timestamp() - time.time()) < 60
+
+
+def test_coarse_clock_moves():
+    clock = timeless.coarse_clock(tick=0.001)
+    first = clock.micros()
+    time.sleep(0.01)
+
+    assert clock.micros() - first >= 9_000
+    assert clock.micros() % 1_000 == first % 1_000
+
+
+def test_coarse_clock_invalid_tick():
+    with pytest.raises(ValueError):
+        timeless.coarse_clock(tick=0)
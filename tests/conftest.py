@@ -1,3 +1,14 @@
+import pytest
+import timeless
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "array"])
+def numpy(request, monkeypatch):
+    if not request.param:
+        monkeypatch.setattr(timeless.epoch, "np", None)
+    return request.param
+
+
 def assert_datetime(
     d, year, month, day, hour=None, minute=None, second=None, microsecond=None
 ):
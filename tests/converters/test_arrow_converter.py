@@ -0,0 +1,89 @@
+from datetime import timedelta
+from datetime import timezone
+
+import numpy as np
+import pytest
+import timeless
+
+
+pa = pytest.importorskip("pyarrow")
+
+
+@pytest.mark.parametrize(
+    "period",
+    [
+        timeless.period("2020-01-01", "2020-01-05", freq="hours", step=5),
+        timeless.lazy_period("2020-01-31", "2020-12-31", freq="months"),
+        timeless.compact_period(
+            timeless.datetime(2021, 3, 27, zone="Europe/London"),
+            timeless.datetime(2021, 3, 29, zone="Europe/London"),
+            freq="minutes",
+            step=45,
+        ),
+        timeless.datetime_array(
+            [timeless.datetime(2020, 1, 2), timeless.datetime(2019, 5, 1, 10)],
+            zone=timezone(timedelta(hours=5, minutes=30)),
+        ),
+    ],
+)
+def test_pa_timestamp_array_round_trip(period):
+    arr = timeless.to_pa_timestamp_array(period)
+    array = timeless.from_pa_timestamp_array(arr)
+
+    assert arr.type.unit == "us"
+    assert arr.to_pylist() == list(period)
+    assert list(array) == list(period)
+    assert [item.utcoffset() for item in array] == [item.utcoffset() for item in period]
+
+
+def test_pa_timestamp_array_shares_buffer():
+    period = timeless.compact_period("2020-01-01", "2020-02-01", freq="hours")
+
+    arr = timeless.to_pa_timestamp_array(period)
+    array = timeless.from_pa_timestamp_array(arr)
+
+    assert arr.buffers()[1].address == period.values.ctypes.data
+    assert np.shares_memory(array.values, period.values)
+
+
+@pytest.mark.parametrize(
+    "unit, rounding, expected",
+    [
+        ("s", "truncate", timeless.datetime(1970, 1, 1, 9, 0, 1, zone="Asia/Tokyo")),
+        ("ns", "truncate", timeless.datetime(1970, 1, 1, 0, 0, 0, 1)),
+        ("ns", "round", timeless.datetime(1970, 1, 1, 0, 0, 0, 2)),
+    ],
+)
+def test_from_pa_timestamp_array_units(unit, rounding, expected):
+    value = 1 if unit == "s" else 1_500
+    arr = pa.array([value], pa.timestamp(unit, tz=expected.zone))
+
+    array = timeless.from_pa_timestamp_array(arr, rounding=rounding)
+
+    assert list(array) == [expected]
+    assert array.zone == expected.zone
+
+
+def test_from_pa_timestamp_array_period():
+    arr = pa.chunked_array(
+        [
+            pa.array([0, 3_600_000_000], pa.timestamp("us")),
+            pa.array([10], "timestamp[us]"),
+        ]
+    )
+
+    period = timeless.from_pa_timestamp_array(
+        arr, zone="America/Sao_Paulo", output="period"
+    )
+
+    assert isinstance(period, timeless.compact_period)
+    assert period.zone == "America/Sao_Paulo"
+    assert len(period) == 3
+
+    with pytest.raises(TypeError):
+        timeless.from_pa_timestamp_array(
+            pa.array([1, 1], "timestamp[us]"), output="period"
+        )
+
+    with pytest.raises(ValueError):
+        timeless.from_pa_timestamp_array(pa.array([1, None], "timestamp[us]"))
@@ -1,3 +1,5 @@
+import numpy as np
+import pytest
 import timeless
 
 from numpy import datetime64
@@ -28,3 +30,105 @@ def test_from_np_datetime64_utc():
 
     assert isinstance(dt_np, timeless.datetime)
     assert dt_ref == dt_np
+
+
+def test_to_np_datetime64_half_hour_timezone():
+    dt = timeless.datetime(1975, 1, 1, 15, 10, 5, 123, zone="Asia/Kolkata")
+
+    assert timeless.to_np_datetime64(dt) == datetime64("1975-01-01T09:40:05.000123")
+
+
+@pytest.mark.parametrize(
+    "value, zone, expected",
+    [
+        ("2020-07-01T12:00", "America/Sao_Paulo", (2020, 7, 1, 9)),
+        ("2020-07-01T12:00", "Asia/Kolkata", (2020, 7, 1, 17, 30)),
+        ("2021-03-28T01:30", "Europe/London", (2021, 3, 28, 2, 30)),
+        ("1969-12-31T23:59:59.999999999", "UTC", (1969, 12, 31, 23, 59, 59, 999999)),
+    ],
+)
+def test_from_np_datetime64_timezone(value, zone, expected):
+    dt = timeless.from_np_datetime64(datetime64(value), zone)
+
+    assert dt == timeless.datetime(*expected, zone=zone)
+    assert dt.zone == zone
+
+
+def test_from_np_datetime64_nat():
+    with pytest.raises(ValueError):
+        timeless.from_np_datetime64(datetime64("NaT"))
+
+
+@pytest.mark.parametrize(
+    "period",
+    [
+        timeless.period("2020-01-01", "2020-01-05", freq="hours", step=5),
+        timeless.lazy_period("2020-01-31", "2020-12-31", freq="months"),
+        timeless.compact_period(
+            timeless.datetime(2021, 3, 27, zone="Asia/Kolkata"),
+            timeless.datetime(2021, 3, 29, zone="Asia/Kolkata"),
+            freq="minutes",
+            step=45,
+        ),
+    ],
+)
+def test_np_datetime64_array_round_trip(period):
+    values = timeless.to_np_datetime64_array(period)
+    array = timeless.from_np_datetime64_array(values, period.start.zone)
+
+    assert values.dtype == np.dtype("datetime64[us]")
+    assert list(values) == [timeless.to_np_datetime64(item) for item in period]
+    assert list(array) == list(period)
+    assert [item.zone for item in array] == [item.zone for item in period]
+
+
+def test_from_np_datetime64_array_nat():
+    with pytest.raises(ValueError):
+        timeless.from_np_datetime64_array(np.array(["2020-01-01", "NaT"], "M8[s]"))
+
+
+@pytest.mark.parametrize(
+    "value, unit, rounding, expected",
+    [
+        ("2020-03", "M", "truncate", (2020, 3, 1)),
+        ("2020-01-01T10:00:01", "s", "round", (2020, 1, 1, 10, 0, 1)),
+        ("2020-01-01T10:00:01.123", "ms", "truncate", (2020, 1, 1, 10, 0, 1, 123000)),
+        (
+            "9999-12-31T23:59:59.999999",
+            "us",
+            "truncate",
+            (9999, 12, 31, 23, 59, 59, 999999),
+        ),
+        ("2020-01-01T00:00:00.0000015", "ns", "truncate", (2020, 1, 1, 0, 0, 0, 1)),
+        ("2020-01-01T00:00:00.0000015", "ns", "round", (2020, 1, 1, 0, 0, 0, 2)),
+        ("2020-01-01T00:00:00.0000025", "ns", "round", (2020, 1, 1, 0, 0, 0, 2)),
+        ("2020-01-01T00:00:00.0000026", "ns", "round", (2020, 1, 1, 0, 0, 0, 3)),
+        (
+            "1969-12-31T23:59:59.9999995",
+            "ns",
+            "truncate",
+            (1969, 12, 31, 23, 59, 59, 999999),
+        ),
+        ("1969-12-31T23:59:59.9999995", "ns", "round", (1970, 1, 1)),
+        (
+            "2262-04-11T23:47:16.854775807",
+            "ns",
+            "truncate",
+            (2262, 4, 11, 23, 47, 16, 854775),
+        ),
+    ],
+)
+def test_from_np_datetime64_units(value, unit, rounding, expected):
+    dt = datetime64(value, unit)
+
+    assert timeless.from_np_datetime64(dt, rounding=rounding) == timeless.datetime(
+        *expected
+    )
+    assert list(
+        timeless.from_np_datetime64_array(np.array([dt]), rounding=rounding)
+    ) == [timeless.datetime(*expected)]
+
+
+def test_from_np_datetime64_unknown_rounding():
+    with pytest.raises(ValueError):
+        timeless.from_np_datetime64(datetime64("2020-01-01"), rounding="ceil")
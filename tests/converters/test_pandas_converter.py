@@ -1,3 +1,5 @@
+import pandas as pd
+import pytest
 import timeless
 
 from pandas import Timestamp
@@ -38,3 +40,133 @@ def test_from_pd_timestamp_arbitrary_offset():
 
     assert isinstance(dt_pd, timeless.datetime)
     assert dt_ref.hour + offset == dt_pd.hour
+
+
+@pytest.mark.parametrize(
+    "index",
+    [
+        pd.date_range("2020-01-01", periods=48, freq="H"),
+        pd.date_range("2021-03-27", periods=72, freq="30T", tz="Europe/London"),
+        pd.date_range("2020-01-31", periods=5, freq="M", tz="America/Sao_Paulo"),
+        pd.DatetimeIndex(["2020-01-05 10:00", "2020-01-01", "2020-02-29 23:59:59"]),
+        pd.DatetimeIndex(["1969-12-31 23:59:59.5", "2020-01-01 00:00:00.000001"]),
+        pd.DatetimeIndex(["2020-01-01T00:00:00+03:00", "2020-01-02T12:00:00+03:00"]),
+    ],
+)
+def test_from_pd_datetimeindex(index):
+    period = timeless.from_pd_datetimeindex(index)
+    zone = index.tz.zone if getattr(index.tz, "zone", None) else "UTC"
+    expected = [
+        timeless.from_pd_timestamp(timestamp.tz_convert(zone))
+        if index.tz is not None
+        else timeless.from_pd_timestamp(timestamp)
+        for timestamp in index
+    ]
+
+    assert isinstance(period, timeless.compact_period)
+    assert list(period) == expected
+    assert period.zone == zone
+    assert list(period.values) == list(index.asi8 // 1000)
+
+
+def test_from_pd_datetimeindex_freq():
+    period = timeless.from_pd_datetimeindex(
+        pd.date_range("2020-01-01", periods=3, freq="2H")
+    )
+    irregular = timeless.from_pd_datetimeindex(
+        pd.DatetimeIndex(["2020-01-01", "2020-01-03"])
+    )
+
+    assert (period.freq, period.step) == ("hours", 2)
+    assert irregular.freq is None
+
+
+def test_from_pd_datetimeindex_duplicates():
+    with pytest.raises(TypeError):
+        timeless.from_pd_datetimeindex(pd.DatetimeIndex(["2020-01-01", "2020-01-01"]))
+
+
+def test_from_pd_datetimeindex_nat():
+    with pytest.raises(ValueError):
+        timeless.from_pd_datetimeindex(pd.DatetimeIndex(["2020-01-01", None]))
+
+
+@pytest.mark.parametrize(
+    "period, freq",
+    [
+        (timeless.period("2020-01-01", "2020-01-03", freq="hours", step=3), "3H"),
+        (timeless.lazy_period("2020-01-01", "2020-03-01", freq="days"), "D"),
+        (timeless.compact_period("2020-01-01", "2021-01-01", freq="months"), "MS"),
+        (timeless.compact_period("2020-01-31", "2021-01-31", freq="months"), None),
+        (timeless.period("2020-01-05", "2020-03-01", freq="weeks"), "W-SUN"),
+        (
+            timeless.period(
+                timeless.datetime(2021, 3, 27, zone="Europe/London"),
+                timeless.datetime(2021, 3, 30, zone="Europe/London"),
+            ),
+            "D",
+        ),
+        (
+            timeless.compact_period(
+                timeless.datetime(2021, 3, 28, zone="Europe/London"),
+                timeless.datetime(2021, 3, 28, 5, zone="Europe/London"),
+                freq="hours",
+            ),
+            None,
+        ),
+    ],
+)
+def test_to_pd_datetimeindex(period, freq):
+    index = timeless.to_pd_datetimeindex(period)
+    expected = pd.DatetimeIndex([timeless.to_pd_timestamp(item) for item in period])
+
+    assert list(index) == list(expected)
+    assert str(index.tz) == period.start.zone
+    assert index.freqstr == freq
+
+
+def test_to_pd_datetimeindex_irregular():
+    period = timeless.period("2020-01-01", "2020-01-05")
+    period.remove(timeless.datetime(2020, 1, 3))
+    array = timeless.datetime_array(period, "Asia/Tokyo")
+
+    assert list(timeless.to_pd_datetimeindex(period)) == list(period)
+    assert list(timeless.to_pd_datetimeindex(array)) == list(array)
+    assert str(timeless.to_pd_datetimeindex(array).tz) == "Asia/Tokyo"
+
+
+def test_to_pd_series():
+    period = timeless.compact_period("2020-01-01", "2020-01-10")
+
+    series = timeless.to_pd_series(period, name="dates")
+
+    assert series.name == "dates"
+    assert list(series) == list(period)
+    assert timeless.from_pd_datetimeindex(pd.DatetimeIndex(series)) == period
+
+
+def test_pd_datetimeindex_round_trip_daylight_saving_gap():
+    compact = timeless.compact_period(
+        timeless.datetime(2021, 3, 14, zone="America/New_York"),
+        timeless.datetime(2021, 3, 14, 5, zone="America/New_York"),
+        freq="minutes",
+    )
+
+    period = timeless.from_pd_datetimeindex(timeless.to_pd_datetimeindex(compact))
+
+    assert list(period) == list(compact)
+
+
+@pytest.mark.parametrize("cls", [timeless.period, timeless.lazy_period])
+def test_to_pd_datetimeindex_daylight_saving_gap(cls):
+    period = cls(
+        timeless.datetime(2022, 3, 13, zone="America/New_York"),
+        timeless.datetime(2022, 3, 13, 5, zone="America/New_York"),
+        freq="hours",
+    )
+
+    index = timeless.to_pd_datetimeindex(period)
+
+    assert len(index) == len(period)
+    assert list(index) == [timeless.to_pd_timestamp(item) for item in period]
+    assert len(timeless.to_np_datetime64_array(period)) == len(period)
@@ -1,6 +1,10 @@
+from datetime import datetime
+
 import pytest
 import timeless
 
+from dateutil.relativedelta import relativedelta
+
 
 @pytest.mark.parametrize(
     "offset_value, expected_result",
@@ -62,3 +66,24 @@ def test_add_seconds(offset_value, expected_result):
         timeless.datetime(1975, 5, 21).add(seconds=offset_value).second
         == expected_result
     )
+
+
+@pytest.mark.parametrize("zone", ["UTC", "America/Sao_Paulo", "Asia/Kolkata"])
+@pytest.mark.parametrize(
+    "delta",
+    [
+        {"days": 1},
+        {"hours": -30, "minutes": 61},
+        {"seconds": 86399, "microseconds": 1000001},
+        {"days": 1.5},
+    ],
+)
+def test_add_fixed_units_matches_relativedelta(zone, delta):
+    obj = timeless.datetime(2020, 10, 31, 23, 30, zone=zone)
+    expected = datetime(*list(obj)[:7]) + relativedelta(**delta)
+
+    for result in (obj.add(**delta), obj.subtract(**{k: -v for k, v in delta.items()})):
+        assert isinstance(result, timeless.datetime)
+        assert datetime(*list(result)[:7]) == expected
+        assert result.tzinfo is obj.tzinfo
+        assert result.zone == zone
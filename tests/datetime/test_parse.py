@@ -0,0 +1,57 @@
+import pytest
+import timeless
+
+from dateutil import parser
+
+
+def _dateutil_parse(string, zone=None, day_first=False, year_first=False):
+    parsed = parser.parse(
+        string, parser.parserinfo(dayfirst=day_first, yearfirst=year_first)
+    )
+    zone = zone or parsed.tzname() or "UTC"
+    return timeless.datetime(*parsed.timetuple()[:6], parsed.microsecond, zone=zone)
+
+
+@pytest.mark.parametrize(
+    "string",
+    [
+        "2020-01-02",
+        "0099-12-31",
+        "2020-01-02T03",
+        "2020-01-02T03:04",
+        "2020-01-02 03:04:05",
+        "2020-01-02T03:04:05.1",
+        "2020-01-02T03:04:05,5",
+        "2020-01-02T03:04:05.123456789",
+        "2020-01-02T03:04Z",
+        "2020-01-02T03:04:05z",
+        "2020-01-02T03:04:05+03",
+        "2020-01-02T03:04:05+0330",
+        "2020-01-02T03:04:05.25-03:30",
+        "2020-01-02T03:04:05+00:00",
+        "2020-02-29T23:59:59.999999-00:00",
+        "2020-01-02T03:04:05 +03:00",
+        "20200102T030405",
+        "Jan 2 2020 3:04 PM",
+        "02/01/2020",
+    ],
+)
+@pytest.mark.parametrize("zone", [None, "Asia/Tokyo"])
+@pytest.mark.parametrize("year_first", [False, True])
+@pytest.mark.parametrize("day_first", [False, True])
+def test_parse_matches_dateutil(string, zone, day_first, year_first):
+    kwargs = {"zone": zone, "day_first": day_first, "year_first": year_first}
+    expected = _dateutil_parse(string, **kwargs)
+
+    parsed = timeless.parse(string, **kwargs)
+
+    assert parsed == expected
+    assert parsed.zone == expected.zone
+
+
+@pytest.mark.parametrize(
+    "string", ["2020-01-02T24:00", "2020-02-30", "2020-01-02Z", "not a date"]
+)
+def test_parse_invalid(string):
+    with pytest.raises(ValueError):
+        timeless.parse(string)
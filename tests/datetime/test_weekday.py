@@ -0,0 +1,72 @@
+import calendar
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import timeless
+
+from dateutil import relativedelta
+
+
+WEEKDAYS = [
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+    "sunday",
+]
+
+
+@pytest.mark.parametrize("weekday", WEEKDAYS)
+@pytest.mark.parametrize("day", range(1, 15))
+def test_get_next_and_last(weekday, day):
+    dt = timeless.datetime(2020, 2, day, 13, 30, zone="America/Sao_Paulo")
+    anchor = getattr(timeless.weekdays, weekday)
+
+    next_ = dt + relativedelta.relativedelta(days=1, weekday=anchor)
+    last = dt + relativedelta.relativedelta(days=-1, weekday=anchor(-1))
+
+    assert dt.get_next(weekday) == timeless.datetime(
+        next_.year, next_.month, next_.day, zone="America/Sao_Paulo"
+    )
+    assert dt.get_last(weekday) == timeless.datetime(
+        last.year, last.month, last.day, zone="America/Sao_Paulo"
+    )
+
+
+@pytest.mark.parametrize(
+    "day, weekday, expected",
+    [
+        (3, "friday", timeless.datetime(2020, 1, 3, 8)),
+        (1, "friday", timeless.datetime(2020, 1, 3)),
+        (2, "wednesday", timeless.datetime(2020, 1, 1)),
+        (1, "tuesday", timeless.datetime(2020, 1, 7)),
+        (20, "friday", timeless.datetime(2020, 1, 17)),
+        (31, "Friday", timeless.datetime(2020, 1, 31, 8)),
+    ],
+)
+def test_get_first_weekday_in_month(day, weekday, expected):
+    dt = timeless.datetime(2020, 1, day, 8)
+
+    assert timeless.get_first_weekday_in_month(dt, weekday) == expected
+
+
+def test_weekday_name_keeps_calendar_state():
+    first_weekday = calendar.firstweekday()
+    dt = timeless.datetime(2020, 1, 1)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        names = list(
+            executor.map(lambda day: dt.get_weekday_name(week_start=day), WEEKDAYS * 50)
+        )
+
+    assert names == ["wednesday"] * len(names)
+    assert calendar.firstweekday() == first_weekday
+    assert dt.is_today("Wednesday", week_start="sunday")
+
+
+def test_weekday_name_invalid_week_start():
+    with pytest.raises(KeyError):
+        timeless.datetime(2020, 1, 1).get_weekday_name(week_start="someday")
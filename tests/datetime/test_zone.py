@@ -0,0 +1,72 @@
+import copy
+import pickle
+
+from datetime import timedelta
+
+import pytest
+import timeless
+
+
+try:  # Python <3.9
+    from zoneinfo import ZoneInfo  # type: ignore
+except ImportError:
+    from backports.zoneinfo import ZoneInfo  # type: ignore
+
+
+@pytest.mark.parametrize("zone", ["UTC", "America/Sao_Paulo", ZoneInfo("Asia/Tokyo")])
+def test_zone_key_or_object(zone):
+    dt = timeless.datetime(2020, 1, 1, zone=zone)
+
+    assert dt.zone == str(zone)
+    assert dt.tzinfo is timeless.datetime(2020, 1, 1, zone=str(zone)).tzinfo
+
+
+@pytest.mark.parametrize(
+    "derive",
+    [
+        lambda dt: dt.add(days=1),
+        lambda dt: dt.add(months=1),
+        lambda dt: dt.subtract(years=1),
+        lambda dt: dt.set(day=2, zone=None),
+        lambda dt: dt.set_zero(),
+        lambda dt: dt.get_next("monday"),
+        lambda dt: dt.get_month_end(),
+        lambda dt: dt + timedelta(hours=1),
+    ],
+)
+def test_derived_instances_share_zone(derive):
+    dt = timeless.datetime(2020, 1, 1, 12, zone="America/Sao_Paulo")
+
+    derived = derive(dt)
+
+    assert isinstance(derived, timeless.datetime)
+    assert derived.tzinfo is dt.tzinfo
+    assert derived.zone == "America/Sao_Paulo"
+
+
+def test_instances_have_no_dict():
+    dt = timeless.datetime(2020, 1, 1, zone="America/Sao_Paulo")
+
+    assert not hasattr(dt, "__dict__")
+    assert not hasattr(dt.set(day=2), "__dict__")
+
+
+def test_instances_from_set_have_zone():
+    dt = timeless.datetime(2020, 1, 1).set(day=3, zone="Asia/Tokyo")
+
+    assert dt.zone == "Asia/Tokyo"
+    assert dt.get_next("monday") == timeless.datetime(2020, 1, 6, zone="Asia/Tokyo")
+
+
+@pytest.mark.parametrize("fold", [0, 1])
+def test_pickle_roundtrip(fold):
+    dt = timeless.datetime(2021, 11, 7, 1, 30, zone="America/New_York")
+    dt = dt.replace(fold=fold)
+
+    loaded = pickle.loads(pickle.dumps(dt))
+
+    assert isinstance(loaded, timeless.datetime)
+    assert loaded == dt
+    assert loaded.fold == fold
+    assert loaded.tzinfo is dt.tzinfo
+    assert copy.deepcopy(dt) == dt
@@ -0,0 +1,117 @@
+import pytest
+import timeless
+
+
+ZONES = ["UTC", "Asia/Kolkata", "America/Sao_Paulo"]
+
+
+def _items(zone):
+    return [
+        timeless.datetime(2020, 1, 31, 10, 30, 15, 500, zone=zone),
+        timeless.datetime(2019, 2, 28, 23, 59, zone=zone),
+        timeless.datetime(2000, 2, 29, zone=zone),
+        timeless.datetime(1969, 12, 31, 12, zone=zone),
+        timeless.datetime(2100, 11, 30, 1, 2, 3, zone=zone),
+    ]
+
+
+@pytest.mark.parametrize("zone", ZONES)
+@pytest.mark.parametrize(
+    "method, kwargs",
+    [
+        ("add", {"days": 3, "hours": -5}),
+        ("add", {"months": 1}),
+        ("add", {"years": -1, "minutes": 90}),
+        ("subtract", {"months": 13, "seconds": 30}),
+        ("set", {"day": 1, "hour": 3, "zone": None}),
+        ("set", {"year": 2004, "month": 3, "second": 0}),
+        ("set", {"microsecond": 7}),
+        ("set_zero", {}),
+        ("get_month_start", {}),
+        ("get_month_end", {}),
+        ("get_next", {"weekday": "friday"}),
+        ("get_next", {"weekday": "thursday"}),
+        ("get_last", {"weekday": "monday"}),
+        ("get_last", {"weekday": "wednesday"}),
+    ],
+)
+def test_array_matches_datetime(numpy, zone, method, kwargs):
+    items = _items(zone)
+    expected = [getattr(item, method)(**kwargs) for item in items]
+
+    result = getattr(timeless.datetime_array(items), method)(**kwargs)
+
+    assert isinstance(result, timeless.datetime_array)
+    assert list(result) == expected
+    assert [item.zone for item in result] == [item.zone for item in expected]
+
+
+@pytest.mark.parametrize(
+    "method, kwargs",
+    [
+        ("add", {"hours": 1}),
+        ("add", {"days": 1, "minutes": 30}),
+        ("subtract", {"months": 1}),
+        ("set", {"hour": 2, "zone": None}),
+        ("set", {"hour": 1, "minute": 30, "zone": None}),
+        ("get_month_start", {}),
+        ("get_next", {"weekday": "sunday"}),
+    ],
+)
+def test_array_matches_datetime_daylight_saving(numpy, method, kwargs):
+    # every 30 minutes around the spring and fall 2022 changes
+    values = [
+        start + minutes * 60_000_000
+        for start in (1_647_043_200_000_000, 1_667_606_400_000_000)
+        for minutes in range(0, 3 * 1440, 30)
+    ]
+    items = list(timeless.datetime_array.from_epoch(values, "America/New_York"))
+    expected = [getattr(item, method)(**kwargs) for item in items]
+
+    result = getattr(timeless.datetime_array(items), method)(**kwargs)
+
+    # wall times in the gap (kept by Datetime) are stored as the instant they mean
+    assert list(result.values) == [timeless.epoch.utc_micros(item) for item in expected]
+
+
+@pytest.mark.parametrize("zone", ZONES)
+def test_array_calendar_values(numpy, zone):
+    items = _items(zone)
+    array = timeless.datetime_array(items)
+
+    assert list(array.is_leap()) == [item.is_leap() for item in items]
+    assert list(array.days_in_month) == [item.days_in_month for item in items]
+    assert array.get_weekday_name() == [item.get_weekday_name() for item in items]
+    assert array.format() == [item.format() for item in items]
+    assert array.format("%d/%m/%Y %H") == [item.format("%d/%m/%Y %H") for item in items]
+
+
+@pytest.mark.parametrize("zone", ZONES)
+@pytest.mark.parametrize("weekday", ["monday", "wednesday", "saturday"])
+def test_array_first_weekday_in_month(numpy, zone, weekday):
+    items = [
+        timeless.datetime(2020, 1, day, 8, zone=zone)
+        for day in (1, 2, 3, 4, 5, 6, 7, 8, 15, 29, 31)
+    ]
+    expected = [timeless.get_first_weekday_in_month(item, weekday) for item in items]
+
+    result = timeless.datetime_array(items).get_first_weekday_in_month(weekday)
+
+    assert list(result) == expected
+
+
+def test_array_set_invalid_day(numpy):
+    array = timeless.datetime_array(_items("UTC"))
+
+    with pytest.raises(ValueError):
+        array.set(month=2, day=30)
+
+
+def test_array_from_epoch():
+    array = timeless.datetime_array.from_epoch([0, 86_400_000_000], zone="Asia/Tokyo")
+
+    assert len(array) == 2
+    assert array[0] == timeless.datetime(1970, 1, 1, 9, zone="Asia/Tokyo")
+    assert array[1:] == [timeless.datetime(1970, 1, 2, 9, zone="Asia/Tokyo")]
+    assert array.zone == "Asia/Tokyo"
+    assert timeless.datetime_array() == []
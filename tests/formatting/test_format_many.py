@@ -0,0 +1,66 @@
+import io
+
+from datetime import timedelta
+from datetime import timezone
+
+import pytest
+import timeless
+
+
+DATETIMES = [
+    timeless.datetime(2020, 1, 2, 3, 4, 5, 6, zone="America/Sao_Paulo"),
+    timeless.datetime(2021, 3, 28, 1, 30, zone="Europe/London"),
+    timeless.datetime(2021, 10, 31, 1, 30, zone="Europe/London"),
+    timeless.datetime(99, 1, 1, zone="UTC"),
+    timeless.datetime(2020, 6, 1, 12, zone=timezone(timedelta(hours=5, seconds=10))),
+    timeless.datetime(1969, 12, 31, 23, 59, 59, 999_999, zone="Asia/Kolkata"),
+]
+
+FORMATS = [
+    None,
+    "%Y-%m-%d",
+    "%d/%m/%y %H:%M:%S.%f",
+    "%Y%m%dT%H%M%S%z",
+    "{%Y} %Z %% %z",
+    "%A, %B %d %Y %I%p",
+]
+
+
+@pytest.mark.parametrize("format", FORMATS)
+def test_formatter_matches_format(format):
+    formatter = timeless.formatter(format)
+
+    assert [formatter(dt) for dt in DATETIMES] == [
+        dt.format(format) for dt in DATETIMES
+    ]
+
+
+@pytest.mark.parametrize("format", FORMATS)
+@pytest.mark.parametrize(
+    "zone", ["UTC", "America/Sao_Paulo", "Europe/London", timezone(timedelta(hours=-3))]
+)
+def test_format_many_buffers(format, zone):
+    start = timeless.datetime(2021, 3, 27, zone=zone)
+    end = timeless.datetime(2021, 11, 1, zone=zone)
+    compact = timeless.compact_period(start, end, freq="hours", step=7)
+    expected = [item.format(format) for item in compact]
+
+    assert timeless.format_many(compact, format) == expected
+    assert timeless.format_many(timeless.period(start, end, "hours", 7), format) == (
+        expected
+    )
+    assert timeless.datetime_array(compact, zone).format(format) == expected
+
+
+def test_format_many_outputs():
+    period = timeless.period("2020-01-01", "2020-01-03")
+    stream = io.StringIO()
+
+    assert timeless.format_many(period, "%d", output="str", separator=",") == (
+        "01,02,03"
+    )
+    assert timeless.format_many(period, "%d", output=stream) == 3
+    assert stream.getvalue() == "01\n02\n03\n"
+
+    with pytest.raises(ValueError):
+        timeless.format_many(period, output="set")
@@ -0,0 +1,81 @@
+import pytest
+import timeless
+
+
+@pytest.mark.parametrize(
+    "strings, kwargs",
+    [
+        (["2020-01-02T03:04:05Z", "2020-01-03 00:00:01.5+03:00", "2021-12-31"], {}),
+        (["01/02/2020", "12/31/2020 10:00", "13/01/2020"], {}),
+        (["01/02/2020", "31/12/2020", "05/06/2021"], {"day_first": True}),
+        (["02.01.2020", "31.12.2020 23:59"], {"zone": "Asia/Tokyo"}),
+        (["01/01/2020", "02/01/2020", "13/01/2020"], {"day_first": True}),
+        (["01/01/2020", "02/01/2020", "13/01/2020"], {}),
+        (["2020/01/01", "2020/02/01"], {"day_first": True}),
+        (["01-01-2020 10:00", "02-01-2020 10:00"], {"year_first": True}),
+        (["20200102", "20201231", "2020-01-02"], {}),
+        (["20200102T030405", "20201231T235959"], {}),
+        (["Jan 2 2020", "2020-01-03", "March 4, 2021 5pm"], {}),
+        (
+            ["2020/1/2 3:4:5.25", "2020/12/31 23:59:59.000001"],
+            {"format": "%Y/%m/%d %H:%M:%S.%f"},
+        ),
+        (["2020-01-02 03h", "2020-01-03 04h"], {"format": "%Y-%m-%d %Hh"}),
+    ],
+)
+def test_parse_many_matches_parse(strings, kwargs):
+    expected = [timeless.parse(string, **kwargs) for string in strings]
+
+    parsed = timeless.parse_many(strings, sample_size=1, **kwargs)
+
+    assert parsed == expected
+    assert [item.zone for item in parsed] == [item.zone for item in expected]
+
+
+def test_parse_many_stream():
+    strings = (f"2020-01-{day:02d} 12:00" for day in range(1, 32))
+
+    parsed = timeless.parse_many(strings, sample_size=4)
+
+    assert parsed == list(timeless.period("2020-01-01 12:00", "2020-01-31 12:00"))
+
+
+def test_parse_many_outputs():
+    strings = ["03/01/2020", "01/01/2020", "02/01/2020"]
+
+    period = timeless.parse_many(strings, output="period", day_first=True)
+    array = timeless.parse_many(strings, output="array", zone="Asia/Tokyo")
+
+    assert isinstance(period, timeless.period)
+    assert period.start == timeless.datetime(2020, 1, 1)
+    assert period.end == timeless.datetime(2020, 1, 3)
+    assert isinstance(array, timeless.datetime_array)
+    assert array.zone == "Asia/Tokyo"
+    assert list(array) == [
+        timeless.parse(string, zone="Asia/Tokyo") for string in strings
+    ]
+
+
+def test_parse_many_errors():
+    with pytest.raises(ValueError):
+        timeless.parse_many(["2020-01-01"], output="dict")
+
+    with pytest.raises(ValueError):
+        timeless.parse_many(["2020-01-01", "not a date"])
+
+    with pytest.raises(ValueError):
+        timeless.parse_many(["2020-01-01"], format="%d/%m/%Y")
+
+    with pytest.raises(TypeError):
+        timeless.parse_many(["2020-01-01", "2020-01-01"], output="period")
+
+
+def test_parse_many_workers():
+    strings = [
+        f"{day:02d}/01/2020 {hour:02d}:30" for day in range(1, 32) for hour in range(24)
+    ]
+
+    parsed = timeless.parse_many(strings, workers=2, chunk_size=100)
+
+    assert parsed == timeless.parse_many(strings)
+    assert len(parsed) == 31 * 24
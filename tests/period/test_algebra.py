@@ -0,0 +1,80 @@
+import pytest
+import timeless
+
+
+FLAVOURS = [timeless.period, timeless.lazy_period, timeless.compact_period]
+
+
+@pytest.mark.parametrize("flavour", FLAVOURS)
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        (
+            ("1975-01-01", "1975-01-03", "hours", 4),
+            ("1975-01-01 02", "1975-01-05", "hours", 6),
+        ),
+        (
+            ("1975-01-01", "1975-01-03", "hours", 2),
+            ("1975-01-01 01", "1975-01-05", "hours", 2),
+        ),
+        (
+            ("1975-01-01", "1975-01-03", "hours", 1),
+            ("1975-01-02", "1975-01-05", "hours", 1),
+        ),
+        (
+            ("1975-01-01", "1975-01-03", "hours", 1),
+            ("1975-01-01 10", "1975-01-01 20", "hours", 1),
+        ),
+        (
+            ("1975-01-01", "1975-01-03", "hours", 1),
+            ("1975-01-05", "1975-01-06", "hours", 1),
+        ),
+        (
+            ("1975-01-31", "1976-01-01", "months", 1),
+            ("1975-01-01", "1976-01-01", "days", 1),
+        ),
+    ],
+)
+def test_set_algebra_matches_sets(flavour, first, second):
+    a = flavour(*first)
+    b = timeless.period(*second)
+
+    assert list(a.intersection(b)) == sorted(set(a) & set(b))
+    assert list(a.union(b)) == sorted(set(a) | set(b))
+    assert list(a.difference(b)) == sorted(set(a) - set(b))
+
+
+def test_intersection_of_regular_periods_is_arithmetic():
+    a = timeless.lazy_period("1900-01-01", "2100-01-01", freq="seconds", step=6)
+    b = timeless.lazy_period(
+        "1950-01-01 00:00:04", "2200-01-01", freq="seconds", step=10
+    )
+    common = a.intersection(b)
+
+    assert isinstance(common, timeless.lazy_period)
+    assert common.step == 30
+    assert common.start == timeless.datetime(1950, 1, 1, 0, 0, 24)
+    assert common.end == timeless.datetime(2099, 12, 31, 23, 59, 54)
+
+
+def test_irregular_period_algebra():
+    a = timeless.period("1975-01-01", "1975-01-05")
+    a.append(timeless.datetime(1975, 1, 10, 12))
+    b = timeless.period("1975-01-04", "1975-01-12", freq="hours", step=12)
+
+    assert a.intersection(b) == [
+        timeless.datetime(1975, 1, 4),
+        timeless.datetime(1975, 1, 5),
+        timeless.datetime(1975, 1, 10, 12),
+    ]
+    assert timeless.datetime(1975, 1, 10, 12) not in a.difference(b)
+
+
+def test_empty_results():
+    a = timeless.period("1975-01-01", "1975-01-05")
+    b = timeless.period("1975-02-01", "1975-02-05")
+
+    assert not a.overlaps(b)
+    assert len(a.intersection(b)) == 0
+    assert a.difference(b) == a
+    assert len(a.difference(a)) == 0
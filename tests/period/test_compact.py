@@ -0,0 +1,103 @@
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+import timeless
+
+
+@pytest.mark.parametrize(
+    "start, end, freq, step",
+    [
+        ("1975-01-01", "1975-03-01", "days", 1),
+        ("1975-01-01", "1975-01-03", "hours", 7),
+        ("1975-01-31", "1977-03-01", "months", 1),
+        ("1976-02-29", "1986-03-01", "years", 1),
+    ],
+)
+def test_compact_period_matches_period(start, end, freq, step):
+    eager = timeless.period(start, end, freq, step)
+    compact = timeless.compact_period(start, end, freq, step)
+
+    assert len(compact) == len(eager)
+    assert list(compact) == list(eager)
+    assert compact == eager
+    assert compact.start == eager.start
+    assert compact.end == eager.end
+
+
+def test_compact_period_storage():
+    compact = timeless.compact_period("1975-01-01", "1975-01-02", freq="minutes")
+
+    assert len(compact.values) == 1441
+    assert compact.values[0] == 157766400000000
+    assert compact.values[-1] - compact.values[0] == 86400 * 1_000_000
+    assert compact.zone == "UTC"
+
+
+def test_compact_period_timezone():
+    compact = timeless.compact_period(
+        timeless.datetime(1975, 1, 1, zone="America/Sao_Paulo"),
+        timeless.datetime(1975, 1, 2, zone="America/Sao_Paulo"),
+        freq="hours",
+    )
+
+    assert compact[0] == timeless.datetime(1975, 1, 1, zone="America/Sao_Paulo")
+    assert compact[0].zone == "America/Sao_Paulo"
+    assert compact.values[0] == 157777200000000
+
+
+def test_compact_period_access():
+    compact = timeless.compact_period("1975-01-01", "1975-01-31")
+
+    assert compact[-1] == timeless.datetime(1975, 1, 31)
+    assert timeless.datetime(1975, 1, 15) in compact
+    assert timeless.datetime(1975, 1, 15, 1) not in compact
+    assert compact.index(timeless.datetime(1975, 1, 3)) == 2
+    assert (
+        list(compact[2:10:2])
+        == list(timeless.period("1975-01-01", "1975-01-31"))[2:10:2]
+    )
+    assert compact[2:10:2].step == 2
+
+
+@pytest.mark.parametrize(
+    "freq, step, length",
+    [("hours", 1, 5), ("minutes", 1, 241), ("minutes", 45, 7), ("hours", 2, 4)],
+)
+def test_compact_period_daylight_saving_gap(freq, step, length):
+    start = timeless.datetime(2021, 3, 14, zone="America/New_York")
+    end = timeless.datetime(2021, 3, 14, 5, zone="America/New_York")
+
+    compact = timeless.compact_period(start, end, freq, step)
+    values = list(compact.values)
+
+    assert len(compact) == length
+    assert values == sorted(set(values))
+    assert len({item.isoformat() for item in compact}) == length
+    assert compact.index(compact[-1]) == length - 1
+    assert timeless.datetime(2021, 3, 14, 3, zone="America/New_York") in compact
+
+
+@pytest.mark.parametrize(
+    "zone", ["America/New_York", "Australia/Lord_Howe", "Europe/London"]
+)
+def test_epoch_conversions_match_tzinfo(numpy, zone):
+    tzinfo = ZoneInfo(zone)
+    micros = [value * 900_000_000 for value in range(1_600_000, 1_600_000 + 40_000)]
+    values = timeless.epoch.new_buffer(micros)
+
+    wall = timeless.epoch.utc_to_wall(values, tzinfo)
+    utc = timeless.epoch.wall_to_utc(values, tzinfo)
+
+    epoch = datetime(1970, 1, 1)
+    for index in range(0, len(micros), 7):
+        instant = datetime.fromtimestamp(micros[index] / 1e6, timezone.utc)
+        local = instant.astimezone(tzinfo).replace(tzinfo=None)
+        assert wall[index] == (local - epoch) // timedelta(microseconds=1)
+
+        local = (epoch + timedelta(microseconds=micros[index])).replace(tzinfo=tzinfo)
+        assert utc[index] == micros[index] - local.utcoffset() // timedelta(
+            microseconds=1
+        )
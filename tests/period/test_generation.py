@@ -0,0 +1,56 @@
+import pytest
+import timeless
+
+
+def _stepped(start, end, freq, step):
+    items = [start]
+    while start < end:
+        start = start.add(**{freq: step})
+        items.append(start)
+    return items
+
+
+@pytest.mark.parametrize(
+    "freq, step",
+    [("days", 1), ("days", 3), ("hours", 1), ("hours", 5), ("minutes", 45)],
+)
+@pytest.mark.parametrize("zone", ["UTC", "America/Sao_Paulo"])
+def test_fixed_unit_generation_matches_add(freq, step, zone):
+    start = timeless.datetime(1999, 10, 1, 13, zone=zone)
+    end = timeless.datetime(1999, 10, 5, zone=zone)
+
+    assert list(timeless.period(start, end, freq, step)) == _stepped(
+        start, end, freq, step
+    )
+
+
+def test_weeks_generation():
+    period = timeless.period("1975-01-01", "1975-02-01", freq="weeks")
+
+    assert len(period) == 6
+    assert period.end == timeless.datetime(1975, 2, 5)
+
+
+def test_unknown_freq():
+    with pytest.raises(ValueError):
+        timeless.period("1975-01-01", "1975-02-01", freq="fortnights")
+
+
+@pytest.mark.parametrize(
+    "start, end, freq, step",
+    [
+        ((1975, 1, 31, 10), (1979, 3, 1), "months", 1),
+        ((1975, 1, 30), (1985, 3, 1), "months", 7),
+        ((1975, 3, 31), (1976, 3, 1), "months", 2),
+        ((1976, 2, 29), (2010, 3, 1), "years", 1),
+        ((1976, 2, 29), (2410, 3, 1), "years", 4),
+    ],
+)
+def test_calendar_generation_matches_add(numpy, start, end, freq, step):
+    start = timeless.datetime(*start)
+    end = timeless.datetime(*end)
+    expected = _stepped(start, end, freq, step)
+
+    assert list(timeless.period(start, end, freq, step)) == expected
+    assert list(timeless.lazy_period(start, end, freq, step)) == expected
+    assert list(timeless.compact_period(start, end, freq, step)) == expected
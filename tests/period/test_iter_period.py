@@ -0,0 +1,49 @@
+import types
+
+import pytest
+import timeless
+
+
+@pytest.mark.parametrize(
+    "start, end, freq, step",
+    [
+        ("1975-01-01", "1975-03-01", "days", 1),
+        ("1975-01-01", "1975-01-10", "days", 4),
+        ("1975-01-01 01:09", "1975-01-01 03:10", "minutes", 13),
+        ("1975-01-31", "1977-03-01", "months", 1),
+    ],
+)
+def test_iter_period_matches_period(start, end, freq, step):
+    walked = timeless.iter_period(start, end, freq, step)
+
+    assert isinstance(walked, types.GeneratorType)
+    assert list(walked) == list(timeless.period(start, end, freq, step))
+
+
+def test_iter_period_parse_kwargs():
+    walked = timeless.iter_period(
+        "01/02/1975", "03/02/1975", parse_kwargs={"day_first": True}
+    )
+
+    assert next(walked) == timeless.datetime(1975, 2, 1)
+    assert list(walked)[-1] == timeless.datetime(1975, 2, 3)
+
+
+def test_iter_period_is_lazy():
+    walked = timeless.iter_period("1900-01-01", "2100-01-01", freq="seconds")
+
+    assert next(walked) == timeless.datetime(1900, 1, 1)
+    assert next(walked) == timeless.datetime(1900, 1, 1, 0, 0, 1)
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ("1975-01-02", "1975-01-01"),
+        ("1975-01-01", "1975-01-02", "fortnights"),
+        ("1975-01-01", "1975-01-02", "days", 0),
+    ],
+)
+def test_iter_period_invalid_arguments(args):
+    with pytest.raises(ValueError):
+        timeless.iter_period(*args)
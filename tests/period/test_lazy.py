@@ -0,0 +1,86 @@
+import pytest
+import timeless
+
+
+@pytest.mark.parametrize(
+    "start, end, freq, step",
+    [
+        ("1975-01-01", "1975-03-01", "days", 1),
+        ("1975-01-01", "1975-01-10", "days", 4),
+        ("1975-01-01", "1975-01-03", "hours", 7),
+        ("1975-01-01 01:09", "1975-01-01 03:10", "minutes", 13),
+        ("1975-01-31", "1977-03-01", "months", 1),
+        ("1975-01-31", "1977-03-01", "months", 5),
+        ("1976-02-29", "1986-03-01", "years", 1),
+        ("2000-01-31", "2400-01-01", "years", 1),
+        ("1999-08-30", "2100-01-01", "months", 7),
+        ("1975-01-01", "1975-01-01", "days", 1),
+    ],
+)
+def test_lazy_period_matches_period(start, end, freq, step):
+    eager = timeless.period(start, end, freq, step)
+    lazy = timeless.lazy_period(start, end, freq, step)
+
+    assert len(lazy) == len(eager)
+    assert list(lazy) == list(eager)
+    assert [lazy[i] for i in range(len(lazy))] == list(eager)
+    assert lazy.start == eager.start
+    assert lazy.end == eager.end
+
+
+def test_lazy_period_negative_index():
+    lazy = timeless.lazy_period("1975-01-01", "1975-12-31")
+
+    assert lazy[-1] == timeless.datetime(1975, 12, 31)
+    assert lazy[-365] == timeless.datetime(1975, 1, 1)
+
+    with pytest.raises(IndexError):
+        lazy[-366]
+
+
+def test_lazy_period_contains_and_index():
+    lazy = timeless.lazy_period("1975-01-01", "1975-01-02", freq="hours", step=2)
+
+    assert timeless.datetime(1975, 1, 1, 4) in lazy
+    assert timeless.datetime(1975, 1, 1, 5) not in lazy
+    assert timeless.datetime(1975, 1, 3) not in lazy
+    assert lazy.index(timeless.datetime(1975, 1, 1, 4)) == 2
+
+    with pytest.raises(ValueError):
+        lazy.index(timeless.datetime(1975, 1, 1, 5))
+
+
+@pytest.mark.parametrize("position", [0, 100, 1500, -10])
+def test_lazy_period_index_other_timezone(position):
+    lazy = timeless.lazy_period(
+        timeless.datetime(2022, 3, 12, zone="America/New_York"),
+        timeless.datetime(2022, 3, 14, zone="America/New_York"),
+        freq="minutes",
+    )
+    item = lazy[position].astimezone(timeless.datetime(2022, 1, 1).tzinfo)
+
+    assert item in lazy
+    assert lazy.index(item) == range(len(lazy))[position]
+    assert item in timeless.period(lazy.start, lazy.end, freq="minutes")
+
+
+def test_lazy_period_slice():
+    lazy = timeless.lazy_period("1975-01-01", "1975-01-31")
+    sliced = lazy[2:10:2]
+
+    assert isinstance(sliced, timeless.lazy_period)
+    assert list(sliced) == list(lazy)[2:10:2]
+    assert list(lazy[::-1]) == list(reversed(lazy))
+
+
+def test_lazy_period_is_not_materialized():
+    lazy = timeless.lazy_period("1900-01-01", "2100-01-01", freq="seconds")
+
+    assert len(lazy) == 6311433601
+    assert lazy[-1] == timeless.datetime(2100, 1, 1)
+    assert timeless.datetime(2000, 6, 15, 12, 30, 1) in lazy
+
+
+def test_lazy_period_invalid_step():
+    with pytest.raises(ValueError):
+        timeless.lazy_period("1975-01-01", "1975-01-31", step=0)
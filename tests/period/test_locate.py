@@ -0,0 +1,77 @@
+import bisect
+import random
+
+import pytest
+import timeless
+
+
+FLAVOURS = [timeless.period, timeless.lazy_period, timeless.compact_period]
+
+
+def _probes(start, end):
+    span = (end - start).total_seconds()
+    rng = random.Random(0)
+    return [start.add(seconds=rng.uniform(-0.1, 1.1) * span) for _ in range(50)] + [
+        start,
+        end,
+    ]
+
+
+@pytest.mark.parametrize("flavour", FLAVOURS)
+@pytest.mark.parametrize(
+    "start, end, freq, step",
+    [
+        ("2020-01-01", "2020-03-01", "days", 1),
+        ("2020-01-01 00:10", "2020-01-03 00:00", "minutes", 7),
+        ("2019-01-31", "2021-03-01", "months", 1),
+        ("2000-02-29", "2010-01-01", "years", 1),
+    ],
+)
+def test_locate_matches_bisect(flavour, start, end, freq, step):
+    obj = flavour(start, end, freq, step)
+    items = list(obj)
+
+    for probe in _probes(obj.start, obj.end):
+        assert obj.locate(probe) == bisect.bisect_left(items, probe)
+        assert obj.locate(probe, side="right") == bisect.bisect_right(items, probe)
+
+        nearest = obj.locate(probe, side="nearest")
+        assert abs(items[nearest] - probe) == min(abs(item - probe) for item in items)
+
+
+def test_locate_irregular_period():
+    obj = timeless.period("2020-01-01", "2020-01-05")
+    obj.insert(0, timeless.datetime(2020, 1, 10))
+    obj.append(timeless.datetime(2019, 12, 1))
+
+    assert obj.locate(timeless.datetime(2019, 12, 2)) == 1
+    assert obj.locate(timeless.datetime(2020, 1, 3), side="right") == 4
+    assert obj.locate(timeless.datetime(2020, 1, 9), side="nearest") == 0
+    assert obj.locate(timeless.datetime(2019, 1, 1), side="nearest") == 6
+
+    obj.remove(timeless.datetime(2020, 1, 10))
+    assert obj.locate(timeless.datetime(2020, 1, 9), side="nearest") == 4
+
+
+def test_locate_other_timezone():
+    obj = timeless.period("2020-01-01", "2020-01-02", freq="hours")
+    probe = timeless.datetime(2020, 1, 1, 2, 30, zone="America/Sao_Paulo")
+
+    assert obj.locate(probe, side="right") - 1 == 5
+
+
+def test_locate_invalid_side():
+    with pytest.raises(ValueError):
+        timeless.period("2020-01-01", "2020-01-02").locate(
+            timeless.datetime(2020, 1, 1), side="middle"
+        )
+
+
+def test_index_regular_period():
+    obj = timeless.period("2020-01-01", "2021-01-01")
+
+    assert obj.index(timeless.datetime(2020, 3, 1)) == 60
+    with pytest.raises(ValueError):
+        obj.index(timeless.datetime(2020, 3, 1), 61)
+    with pytest.raises(ValueError):
+        obj.index(timeless.datetime(2020, 3, 1, 1))
@@ -0,0 +1,62 @@
+import copy
+
+import pytest
+import timeless
+
+
+def test_period_membership():
+    period = timeless.period("1975-01-01", "1975-01-31")
+
+    assert timeless.datetime(1975, 1, 15) in period
+    assert timeless.datetime(1975, 1, 15, 1) not in period
+    assert timeless.datetime(1975, 1, 15, zone="America/Sao_Paulo") not in period
+
+
+def test_period_rejects_duplicates():
+    period = timeless.period("1975-01-01", "1975-01-31")
+
+    with pytest.raises(TypeError):
+        period.append(timeless.datetime(1975, 1, 15))
+
+    with pytest.raises(TypeError):
+        period.insert(0, timeless.datetime(1975, 1, 15))
+
+    with pytest.raises(TypeError):
+        period.extend([timeless.datetime(1975, 2, 15), timeless.datetime(1975, 2, 15)])
+
+    with pytest.raises(ValueError):
+        period.append("1975-03-01")
+
+
+def test_period_bounds_follow_mutations():
+    period = timeless.period("1975-01-02", "1975-01-05")
+
+    period.insert(2, timeless.datetime(1975, 1, 1))
+    assert period.start == timeless.datetime(1975, 1, 1)
+
+    period.append(timeless.datetime(1975, 1, 10))
+    assert period.end == timeless.datetime(1975, 1, 10)
+
+    period.remove(timeless.datetime(1975, 1, 1))
+    assert period.start == timeless.datetime(1975, 1, 2)
+    assert timeless.datetime(1975, 1, 1) not in period
+
+    period.pop()
+    assert period.end == timeless.datetime(1975, 1, 5)
+
+    del period[:2]
+    assert period.start == timeless.datetime(1975, 1, 4)
+
+    period[0] = timeless.datetime(1975, 1, 3)
+    assert period.start == timeless.datetime(1975, 1, 3)
+    assert timeless.datetime(1975, 1, 4) not in period
+
+
+def test_period_copy_keeps_index():
+    period = timeless.period("1975-01-01", "1975-01-31")
+    other = copy.copy(period)
+    other.append(timeless.datetime(1975, 2, 15))
+
+    assert other == period + [timeless.datetime(1975, 2, 15)]
+    assert timeless.datetime(1975, 2, 15) in other
+    assert timeless.datetime(1975, 2, 15) not in period
@@ -0,0 +1,76 @@
+import pytest
+import timeless
+
+
+@pytest.mark.parametrize(
+    "start, end, new_start, new_end, freq, step",
+    [
+        ("2020-01-01", "2020-01-10", "2020-01-04", "2020-01-20", "days", 1),
+        (
+            "2020-01-01 00:00",
+            "2020-01-02",
+            "2020-01-01 12:01",
+            "2020-01-02 06:30",
+            "minutes",
+            7,
+        ),
+        ("2019-01-31", "2019-06-01", "2019-03-01", "2020-04-01", "months", 1),
+    ],
+)
+def test_rolling_window_matches_new_period(start, end, new_start, new_end, freq, step):
+    obj = timeless.period(start, end, freq, step)
+    expected = [
+        item
+        for item in timeless.period(start, new_end, freq, step)
+        if item >= timeless.parse(new_start)
+    ]
+
+    obj.extend_to(new_end)
+    obj.trim_before(new_start)
+
+    assert list(obj) == expected
+    assert obj.start == expected[0]
+    assert obj.end == expected[-1]
+    assert all(item in obj for item in expected)
+    assert timeless.parse(start) not in obj
+    assert obj.locate(expected[5]) == 5
+
+
+def test_extend_to_earlier_end_is_noop():
+    obj = timeless.period("2020-01-01", "2020-01-10")
+
+    obj.extend_to("2020-01-05")
+
+    assert len(obj) == 10
+
+
+def test_extend_to_empty_period():
+    obj = timeless.period("2020-01-01", "2020-01-10")
+    obj.clear()
+
+    with pytest.raises(ValueError):
+        obj.extend_to("2020-01-20")
+
+
+def test_trim_before_irregular_period():
+    obj = timeless.period("2020-01-01", "2020-01-05")
+    obj.insert(0, timeless.datetime(2020, 1, 10))
+
+    obj.trim_before("2020-01-04")
+
+    assert list(obj) == [
+        timeless.datetime(2020, 1, 10),
+        timeless.datetime(2020, 1, 4),
+        timeless.datetime(2020, 1, 5),
+    ]
+    assert obj.start == timeless.datetime(2020, 1, 4)
+    assert timeless.datetime(2020, 1, 1) not in obj
+
+
+def test_trim_before_everything():
+    obj = timeless.period("2020-01-01", "2020-01-05")
+
+    obj.trim_before("2021-01-01")
+
+    assert len(obj) == 0
+    assert obj.start is None and obj.end is None
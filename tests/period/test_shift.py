@@ -66,3 +66,67 @@ def test_shift_seconds(offset_value, expected_result):
     ).shift(seconds=offset_value)
     assert obj.start.second == expected_result[0]
     assert obj.end.second == expected_result[1]
+
+
+SHIFTS = [
+    {"days": 3},
+    {"hours": -5, "minutes": 30},
+    {"months": 1},
+    {"months": -13, "days": 2},
+    {"years": 1, "hours": 1},
+]
+
+
+@pytest.mark.parametrize("shift", SHIFTS)
+@pytest.mark.parametrize(
+    "start, end, freq, step, zone",
+    [
+        ("2020-01-29", "2020-03-05", "days", 1, "UTC"),
+        ("2020-10-30 20:00", "2020-11-02 02:00", "hours", 5, "America/Sao_Paulo"),
+        ("2019-01-31", "2021-03-01", "months", 1, "UTC"),
+        ("2019-01-15", "2024-03-01", "years", 1, "UTC"),
+    ],
+)
+def test_shift_matches_add(numpy, shift, start, end, freq, step, zone):
+    kwargs = {"parse_kwargs": {"zone": zone}}
+    base = timeless.period(start, end, freq, step, **kwargs)
+    expected = list(dict.fromkeys(item.add(**shift) for item in base))
+
+    for flavour in (timeless.period, timeless.lazy_period):
+        shifted = flavour(start, end, freq, step, **kwargs).shift(**shift)
+        assert list(shifted) == expected
+        assert shifted.start == min(expected)
+        assert shifted.end == max(expected)
+
+    if zone == "UTC":
+        shifted = timeless.compact_period(start, end, freq, step, **kwargs).shift(
+            **shift
+        )
+        assert list(shifted) == expected
+
+
+def test_shift_keeps_irregular_elements():
+    obj = timeless.period("2020-01-01", "2020-01-03")
+    obj.append(timeless.datetime(2020, 2, 1))
+
+    shifted = obj.shift(days=1)
+
+    assert shifted[-1] == timeless.datetime(2020, 2, 2)
+    assert shifted.end == timeless.datetime(2020, 2, 2)
+    assert len(shifted) == 4
+
+
+def test_shift_clamped_days_are_kept_once():
+    obj = timeless.period("2021-01-29", "2021-02-01").shift(months=1)
+
+    assert list(obj) == [timeless.datetime(2021, 2, 28), timeless.datetime(2021, 3, 1)]
+
+
+def test_shift_lazy_period_stays_lazy():
+    obj = timeless.lazy_period("1900-01-01", "2100-01-01", freq="hours")
+
+    shifted = obj.shift(days=1)
+
+    assert isinstance(shifted, timeless.lazy_period)
+    assert len(shifted) == len(obj)
+    assert shifted[-1] == obj[-1].add(days=1)
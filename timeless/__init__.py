@@ -1,5 +1,12 @@
 """Timeless - a datetime toolkit for people in a hurry."""
 
+from timeless.clock import SYSTEM_CLOCK as system_clock
+from timeless.clock import Clock as clock
+from timeless.clock import CoarseClock as coarse_clock
+from timeless.clock import FixedClock as fixed_clock
+from timeless.clock import get_clock
+from timeless.clock import set_clock
+from timeless.clock import use_clock
 from timeless.converters.datetime_converter import from_datetime
 from timeless.converters.datetime_converter import to_datetime
 from timeless.datetime import Datetime as datetime
@@ -8,6 +15,9 @@ from timeless.datetime import get_first_weekday_in_month
 from timeless.datetime import now
 from timeless.datetime import parse
 from timeless.datetime import today
+from timeless.datetime_array import DatetimeArray as datetime_array
+from timeless.formatting import Formatter as formatter
+from timeless.formatting import format_many
 from timeless.helpers import days_to_hours
 from timeless.helpers import days_to_minutes
 from timeless.helpers import days_to_seconds
@@ -20,7 +30,11 @@ from timeless.helpers import minutes_to_seconds
 from timeless.helpers import seconds_to_days
 from timeless.helpers import seconds_to_hours
 from timeless.helpers import seconds_to_minutes
+from timeless.parsing import parse_many
+from timeless.period import CompactPeriod as compact_period
+from timeless.period import LazyPeriod as lazy_period
 from timeless.period import Period as period
+from timeless.period import iter_period
 
 
 try:
@@ -30,6 +44,8 @@ except ImportError:
 else:
     from timeless.converters.pandas_converter import from_pd_datetimeindex
     from timeless.converters.pandas_converter import from_pd_timestamp
+    from timeless.converters.pandas_converter import to_pd_datetimeindex
+    from timeless.converters.pandas_converter import to_pd_series
     from timeless.converters.pandas_converter import to_pd_timestamp
 
 try:
@@ -38,7 +54,17 @@ except ImportError:
     pass
 else:
     from timeless.converters.numpy_converter import from_np_datetime64
+    from timeless.converters.numpy_converter import from_np_datetime64_array
     from timeless.converters.numpy_converter import to_np_datetime64
+    from timeless.converters.numpy_converter import to_np_datetime64_array
+
+try:
+    import pyarrow  # type:ignore # noqa
+except ImportError:
+    pass
+else:
+    from timeless.converters.arrow_converter import from_pa_timestamp_array
+    from timeless.converters.arrow_converter import to_pa_timestamp_array
 
 
 # module level doc-string
@@ -53,11 +79,25 @@ This package is a work in progress and it was created as a study object.
 
 __all__ = [
     "datetime",
+    "datetime_array",
     "period",
+    "lazy_period",
+    "compact_period",
+    "iter_period",
     "get_first_weekday_in_month",
     "now",
     "today",
+    "clock",
+    "system_clock",
+    "coarse_clock",
+    "fixed_clock",
+    "get_clock",
+    "set_clock",
+    "use_clock",
     "parse",
+    "parse_many",
+    "format_many",
+    "formatter",
     "weekdays",
     "seconds_to_minutes",
     "seconds_to_hours",
@@ -75,7 +115,13 @@ __all__ = [
     "from_datetime",
     "from_np_datetime64",
     "to_np_datetime64",
+    "from_np_datetime64_array",
+    "to_np_datetime64_array",
     "from_pd_datetimeindex",
     "from_pd_timestamp",
     "to_pd_timestamp",
+    "to_pd_datetimeindex",
+    "to_pd_series",
+    "from_pa_timestamp_array",
+    "to_pa_timestamp_array",
 ]
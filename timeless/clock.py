@@ -0,0 +1,218 @@
+"""
+Clocks read by `now`, `today`, `is_future` and `is_past`.
+
+The system clock is used by default. A coarse clock snapshots the time once per tick
+(advanced by a monotonic anchor) for hot loops, and a fixed clock pins "now" to one
+instant, so tests and batch jobs see a single consistent time.
+"""
+
+import time
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime as _datetime
+from datetime import timedelta as _timedelta
+from datetime import timezone as _timezone
+from datetime import tzinfo as _tzinfo
+from typing import Dict
+from typing import Iterator
+from typing import Optional
+from typing import Tuple
+
+
+_UTC_EPOCH = _datetime(1970, 1, 1, tzinfo=_timezone.utc)
+
+_ONE_MICROSECOND = _timedelta(microseconds=1)
+
+
+def _from_micros(micros: int, tzinfo: Optional[_tzinfo]) -> _datetime:
+    """Build the datetime of an instant, in microseconds since the UNIX epoch."""
+    seconds, microsecond = divmod(micros, 1_000_000)
+    return _datetime.fromtimestamp(seconds, tzinfo).replace(microsecond=microsecond)
+
+
+class Clock:
+    """System clock: every read asks the operating system for the time."""
+
+    def micros(self) -> int:
+        """Get the current instant, in microseconds since the UNIX epoch."""
+        return time.time_ns() // 1000
+
+    def now(self, tzinfo: Optional[_tzinfo] = None) -> _datetime:
+        """
+        Get the current date and time.
+
+        Parameters
+        ----------
+        tzinfo : Optional[tzinfo], optional
+            Timezone of the result, by default None (naive local time)
+
+        Returns
+        -------
+        datetime
+            Current date and time.
+        """
+        return _from_micros(self.micros(), tzinfo)
+
+    def __repr__(self) -> str:
+        """Represent the clock by its class name."""
+        return f"{self.__class__.__name__}()"
+
+
+class CoarseClock(Clock):
+    """
+    Clock that only moves once per tick.
+
+    The wall time is read once, when the clock is created, and then advanced with
+    the monotonic clock, rounded down to the tick; so reads are cheap, never go
+    backwards, and ignore later system clock adjustments. Results are cached per
+    timezone until the next tick.
+    """
+
+    def __init__(self, tick: float = 0.001):
+        """
+        Start a coarse clock.
+
+        Parameters
+        ----------
+        tick : float, optional
+            Resolution in seconds, by default 0.001 (1 ms)
+
+        Raises
+        ------
+        ValueError
+            Tick not positive.
+        """
+        if tick <= 0:
+            raise ValueError("tick must be positive")
+
+        self.tick = tick
+        self._tick_ns = max(1, round(tick * 1e9))
+        self._anchor_wall = time.time_ns()
+        self._anchor_monotonic = time.monotonic_ns()
+
+        # replaced as a whole, so concurrent readers never see a stale cache
+        self._snapshot: Tuple[int, Dict[Optional[_tzinfo], _datetime]] = (-1, {})
+
+    def _ticks(self) -> int:
+        """Count the ticks elapsed since the clock was created."""
+        return (time.monotonic_ns() - self._anchor_monotonic) // self._tick_ns
+
+    def _to_micros(self, ticks: int) -> int:
+        """Get the instant of a tick, in microseconds since the UNIX epoch."""
+        return (self._anchor_wall + ticks * self._tick_ns) // 1000
+
+    def micros(self) -> int:
+        """Get the current instant (at the last tick), in microseconds."""
+        return self._to_micros(self._ticks())
+
+    def now(self, tzinfo: Optional[_tzinfo] = None) -> _datetime:
+        """Get the current date and time (at the last tick)."""
+        ticks = self._ticks()
+        snapshot_ticks, cache = self._snapshot
+        if snapshot_ticks != ticks:
+            cache = {}
+            self._snapshot = (ticks, cache)
+
+        dt = cache.get(tzinfo)
+        if dt is None:
+            dt = cache[tzinfo] = _from_micros(self._to_micros(ticks), tzinfo)
+
+        return dt
+
+    def __repr__(self) -> str:
+        """Represent the clock by its tick."""
+        return f"{self.__class__.__name__}(tick={self.tick!r})"
+
+
+class FixedClock(Clock):
+    """Clock stopped at one instant."""
+
+    def __init__(self, instant: _datetime):
+        """
+        Stop a clock at an instant.
+
+        Parameters
+        ----------
+        instant : datetime
+            Instant returned by every read (naive values are taken as UTC).
+        """
+        if instant.tzinfo is None:
+            instant = instant.replace(tzinfo=_timezone.utc)
+
+        self.instant = instant
+        self._micros = (instant - _UTC_EPOCH) // _ONE_MICROSECOND
+
+    def micros(self) -> int:
+        """Get the instant of the clock, in microseconds since the UNIX epoch."""
+        return self._micros
+
+    def __repr__(self) -> str:
+        """Represent the clock by its instant."""
+        return f"{self.__class__.__name__}({self.instant!r})"
+
+
+SYSTEM_CLOCK = Clock()
+"""Default clock, reading the operating system time."""
+
+_default_clock: Clock = SYSTEM_CLOCK
+
+_clock: ContextVar[Optional[Clock]] = ContextVar("timeless_clock", default=None)
+
+
+def _check_clock(clock: Clock) -> Clock:
+    """Check a clock is a Clock instance (and not, say, the Clock class)."""
+    if not isinstance(clock, Clock):
+        raise TypeError(f"Expected a Clock instance, got {clock!r}")
+
+    return clock
+
+
+def get_clock() -> Clock:
+    """Get the clock in use: the one of the current context, or the global one."""
+    return _clock.get() or _default_clock
+
+
+def set_clock(clock: Optional[Clock] = None) -> None:
+    """
+    Set the global clock, used by every context without its own clock.
+
+    Parameters
+    ----------
+    clock : Optional[Clock], optional
+        New global clock, by default None (system clock)
+
+    Raises
+    ------
+    TypeError
+        Not a Clock instance.
+    """
+    global _default_clock
+    _default_clock = _check_clock(clock) if clock is not None else SYSTEM_CLOCK
+
+
+@contextmanager
+def use_clock(clock: Clock) -> Iterator[Clock]:
+    """
+    Use a clock in the current context (thread or task) only.
+
+    Parameters
+    ----------
+    clock : Clock
+        Clock to use inside the `with` block.
+
+    Yields
+    ------
+    Iterator[Clock]
+        The clock in use.
+
+    Raises
+    ------
+    TypeError
+        Not a Clock instance.
+    """
+    token = _clock.set(_check_clock(clock))
+    try:
+        yield clock
+    finally:
+        _clock.reset(token)
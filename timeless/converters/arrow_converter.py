@@ -0,0 +1,162 @@
+import re
+
+from datetime import timedelta as _timedelta
+from datetime import timezone as _timezone
+from datetime import tzinfo as _tzinfo
+from typing import Any
+from typing import Optional
+from typing import Sequence
+from typing import Union
+
+import pyarrow as pa  # type: ignore
+
+from timeless import epoch
+from timeless.converters.numpy_converter import _epoch_micros
+from timeless.datetime import Datetime
+from timeless.datetime_array import DatetimeArray
+from timeless.period import CompactPeriod
+from timeless.period import _epoch_values
+
+
+OUTPUTS = ("array", "period")
+"""Result types of `from_pa_timestamp_array`."""
+
+_OFFSET = re.compile(r"([+-])(\d{2}):?(\d{2})")
+
+
+def _arrow_zone(tzinfo: Optional[_tzinfo]) -> str:
+    """
+    Get the Arrow timezone string of a tzinfo.
+
+    Raises
+    ------
+    ValueError
+        Unnamed timezone with a changing offset, or an offset with seconds.
+    """
+    if tzinfo is None:
+        return "UTC"
+
+    name = getattr(tzinfo, "key", None) or getattr(tzinfo, "zone", None)
+    if name:
+        return str(name)
+
+    offset = tzinfo.utcoffset(None)
+    if offset is None or offset % _timedelta(minutes=1):
+        raise ValueError(f"Timezone not supported by Arrow: {tzinfo}")
+
+    if not offset:
+        return "UTC"
+
+    sign = "-" if offset < _timedelta() else "+"
+    minutes = abs(offset) // _timedelta(minutes=1)
+    return f"{sign}{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def _timeless_zone(zone: Optional[str]) -> Union[str, _tzinfo]:
+    """Get the timeless zone of an Arrow timezone string (UTC if naive)."""
+    if not zone:
+        return "UTC"
+
+    match = _OFFSET.fullmatch(zone)
+    if match is None:
+        return zone
+
+    sign, hours, minutes = match.groups()
+    offset = _timedelta(hours=int(hours), minutes=int(minutes))
+    return _timezone(-offset if sign == "-" else offset)
+
+
+def to_pa_timestamp_array(period: Sequence[Datetime]) -> pa.TimestampArray:
+    """
+    Create a pyarrow TimestampArray from a Period (of any kind) or a DatetimeArray.
+
+    Values are UTC epoch microseconds with the timezone set on the Arrow type. The
+    int64 buffer of CompactPeriod and DatetimeArray is shared with Arrow without
+    copying; regular periods are generated in one vectorized step.
+
+    Only avaible if pyarrow is installed.
+
+    Parameters
+    ----------
+    period : Sequence[Datetime]
+        Period, LazyPeriod, CompactPeriod or DatetimeArray.
+
+    Returns
+    -------
+    pa.TimestampArray
+        timestamp[us, tz] array.
+
+    Raises
+    ------
+    ValueError
+        Timezone without an Arrow equivalent.
+    """
+    values, tzinfo = _epoch_values(period)
+    if epoch.np is not None:
+        values = epoch.np.ascontiguousarray(values)
+
+    return pa.Array.from_buffers(
+        pa.timestamp("us", tz=_arrow_zone(tzinfo)),
+        len(values),
+        [None, pa.py_buffer(values)],
+    )
+
+
+def from_pa_timestamp_array(
+    arr: Any,
+    zone: Optional[Union[str, _tzinfo]] = None,
+    output: str = "array",
+    rounding: str = "truncate",
+) -> Any:
+    """
+    Convert a pyarrow TimestampArray (or ChunkedArray) to a timeless container.
+
+    Microsecond arrays without nulls are used without copying; other units are
+    converted like `from_np_datetime64_array` does. Naive arrays are taken as UTC,
+    and fixed offsets (such as "+05:30") become fixed offset timezones.
+
+    Only avaible if pyarrow is installed.
+
+    Parameters
+    ----------
+    arr : Any
+        pyarrow TimestampArray or ChunkedArray (chunks are combined).
+    zone : Optional[Union[str, tzinfo]], optional
+        Timezone of the result, by default None (the Arrow type timezone)
+    output : str, optional
+        "array" (DatetimeArray) or "period" (CompactPeriod), by default "array"
+    rounding : str, optional
+        "truncate" (round down) or "round" (to the nearest, ties to even) units
+        finer than microseconds, by default "truncate"
+
+    Returns
+    -------
+    Any
+        DatetimeArray or CompactPeriod.
+
+    Raises
+    ------
+    ValueError
+        Unknown output or rounding, or null values.
+    TypeError
+        Duplicate timestamps for a period output.
+    """
+    if output not in OUTPUTS:
+        raise ValueError(f"Unknown output: {output}")
+
+    if isinstance(arr, pa.ChunkedArray):
+        arr = arr.combine_chunks()
+
+    if arr.null_count:
+        raise ValueError("Null timestamps cannot be converted to Datetime")
+
+    values = _epoch_micros(arr.to_numpy(zero_copy_only=False), rounding)
+    zone = zone if zone is not None else _timeless_zone(arr.type.tz)
+
+    if output == "array":
+        return DatetimeArray.from_epoch(values, zone)
+
+    if not epoch.is_sorted(values) and len(epoch.unique(values)) != len(values):
+        raise TypeError("Period cannot have duplicate items")
+
+    return CompactPeriod.from_epoch(values, zone)
@@ -1,4 +1,6 @@
 from datetime import datetime as _datetime
+from datetime import tzinfo as _tzinfo
+from typing import Union
 
 from timeless.datetime import Datetime
 
@@ -29,7 +31,7 @@ def to_datetime(dt: Datetime) -> _datetime:
     )
 
 
-def from_datetime(dt: _datetime, zone: str = "UTC") -> Datetime:
+def from_datetime(dt: _datetime, zone: Union[str, _tzinfo] = "UTC") -> Datetime:
     """
     Convert a datetime object to a timeless.Datetime.
 
@@ -37,8 +39,8 @@ def from_datetime(dt: _datetime, zone: str = "UTC") -> Datetime:
     ----------
     dt : _datetime
         Python's default datetime object.
-    zone : Union[ZoneInfo, str], optional
-        Timezone, by default ZoneInfo("UTC")
+    zone : Union[str, tzinfo], optional
+        Timezone key or object, by default "UTC"
 
     Returns
     -------
@@ -1,9 +1,66 @@
-from datetime import datetime as _datetime
+from datetime import tzinfo as _tzinfo
+from typing import Any
+from typing import Sequence
+from typing import Union
 
 import numpy as np  # type: ignore
 
-from timeless.converters.datetime_converter import from_datetime
+from timeless import epoch
 from timeless.datetime import Datetime
+from timeless.datetime import _get_zone
+from timeless.datetime_array import DatetimeArray
+from timeless.period import _epoch_values
+
+
+ROUNDINGS = ("truncate", "round")
+"""How units finer than microseconds are converted."""
+
+_UNITS_PER_MICROSECOND = {
+    "us": 1,
+    "ns": 1_000,
+    "ps": 1_000_000,
+    "fs": 10**9,
+    "as": 10**12,
+}
+
+
+def _epoch_micros(dt: Any, rounding: str) -> Any:
+    """
+    Get datetime64 values as UTC epoch microseconds, with integer arithmetic only.
+
+    Units up to microseconds convert exactly. Finer units are truncated (rounded
+    down) or rounded to the nearest microsecond, ties to even.
+
+    Raises
+    ------
+    ValueError
+        NaT values or unknown rounding.
+    """
+    if rounding not in ROUNDINGS:
+        raise ValueError(f"Unknown rounding: {rounding}")
+
+    scalar = isinstance(dt, np.datetime64)
+    if np.isnat(dt) if scalar else np.isnat(dt).any():
+        raise ValueError("NaT cannot be converted to Datetime")
+
+    # coarser units convert exactly to microseconds, finer ones to a single unit
+    unit, count = np.datetime_data(dt.dtype)
+    if unit not in _UNITS_PER_MICROSECOND:
+        dt, unit = dt.astype("datetime64[us]"), "us"
+    elif count != 1:
+        dt = dt.astype(f"datetime64[{unit}]")
+
+    # scalar arithmetic is faster on Python integers, arrays are viewed in place
+    values = int(dt.astype(np.int64)) if scalar else dt.view(np.int64)
+    if unit == "us":
+        return values
+
+    factor = _UNITS_PER_MICROSECOND[unit]
+    micros, rest = divmod(values, factor)
+    if rounding == "round":
+        micros = micros + ((2 * rest > factor) | ((2 * rest == factor) & (micros % 2)))
+
+    return micros
 
 
 def to_np_datetime64(dt: Datetime) -> np.datetime64:
@@ -13,11 +70,9 @@ def to_np_datetime64(dt: Datetime) -> np.datetime64:
     Internally a datetime64 represents a moment in time as a value since the
     UNIX epoch (1970-01-01) - not counting leap seaconds.
 
-    Therefore, time zones are not preserved. If you pass in a time zone offset,
-    it will apply it to determine the correct UTC time. If you don't pass one,
-    it will use the local machine's time zone. Regardless of input, on output
-    it uses the local machine's time zone to project the UTC time to a local
-    time with offset.
+    Therefore, time zones are not preserved: the result is the UTC time of the
+    instance (with its full UTC offset applied, including half hour zones), in
+    microseconds.
 
     Only avaible if Numpy is installed.
 
@@ -26,22 +81,26 @@ def to_np_datetime64(dt: Datetime) -> np.datetime64:
     Parameters
     ----------
     dt : Datetime
-        Datetime or Period instance.
+        Datetime instance.
 
     Returns
     -------
     np.datetime64
         Numpy time instances.
     """
-    offset = dt.get_utc_offset() * -1
-    dt_conv = dt.set(zone="UTC").add(hours=offset).format(r"%Y-%m-%dT%H:%M:%S.%f")
-    return np.datetime64(dt_conv)
+    return np.datetime64(epoch.utc_micros(dt), "us")
 
 
-def from_np_datetime64(dt: np.datetime64, zone: str = "UTC") -> Datetime:
+def from_np_datetime64(
+    dt: np.datetime64, zone: Union[str, _tzinfo] = "UTC", rounding: str = "truncate"
+) -> Datetime:
     """
     Convert a Numpy datetime64 instance to a Timeless Datetime instance.
 
+    The datetime64 value is taken as an UTC time and converted to the given
+    timezone. Its unit is respected and the conversion only uses integers, so it
+    is exact down to microseconds.
+
     Only avaible if Numpy is installed.
 
     Run 'pip install timeless --extras converters'
@@ -50,21 +109,86 @@ def from_np_datetime64(dt: np.datetime64, zone: str = "UTC") -> Datetime:
     ----------
     dt : np.datetime64
         Numpy Datetime64 instance.
+    zone : Union[str, tzinfo], optional
+        Timezone of the result, by default "UTC"
+    rounding : str, optional
+        "truncate" (round down) or "round" (to the nearest, ties to even) units
+        finer than microseconds, by default "truncate"
 
     Returns
     -------
     Datetime
         Timeless Datetime instance.
+
+    Raises
+    ------
+    ValueError
+        NaT value or unknown rounding.
+    """
+    micros = _epoch_micros(dt, rounding)
+    return epoch.from_utc_micros(int(micros), _get_zone(zone))
+
+
+def to_np_datetime64_array(period: Sequence[Datetime]) -> np.ndarray:  # type: ignore
+    """
+    Convert a Period (of any kind) or a DatetimeArray to a Numpy datetime64 array.
+
+    Values are UTC times in microseconds, like `to_np_datetime64`, moved in a single
+    vectorized step: array backed values are used as they are and regular periods
+    are generated in one step.
+
+    Only avaible if Numpy is installed.
+
+    Run 'pip install timeless --extras converters'
+
+    Parameters
+    ----------
+    period : Sequence[Datetime]
+        Period, LazyPeriod, CompactPeriod or DatetimeArray.
+
+    Returns
+    -------
+    np.ndarray
+        datetime64[us] array.
+    """
+    values, _ = _epoch_values(period)
+    return np.asarray(values, dtype=np.int64).astype("datetime64[us]")
+
+
+def from_np_datetime64_array(
+    dt: np.ndarray,  # type: ignore
+    zone: Union[str, _tzinfo] = "UTC",
+    rounding: str = "truncate",
+) -> DatetimeArray:
+    """
+    Convert a Numpy datetime64 array to a DatetimeArray.
+
+    Values are taken as UTC times, like `from_np_datetime64`, and converted in a
+    single vectorized integer step (such as datetime64[ns] sensor data).
+
+    Only avaible if Numpy is installed.
+
+    Run 'pip install timeless --extras converters'
+
+    Parameters
+    ----------
+    dt : np.ndarray
+        Numpy datetime64 array (of any unit).
+    zone : Union[str, tzinfo], optional
+        Timezone of the result, by default "UTC"
+    rounding : str, optional
+        "truncate" (round down) or "round" (to the nearest, ties to even) units
+        finer than microseconds, by default "truncate"
+
+    Returns
+    -------
+    DatetimeArray
+        Array of the same instants.
+
+    Raises
+    ------
+    ValueError
+        NaT values or unknown rounding.
     """
-    unix_epoch = np.datetime64(0, "s")
-    one_second = np.timedelta64(1, "s")
-    seconds_since_epoch = float((dt - unix_epoch) / one_second)
-    _dt_datetime = _datetime.utcfromtimestamp(seconds_since_epoch)
-    dt_datetime = from_datetime(_dt_datetime)
-
-    if zone != "UTC":
-        dt_datetime_zone = dt_datetime.set(zone=zone)
-        offset = dt_datetime_zone.get_utc_offset()
-        dt_datetime = dt_datetime_zone.add(hours=offset)
-
-    return dt_datetime
+    micros = _epoch_micros(np.asarray(dt), rounding)
+    return DatetimeArray.from_epoch(micros.ravel(), zone)
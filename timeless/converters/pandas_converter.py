@@ -1,11 +1,12 @@
-import warnings
-
 from typing import Optional
+from typing import Sequence
 
 import pandas as pd  # type: ignore
 
+from timeless import epoch
 from timeless.datetime import Datetime
-from timeless.period import Period
+from timeless.period import CompactPeriod
+from timeless.period import _epoch_values
 
 
 try:  # Python <3.9
@@ -78,54 +79,173 @@ def parse_pandas_offset_freq(offset: str) -> Optional[str]:
     return offsets[offset]
 
 
-def from_pd_datetimeindex(dt: pd.DatetimeIndex) -> Period:  # type: ignore
+def to_pandas_offset_freq(freq: str, step: int = 1) -> str:
+    """
+    Map timeless.Datetime strings to pandas offset strings.
+
+    Reverse of `parse_pandas_offset_freq`: months and years map to month and year
+    starts, weeks to weeks ending on sunday.
+
+    Parameters
+    ----------
+    freq : str
+        Timeless frequency.
+    step : int, optional
+        Frequency multiple, by default 1
+
+    Returns
+    -------
+    str
+        Pandas offset string.
+
+    Raises
+    ------
+    ValueError
+        Unknown frequency.
+    """
+    offsets = {
+        "microseconds": "U",
+        "seconds": "S",
+        "minutes": "T",
+        "hours": "H",
+        "days": "D",
+        "weeks": "W",
+        "months": "MS",
+        "years": "AS",
+    }
+
+    if freq not in offsets:
+        raise ValueError(f"Unknown frequency: {freq}")
+
+    return f"{step}{offsets[freq]}" if step != 1 else offsets[freq]
+
+
+def to_pd_datetimeindex(period: Sequence[Datetime]) -> pd.DatetimeIndex:  # type: ignore
     """
-    Pandas DatetimeIndex to Period.
+    Create a pandas.DatetimeIndex from a Period (of any kind) or a DatetimeArray.
+
+    The index is built from an int64 epoch buffer and gets its timezone once: array
+    backed values are used as they are, regular periods are generated in one step.
+    The frequency of regular periods is carried over when pandas agrees with it.
 
     Only avaible if Pandas is installed.
 
     Run 'pip install timeless --extras converters'
+
+    Parameters
+    ----------
+    period : Sequence[Datetime]
+        Period, LazyPeriod, CompactPeriod or DatetimeArray.
+
+    Returns
+    -------
+    pd.DatetimeIndex
+        Pandas DatetimeIndex.
     """
-    freq = None
+    values, tzinfo = _epoch_values(period)
+    index = pd.DatetimeIndex(
+        epoch.np.asarray(values, dtype=epoch.np.int64) * 1000, tz="UTC"
+    )
+    if tzinfo is not None:
+        index = index.tz_convert(tzinfo)
+
+    if getattr(period, "_regular", False) and len(index) > 1:
+        freq = to_pandas_offset_freq(
+            period.freq, period.step  # type: ignore[attr-defined]
+        )
+        try:
+            index = pd.DatetimeIndex(index, freq=freq)
+        except ValueError:  # not anchored like the pandas offset
+            pass
+
+    return index
+
+
+def to_pd_series(
+    period: Sequence[Datetime], name: Optional[str] = None
+) -> pd.Series:  # type: ignore
+    """
+    Create a pandas.Series of datetimes from a Period or a DatetimeArray.
 
-    if dt.freq:
-        freq = parse_pandas_offset_freq(dt.freq.name)
+    Built like `to_pd_datetimeindex`.
 
-    if freq is None:
-        warnings.warn("No frequency found in DatetimeIndex: assuming 'days'.")
-        freq = "days"
+    Parameters
+    ----------
+    period : Sequence[Datetime]
+        Period, LazyPeriod, CompactPeriod or DatetimeArray.
+    name : Optional[str], optional
+        Series name, by default None
+
+    Returns
+    -------
+    pd.Series
+        Pandas Series with a timezone aware datetime dtype.
+    """
+    return pd.Series(to_pd_datetimeindex(period), name=name)
 
-    _start = dt.min().to_pydatetime()
-    _end = dt.max().to_pydatetime()
+
+def _index_zone(dt: pd.DatetimeIndex) -> str:  # type: ignore
+    """Get the timezone name of a DatetimeIndex (UTC if naive or unnamed)."""
+    zone = getattr(dt.tz, "zone", None) or getattr(dt.tz, "key", None)
+    if zone is None:
+        return "UTC"
 
     try:
-        _ = _start.tzinfo.zone
-    except AttributeError:
-        _start = _start.astimezone(ZoneInfo("UTC"))
-        _end = _end.astimezone(ZoneInfo("UTC"))
-
-    start = Datetime(
-        _start.year,
-        _start.month,
-        _start.day,
-        _start.hour,
-        _start.minute,
-        _start.second,
-        _start.microsecond,
-        _start.tzinfo.key,
-    )
-    end = Datetime(
-        _end.year,
-        _end.month,
-        _end.day,
-        _end.hour,
-        _end.minute,
-        _end.second,
-        _end.microsecond,
-        _end.tzinfo.key,
-    )
+        _ = ZoneInfo(zone)
+    except ZoneInfoNotFoundError:
+        return "UTC"
+
+    return str(zone)
+
+
+def from_pd_datetimeindex(dt: pd.DatetimeIndex) -> CompactPeriod:  # type: ignore
+    """
+    Pandas DatetimeIndex to CompactPeriod.
+
+    The index int64 values are converted to epoch microseconds in one vectorized
+    step (nanoseconds are truncated) and kept as they are, so irregular indexes keep
+    their timestamps. Naive indexes are taken as UTC, and indexes with a fixed offset
+    are converted to UTC.
 
-    return Period(start, end, freq)
+    Only avaible if Pandas is installed.
+
+    Run 'pip install timeless --extras converters'
+
+    Parameters
+    ----------
+    dt : pd.DatetimeIndex
+        Pandas DatetimeIndex.
+
+    Returns
+    -------
+    CompactPeriod
+        Period backed by the index values.
+
+    Raises
+    ------
+    ValueError
+        NaT values in the index.
+    TypeError
+        Duplicate timestamps in the index.
+    """
+    if dt.hasnans:
+        raise ValueError("NaT cannot be converted to Datetime")
+
+    values = dt.asi8 // 1000
+    if not epoch.is_sorted(values) and len(epoch.unique(values)) != len(values):
+        raise TypeError("Period cannot have duplicate items")
+
+    # frequency kept as metadata only, when timeless knows it
+    freq = None
+    step = 1
+    if dt.freq and dt.freq.n >= 1:
+        try:
+            freq = parse_pandas_offset_freq(dt.freq.name)
+            step = dt.freq.n
+        except ValueError:
+            pass
+
+    return CompactPeriod.from_epoch(values, _index_zone(dt), freq, step)
 
 
 def from_pd_timestamp(dt: pd.Timestamp) -> Datetime:
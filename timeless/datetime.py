@@ -1,13 +1,21 @@
 """Friendly interface for datetime manipulations."""
 
 import calendar
+import locale
+import re
 
 from dataclasses import dataclass
 from datetime import date as _date
 from datetime import datetime as _datetime
 from datetime import timedelta as _timedelta
+from datetime import tzinfo as _tzinfo
+from functools import lru_cache
+from typing import Any
+from typing import Dict
 from typing import Iterator
 from typing import Optional
+from typing import Tuple
+from typing import Union
 
 
 try:  # Python <3.9
@@ -17,6 +25,42 @@ except ImportError:
 
 from dateutil import parser
 from dateutil import relativedelta
+from timeless.clock import get_clock
+from typing_extensions import SupportsIndex
+
+
+_ZONES: Dict[str, _tzinfo] = {}
+
+
+def _get_zone(zone: Union[str, _tzinfo]) -> _tzinfo:
+    """
+    Get the shared timezone instance of a timezone key or object.
+
+    ZoneInfo instances are interned by key, so every Datetime in a timezone holds the
+    same tzinfo object, and turning a key into a timezone is a single dict lookup.
+    Other tzinfo objects are returned as they are.
+
+    Parameters
+    ----------
+    zone : Union[str, tzinfo]
+        Timezone key (such as "UTC") or object.
+
+    Returns
+    -------
+    tzinfo
+        Shared timezone instance.
+    """
+    if isinstance(zone, str):
+        try:
+            return _ZONES[zone]
+        except KeyError:
+            tzinfo = _ZONES[zone] = ZoneInfo(zone)
+            return tzinfo
+
+    if isinstance(zone, ZoneInfo) and zone.key is not None:
+        return _ZONES.setdefault(zone.key, zone)
+
+    return zone
 
 
 @dataclass
@@ -32,8 +76,77 @@ class Weekdays:
     sunday = relativedelta.SU
 
 
+_WEEKDAY_NAMES: Dict[str, Tuple[str, ...]] = {}
+"""Lower case weekday names (monday first), per LC_TIME locale."""
+
+
+def _weekday_names() -> Tuple[str, ...]:
+    """
+    Get the lower case weekday names of the current locale, monday first.
+
+    Names are read once per locale into an immutable table, without touching the
+    global `calendar` state, so lookups are safe to run from many threads.
+    """
+    key = locale.setlocale(locale.LC_TIME)
+    names = _WEEKDAY_NAMES.get(key)
+    if names is None:
+        names = _WEEKDAY_NAMES[key] = tuple(name.lower() for name in calendar.day_name)
+
+    return names
+
+
+def _weekday_index(weekday: str) -> int:
+    """Get the index (monday is 0) of a weekday name."""
+    return Weekdays.__dict__[weekday].weekday  # type: ignore[no-any-return]
+
+
+def _days_to_next(current: int, target: int) -> int:
+    """
+    Count the days from a weekday to the next given weekday, excluding itself.
+
+    Parameters
+    ----------
+    current : int
+        Current weekday index (monday is 0).
+    target : int
+        Target weekday index.
+
+    Returns
+    -------
+    int
+        Days ahead, from 1 to 7.
+    """
+    return (target - current - 1) % 7 + 1
+
+
+def _days_to_last(current: int, target: int) -> int:
+    """
+    Count the days from a weekday back to the last given weekday, excluding itself.
+
+    Parameters
+    ----------
+    current : int
+        Current weekday index (monday is 0).
+    target : int
+        Target weekday index.
+
+    Returns
+    -------
+    int
+        Days behind, from 1 to 7.
+    """
+    return (current - target - 1) % 7 + 1
+
+
 class Datetime(_datetime):
-    """Timeless datetime."""
+    """
+    Timeless datetime.
+
+    Instances have no `__dict__`: the timezone name is read from `tzinfo`, so a
+    Datetime takes the same memory as a plain aware datetime.
+    """
+
+    __slots__ = ()
 
     def __new__(
         cls,
@@ -44,57 +157,136 @@ class Datetime(_datetime):
         minute: int = 0,
         second: int = 0,
         microsecond: int = 0,
-        zone: str = "UTC",
+        zone: Union[str, _tzinfo] = "UTC",
     ) -> "Datetime":
-        """Control the instance creation."""
-        self = _datetime.__new__(
+        """
+        Create a Timeless Datetime.
+
+        Parameters
+        ----------
+        year : int
+            Year.
+        month : int
+            Month (1-12).
+        day : int
+            Day of month.
+        hour : int, optional
+            Hour, by default 0
+        minute : int, optional
+            Minute, by default 0
+        second : int, optional
+            Second, by default 0
+        microsecond : int, optional
+            Microsecond, by default 0
+        zone : Union[str, tzinfo], optional
+            Timezone key or object, by default "UTC"
+        """
+        return _datetime.__new__(
             cls,
-            year=year,
-            month=month,
-            day=day,
-            hour=hour,
-            minute=minute,
-            second=second,
-            microsecond=microsecond,
-            tzinfo=ZoneInfo(zone),
+            year,
+            month,
+            day,
+            hour,
+            minute,
+            second,
+            microsecond,
+            _get_zone(zone),
         )
 
-        return self
+    def __reduce_ex__(self, protocol: SupportsIndex) -> Any:
+        """Pickle and copy support, from the datetime state."""
+        state = _datetime.__reduce_ex__(self, protocol)[1]
+        return (_restore_datetime, (self.__class__, *state))
 
-    def __init__(
-        self,
+    @property
+    def zone(self) -> str:
+        """Timezone name (key)."""
+        return str(self.tzinfo)
+
+    @classmethod
+    def _from_fields(
+        cls,
         year: int,
         month: int,
         day: int,
-        hour: int = 0,
-        minute: int = 0,
-        second: int = 0,
-        microsecond: int = 0,
-        zone: str = "UTC",
-    ) -> None:
+        hour: int,
+        minute: int,
+        second: int,
+        microsecond: int,
+        tzinfo: Optional[_tzinfo],
+    ) -> "Datetime":
         """
-        Init a Timeless Datetime.
+        Build an instance from its fields and an already resolved timezone.
+
+        Skips the timezone lookup done by the public constructor, for internal code
+        deriving instances from existing ones.
 
         Parameters
         ----------
         year : int
-            _description_
+            Year.
         month : int
-            _description_
+            Month.
         day : int
-            _description_
-        hour : int, optional
-            _description_, by default 0
-        minute : int, optional
-            _description_, by default 0
-        second : int, optional
-            _description_, by default 0
-        microsecond : int, optional
-            _description_, by default 0
-        zone : str, optional
-            _description_, by default "UTC"
+            Day.
+        hour : int
+            Hour.
+        minute : int
+            Minute.
+        second : int
+            Second.
+        microsecond : int
+            Microsecond.
+        tzinfo : Optional[tzinfo]
+            Instance timezone.
+
+        Returns
+        -------
+        Datetime
+            New instance.
+        """
+        return _datetime.__new__(
+            cls, year, month, day, hour, minute, second, microsecond, tzinfo
+        )
+
+    @classmethod
+    def _from_naive(cls, value: _datetime, tzinfo: Optional[_tzinfo]) -> "Datetime":
+        """
+        Build an instance from a wall clock value and an already resolved timezone.
+
+        Parameters
+        ----------
+        value : _datetime
+            Wall clock value (its own tzinfo is ignored).
+        tzinfo : Optional[tzinfo]
+            Instance timezone.
+
+        Returns
+        -------
+        Datetime
+            New instance.
+        """
+        return cls._from_fields(
+            value.year,
+            value.month,
+            value.day,
+            value.hour,
+            value.minute,
+            value.second,
+            value.microsecond,
+            tzinfo,
+        )
+
+    def _shift_fixed(self, delta: _timedelta) -> "Datetime":
         """
-        self.zone = zone
+        Move the wall clock by a fixed duration, keeping the timezone.
+
+        Same result as adding a relativedelta without years and months, without
+        building one nor looking the timezone up again.
+        """
+        return self._from_naive(
+            _datetime.combine(self, self.time()) + delta, self.tzinfo
+        )
 
     def add(
         self,
@@ -114,6 +306,17 @@ class Datetime(_datetime):
         Datetime
             New datetime instance with added value.
         """
+        if not years and not months:
+            return self._shift_fixed(
+                _timedelta(
+                    days=days,
+                    hours=hours,
+                    minutes=minutes,
+                    seconds=seconds,
+                    microseconds=microseconds,
+                )
+            )
+
         other = relativedelta.relativedelta(
             years=years,
             months=months,
@@ -138,16 +341,7 @@ class Datetime(_datetime):
             + other
         )
 
-        return Datetime(
-            result.year,
-            result.month,
-            result.day,
-            result.hour,
-            result.minute,
-            result.second,
-            result.microsecond,
-            str(self.tzinfo),
-        )
+        return self._from_naive(result, self.tzinfo)
 
     def subtract(
         self,
@@ -167,6 +361,17 @@ class Datetime(_datetime):
         Datetime
             New datetime instance with the subtracted value.
         """
+        if not years and not months:
+            return self._shift_fixed(
+                -_timedelta(
+                    days=days,
+                    hours=hours,
+                    minutes=minutes,
+                    seconds=seconds,
+                    microseconds=microseconds,
+                )
+            )
+
         other = relativedelta.relativedelta(
             years=years,
             months=months,
@@ -191,16 +396,7 @@ class Datetime(_datetime):
             - other
         )
 
-        return Datetime(
-            result.year,
-            result.month,
-            result.day,
-            result.hour,
-            result.minute,
-            result.second,
-            result.microsecond,
-            str(self.tzinfo),
-        )
+        return self._from_naive(result, self.tzinfo)
 
     def __iter__(self) -> Iterator[int]:
         """
@@ -232,7 +428,7 @@ class Datetime(_datetime):
         minute: Optional[int] = None,
         second: Optional[int] = None,
         microsecond: Optional[int] = None,
-        zone: Optional[str] = "UTC",
+        zone: Optional[Union[str, _tzinfo]] = "UTC",
     ) -> "Datetime":
         """
         Override the instance values.
@@ -275,21 +471,12 @@ class Datetime(_datetime):
             second = self.second
         if microsecond is None:
             microsecond = self.microsecond
-        if zone is None:
-            # since timeless always uses UTC as default,
-            # we can safely assume that timezone is always set
-            zone = str(self.tzinfo)
+        # since timeless always uses UTC as default,
+        # we can safely assume that timezone is always set
+        tzinfo = self.tzinfo if zone is None else _get_zone(zone)
 
-        return self.__new__(
-            self.__class__,
-            year,
-            month,
-            day,
-            hour,
-            minute,
-            second,
-            microsecond,
-            zone=zone,
+        return self._from_fields(
+            year, month, day, hour, minute, second, microsecond, tzinfo
         )
 
     def set_utc(self) -> "Datetime":
@@ -309,7 +496,7 @@ class Datetime(_datetime):
         bool
             is the instance in the future (relative to now).
         """
-        return self > _datetime.now(tz=self.tzinfo)
+        return self > get_clock().now(self.tzinfo)
 
     def is_past(self) -> bool:
         """
@@ -320,7 +507,7 @@ class Datetime(_datetime):
         bool
             is the instance in the past (relative to now).
         """
-        return self < _datetime.now(tz=self.tzinfo)
+        return self < get_clock().now(self.tzinfo)
 
     def format(self, format: Optional[str] = None) -> str:
         """
@@ -343,9 +530,7 @@ class Datetime(_datetime):
 
     def set_zero(self) -> "Datetime":
         """Get rid of hour, minute, second and microsecond values."""
-        return self.set(
-            hour=0, minute=0, second=0, microsecond=0, zone=str(self.tzinfo)
-        )
+        return self.set(hour=0, minute=0, second=0, microsecond=0, zone=self.tzinfo)
 
     def diff(self, other: "Datetime") -> relativedelta.relativedelta:
         """
@@ -374,19 +559,8 @@ class Datetime(_datetime):
         Datetime
             Next closest given weekday.
         """
-        weekday_ = Weekdays.__dict__[weekday]
-        next_weekday = self + relativedelta.relativedelta(days=1, weekday=weekday_)
-
-        return self.__class__(
-            next_weekday.year,
-            next_weekday.month,
-            next_weekday.day,
-            0,
-            0,
-            0,
-            0,
-            zone=self.zone,
-        )
+        target = _weekday_index(weekday)
+        return self._shift_date(_days_to_next(self.weekday(), target))
 
     def get_last(self, weekday: str) -> "Datetime":
         """
@@ -397,18 +571,14 @@ class Datetime(_datetime):
         Datetime
             Last closest given weekday.
         """
-        weekday_ = Weekdays.__dict__[weekday](-1)
-        next_weekday = self + relativedelta.relativedelta(days=-1, weekday=weekday_)
-
-        return self.__class__(
-            next_weekday.year,
-            next_weekday.month,
-            next_weekday.day,
-            0,
-            0,
-            0,
-            0,
-            zone=self.zone,
+        target = _weekday_index(weekday)
+        return self._shift_date(-_days_to_last(self.weekday(), target))
+
+    def _shift_date(self, days: int) -> "Datetime":
+        """Move the date by whole days, at midnight and in the same timezone."""
+        date = _date.fromordinal(self.toordinal() + days)
+        return self._from_fields(
+            date.year, date.month, date.day, 0, 0, 0, 0, self.tzinfo
         )
 
     def get_weekday_name(self, week_start: Optional[str] = None) -> str:
@@ -418,19 +588,18 @@ class Datetime(_datetime):
         Parameters
         ----------
         week_start : Optional[str], optional
-            First day of the week, by default None (monday)
+            First day of the week, by default None (monday). Names do not depend on
+            it, it is only checked to be a weekday name.
 
         Returns
         -------
         str
-            [description]
+            Lower case weekday name, in the current locale.
         """
         if week_start:
-            calendar.setfirstweekday(Weekdays.__dict__[week_start])
+            _weekday_index(week_start)
 
-        numeric_weekday = self.weekday()
-        weekday_name = calendar.day_name[numeric_weekday]
-        return weekday_name.lower()
+        return _weekday_names()[self.weekday()]
 
     def get_utc_offset(self) -> int:
         """Get UTC offset in hours."""
@@ -501,7 +670,7 @@ class Datetime(_datetime):
         Datetime
             First day of the month
         """
-        return self.__class__(
+        return self._from_fields(
             self.year,
             self.month,
             1,
@@ -509,7 +678,7 @@ class Datetime(_datetime):
             self.minute,
             self.second,
             self.microsecond,
-            zone=self.zone,
+            self.tzinfo,
         )
 
     def get_month_end(self) -> "Datetime":
@@ -521,7 +690,7 @@ class Datetime(_datetime):
         Datetime
             Kast day of the month
         """
-        return self.__class__(
+        return self._from_fields(
             self.year,
             self.month,
             self.days_in_month,
@@ -529,14 +698,21 @@ class Datetime(_datetime):
             self.minute,
             self.second,
             self.microsecond,
-            zone=self.zone,
+            self.tzinfo,
         )
 
 
+def _restore_datetime(cls: type, *state: Any) -> Datetime:
+    """Rebuild a pickled or copied Datetime from the datetime state."""
+    return _datetime.__new__(cls, *state)  # type: ignore[no-any-return]
+
+
 def now(zone: str = "UTC", microseconds: bool = False) -> Datetime:
     """
     Get a DateTime instance for the current date and time.
 
+    The time is read from the clock in use (see `timeless.clock`).
+
     Parameters
     ----------
     zone : Optional[str], optional
@@ -547,14 +723,15 @@ def now(zone: str = "UTC", microseconds: bool = False) -> Datetime:
     Datetime
         Current date and time.
     """
-    dt_ = _datetime.now(tz=ZoneInfo(zone))
+    tzinfo = _get_zone(zone)
+    dt_ = get_clock().now(tzinfo)
 
     if microseconds:
         ms = dt_.microsecond
     else:
         ms = 0
 
-    dt = Datetime(
+    dt = Datetime._from_fields(
         dt_.year,
         dt_.month,
         dt_.day,
@@ -562,7 +739,7 @@ def now(zone: str = "UTC", microseconds: bool = False) -> Datetime:
         dt_.minute,
         dt_.second,
         ms,
-        zone,
+        tzinfo,
     )
 
     return dt
@@ -572,7 +749,8 @@ def today(zone: str = "UTC") -> Datetime:
     """
     Get a DateTime instance for the current date.
 
-    Hours, minutes, seconds and microseconds are set to 0.
+    Hours, minutes, seconds and microseconds are set to 0. The date is the one of
+    the clock in use (see `timeless.clock`) in the given timezone.
 
     Parameters
     ----------
@@ -584,8 +762,9 @@ def today(zone: str = "UTC") -> Datetime:
     Datetime
         Current date.
     """
-    dt = _date.today()
-    return Datetime(dt.year, dt.month, dt.day, 0, 0, 0, 0, zone)
+    tzinfo = _get_zone(zone)
+    dt = get_clock().now(tzinfo)
+    return Datetime._from_fields(dt.year, dt.month, dt.day, 0, 0, 0, 0, tzinfo)
 
 
 def get_first_weekday_in_month(
@@ -608,16 +787,85 @@ def get_first_weekday_in_month(
     Datetime
         First occourance of the given weekday at the instance month.
     """
-    instance_weekday = datetime.get_weekday_name(week_start)
+    if week_start:
+        _weekday_index(week_start)
 
-    if instance_weekday.lower() == weekday.lower():
+    current = datetime.weekday()
+    target = _weekday_index(weekday.lower())
+    if current == target:
         return datetime
-    else:
-        last_in_month = datetime.get_last(weekday)
-        if last_in_month.month != datetime.month:
-            return datetime.get_next(weekday)
-        else:
-            return last_in_month
+
+    # closest previous occurrence if still in the month, the next one otherwise
+    back = _days_to_last(current, target)
+    if back < datetime.day:
+        return datetime._shift_date(-back)
+
+    return datetime._shift_date(_days_to_next(current, target))
+
+
+_ISO_8601 = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})"
+    r"(?:[T ](\d{2})(?::(\d{2})(?::(\d{2})(?:[.,](\d+))?)?)?"
+    r"([Zz]|[+-]\d{2}(?::?\d{2})?)?)?"
+)
+"""ISO 8601 / RFC 3339 date or date and time, with an optional UTC offset."""
+
+
+def _parse_iso(string: str) -> Optional[_datetime]:
+    """
+    Parse an ISO 8601 / RFC 3339 string the way dateutil's parser would.
+
+    The UTC offset is matched but not applied: dateutil's parsed offsets have no
+    timezone name, so `parse` keeps their wall time and falls back to UTC.
+
+    Returns
+    -------
+    Optional[_datetime]
+        Naive parsed datetime, or None if the string is not in this format.
+    """
+    match = _ISO_8601.fullmatch(string)
+    if match is None:
+        return None
+
+    year, month, day, hour, minute, second, fraction, _ = match.groups()
+    try:
+        return _datetime(
+            int(year),
+            int(month),
+            int(day),
+            int(hour or 0),
+            int(minute or 0),
+            int(second or 0),
+            int(fraction[:6].ljust(6, "0")) if fraction else 0,
+        )
+    except ValueError:
+        # out of range values: let dateutil raise its own error
+        return None
+
+
+@lru_cache(maxsize=None)
+def _parser(day_first: bool, year_first: bool) -> parser.parser:
+    """Get the (shared) dateutil parser of a day_first/year_first combination."""
+    return parser.parser(parser.parserinfo(dayfirst=day_first, yearfirst=year_first))
+
+
+def _parsed_zone(parsed: _datetime, zone: Optional[str] = None) -> str:
+    """Get the timezone key of a parsed datetime (the given zone takes precedence)."""
+    return zone or parsed.tzname() or "UTC"
+
+
+def _from_parsed(parsed: _datetime, zone: Optional[str] = None) -> Datetime:
+    """Build a Datetime from the wall clock of a parsed datetime."""
+    return Datetime._from_fields(
+        parsed.year,
+        parsed.month,
+        parsed.day,
+        parsed.hour,
+        parsed.minute,
+        parsed.second,
+        parsed.microsecond,
+        _get_zone(_parsed_zone(parsed, zone)),
+    )
 
 
 def parse(
@@ -630,8 +878,9 @@ def parse(
     """
     Parse a string into a Datetime.
 
-    If no format is provided, the string is parsed using Dateutil's parser. Otherwise,
-    the string is parsed using strptime. In the latter case dateutil's parser arguments
+    If no format is provided, ISO 8601 / RFC 3339 strings are parsed by a dedicated
+    fast path and other strings using Dateutil's parser. Otherwise, the string is
+    parsed using strptime. In the latter case dateutil's parser arguments
     (nominally day_first, year_first) are ignored.
 
     The "ignoretz" parameter is not supported, since "zone" can override the timezone
@@ -660,24 +909,13 @@ def parse(
     Datetime
         Parsed datetime.
     """
+    parsed: Optional[_datetime]
     if format:
         parsed = _datetime.strptime(string, format)
     else:
-        parser_info = parser.parserinfo(dayfirst=day_first, yearfirst=year_first)
-        parsed = parser.parse(string, parser_info)
+        # day_first makes dateutil read ISO dates as year-day-month
+        parsed = None if day_first else _parse_iso(string)
+        if parsed is None:
+            parsed = _parser(day_first, year_first).parse(string)
 
-    if not zone:
-        zone = parsed.tzname()
-        if not zone:
-            zone = "UTC"
-
-    return Datetime(
-        parsed.year,
-        parsed.month,
-        parsed.day,
-        parsed.hour,
-        parsed.minute,
-        parsed.second,
-        parsed.microsecond,
-        zone,
-    )
+    return _from_parsed(parsed, zone)
@@ -0,0 +1,586 @@
+"""Batched datetime container with vectorized operations."""
+
+import calendar
+
+from array import array
+from datetime import datetime as _datetime
+from datetime import timedelta as _timedelta
+from datetime import tzinfo as _tzinfo
+from typing import Any
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Union
+
+from timeless import epoch
+from timeless.datetime import Datetime
+from timeless.datetime import _days_to_last
+from timeless.datetime import _days_to_next
+from timeless.datetime import _get_zone
+from timeless.datetime import _weekday_index
+from timeless.datetime import _weekday_names
+from timeless.formatting import get_formatter
+
+
+_MICROSECONDS_PER_HOUR = 3_600_000_000
+_MICROSECONDS_PER_MINUTE = 60_000_000
+_MICROSECONDS_PER_SECOND = 1_000_000
+
+# 1970-01-01 was a thursday
+_EPOCH_WEEKDAY = 3
+
+
+def _month_days(month_ordinals: Any) -> Any:
+    """Get the number of days of months counted from 1970-01 (Numpy only)."""
+    months = month_ordinals.astype("datetime64[M]")
+    return (
+        (months + 1).astype("datetime64[D]") - months.astype("datetime64[D]")
+    ).astype(epoch.np.int64)
+
+
+def _split(wall: Any) -> Any:
+    """Split wall clock microseconds into month ordinals, days and times (Numpy only)."""
+    days, time_of_day = epoch.np.divmod(wall, epoch.MICROSECONDS_PER_DAY)
+    dates = days.astype("datetime64[D]")
+    months = dates.astype("datetime64[M]")
+    day = (dates - months.astype("datetime64[D]")).astype(epoch.np.int64) + 1
+    return months.astype(epoch.np.int64), day, time_of_day
+
+
+def _join(month_ordinals: Any, day: Any, time_of_day: Any) -> Any:
+    """Join month ordinals, days and times into wall clock microseconds (Numpy only)."""
+    month_starts = (
+        month_ordinals.astype("datetime64[M]")
+        .astype("datetime64[D]")
+        .astype(epoch.np.int64)
+    )
+    return (month_starts + day - 1) * epoch.MICROSECONDS_PER_DAY + time_of_day
+
+
+def _to_naive(value: int) -> _datetime:
+    """Build the naive datetime of a wall clock microseconds value."""
+    return epoch.EPOCH + _timedelta(microseconds=int(value))
+
+
+def _last_day(dt: _datetime) -> int:
+    """Get the number of days in the month of a datetime."""
+    return calendar.monthrange(dt.year, dt.month)[1]
+
+
+class DatetimeArray(Sequence[Datetime]):
+    """
+    Batch of datetimes stored as int64 UTC epoch microseconds and one timezone.
+
+    Elements live in a Numpy int64 array (or an `array.array("q")` when Numpy is not
+    installed) and the Datetime API is applied to all of them at once, on the wall
+    clock of the array timezone. A Datetime is only built when an element is
+    accessed.
+
+    Wall times that do not exist in the timezone (daylight saving gaps) are stored as
+    the instant the standard library resolves them to.
+    """
+
+    def __init__(
+        self,
+        values: Iterable[_datetime] = (),
+        zone: Optional[Union[str, _tzinfo]] = None,
+    ):
+        """
+        Init a DatetimeArray.
+
+        Parameters
+        ----------
+        values : Iterable[datetime], optional
+            Aware datetimes, by default empty.
+        zone : Optional[Union[str, tzinfo]], optional
+            Array timezone, by default the timezone of the first value (or "UTC").
+            Values in other timezones are converted to it.
+        """
+        values = list(values)
+        if zone is None:
+            zone = values[0].tzinfo if values and values[0].tzinfo else "UTC"
+
+        self._values = epoch.new_buffer(epoch.utc_micros(value) for value in values)
+        self.tzinfo = _get_zone(zone)
+
+    @classmethod
+    def from_epoch(
+        cls, values: Iterable[int], zone: Union[str, _tzinfo] = "UTC"
+    ) -> "DatetimeArray":
+        """
+        Build an array straight from UTC epoch microseconds.
+
+        Parameters
+        ----------
+        values : Iterable[int]
+            Microseconds since the UNIX epoch (UTC). Numpy int64 arrays and
+            `array.array("q")` buffers are used without copying.
+        zone : Union[str, tzinfo], optional
+            Array timezone, by default "UTC"
+
+        Returns
+        -------
+        DatetimeArray
+            New array.
+        """
+        self = cls.__new__(cls)
+        self._values = epoch.new_buffer(values)
+        self.tzinfo = _get_zone(zone)
+        return self
+
+    def _from_wall(self, wall: epoch.Buffer, tzinfo: Optional[_tzinfo] = None) -> Any:
+        """Build an array from wall clock microseconds of a timezone."""
+        tzinfo = tzinfo or self.tzinfo
+        return self.from_epoch(epoch.wall_to_utc(wall, tzinfo), tzinfo)
+
+    @property
+    def values(self) -> epoch.Buffer:
+        """UTC epoch microseconds buffer holding the elements."""
+        return self._values
+
+    @property
+    def zone(self) -> str:
+        """Timezone name shared by every element."""
+        return str(self.tzinfo)
+
+    @property
+    def wall(self) -> epoch.Buffer:
+        """Wall clock epoch microseconds of the elements, in the array timezone."""
+        return epoch.utc_to_wall(self._values, self.tzinfo)
+
+    def __len__(self) -> int:
+        """Get the number of elements in the array."""
+        return len(self._values)
+
+    def __getitem__(self, index: Any) -> Any:
+        """
+        Get an element (or a slice) of the array.
+
+        Slices are arrays too, sharing the buffer when Numpy is installed.
+        """
+        if isinstance(index, slice):
+            return self.from_epoch(self._values[index], self.tzinfo)
+
+        return epoch.from_utc_micros(self._values[index], self.tzinfo)
+
+    def __iter__(self) -> Iterator[Datetime]:
+        """Iterate over the array, building one element at a time."""
+        for value in self._values:
+            yield epoch.from_utc_micros(value, self.tzinfo)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the array elements with any other sequence."""
+        if isinstance(other, DatetimeArray):
+            return len(self) == len(other) and all(
+                a == b for a, b in zip(self._values, other._values)
+            )
+
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        """Represent the array by its first and last elements."""
+        if not len(self):
+            return f"{self.__class__.__name__}([], zone={self.zone!r})"
+
+        return (
+            f"{self.__class__.__name__}({self[0]!s} ... {self[-1]!s}, "
+            f"length={len(self)}, zone={self.zone!r})"
+        )
+
+    def add(
+        self,
+        years: int = 0,
+        months: int = 0,
+        days: int = 0,
+        hours: int = 0,
+        minutes: int = 0,
+        seconds: int = 0,
+        microseconds: int = 0,
+    ) -> "DatetimeArray":
+        """
+        Add duration to every element.
+
+        Calendar months are added first (days of month are clamped to the target
+        month), then the fixed part, on the wall clock: like `Datetime.add`.
+
+        Returns
+        -------
+        DatetimeArray
+            New array with added value.
+        """
+        wall = self.wall
+        if years or months:
+            wall = epoch.add_months(wall, years * 12 + months)
+
+        delta = _timedelta(
+            days=days,
+            hours=hours,
+            minutes=minutes,
+            seconds=seconds,
+            microseconds=microseconds,
+        )
+        if delta:
+            wall = epoch.add_micros(wall, delta // epoch.ONE_MICROSECOND)
+
+        return self._from_wall(wall)  # type: ignore[no-any-return]
+
+    def subtract(
+        self,
+        years: int = 0,
+        months: int = 0,
+        days: int = 0,
+        hours: int = 0,
+        minutes: int = 0,
+        seconds: int = 0,
+        microseconds: int = 0,
+    ) -> "DatetimeArray":
+        """
+        Remove duration from every element.
+
+        Returns
+        -------
+        DatetimeArray
+            New array with the subtracted value.
+        """
+        return self.add(
+            -years, -months, -days, -hours, -minutes, -seconds, -microseconds
+        )
+
+    def set(
+        self,
+        year: Optional[int] = None,
+        month: Optional[int] = None,
+        day: Optional[int] = None,
+        hour: Optional[int] = None,
+        minute: Optional[int] = None,
+        second: Optional[int] = None,
+        microsecond: Optional[int] = None,
+        zone: Optional[Union[str, _tzinfo]] = "UTC",
+    ) -> "DatetimeArray":
+        """
+        Override the element values, like `Datetime.set`.
+
+        Parameters
+        ----------
+        year : Optional[int], optional
+            new year value, by default None
+        month : Optional[int], optional
+            new month value, by default None
+        day : Optional[int], optional
+            new day value, by default None
+        hour : Optional[int], optional
+            new hour value, by default None
+        minute : Optional[int], optional
+            new minute value, by default None
+        second : Optional[int], optional
+            new second value, by default None
+        microsecond : Optional[int], optional
+            new microsecond value, by default None
+        zone : Optional[Union[str, tzinfo]], optional
+            new timezone value (wall clock values are kept), by default "UTC"
+
+        Returns
+        -------
+        DatetimeArray
+            New array with the new values.
+
+        Raises
+        ------
+        ValueError
+            A value is out of range (such as day 31 in a 30 days month).
+        """
+        tzinfo = self.tzinfo if zone is None else _get_zone(zone)
+        fields = {
+            name: value
+            for name, value in (
+                ("year", year),
+                ("month", month),
+                ("day", day),
+                ("hour", hour),
+                ("minute", minute),
+                ("second", second),
+                ("microsecond", microsecond),
+            )
+            if value is not None
+        }
+
+        if epoch.np is None:
+            wall = array(
+                "q",
+                (
+                    epoch.wall_micros(_to_naive(value).replace(**fields))
+                    for value in self.wall
+                ),
+            )
+            return self._from_wall(wall, tzinfo)  # type: ignore[no-any-return]
+
+        # validates every value but the day, checked against each month below
+        _datetime(
+            1 if year is None else year,
+            1 if month is None else month,
+            1,
+            0 if hour is None else hour,
+            0 if minute is None else minute,
+            0 if second is None else second,
+            0 if microsecond is None else microsecond,
+        )
+
+        month_ordinals, days, time_of_day = _split(self.wall)
+        if year is not None or month is not None:
+            years, months = epoch.np.divmod(month_ordinals, 12)
+            years = years + 1970 if year is None else year
+            months = months if month is None else month - 1
+            month_ordinals = epoch.np.broadcast_to(
+                (years - 1970) * 12 + months, days.shape
+            )
+
+        if day is not None:
+            days = epoch.np.full_like(days, day)
+
+        if len(days) and (
+            epoch.np.any(days < 1) or epoch.np.any(days > _month_days(month_ordinals))
+        ):
+            raise ValueError("day is out of range for month")
+
+        if hour is not None or minute is not None or second is not None:
+            hours, rest = epoch.np.divmod(time_of_day, _MICROSECONDS_PER_HOUR)
+            minutes, rest = epoch.np.divmod(rest, _MICROSECONDS_PER_MINUTE)
+            seconds, micros = epoch.np.divmod(rest, _MICROSECONDS_PER_SECOND)
+            time_of_day = (
+                (hours if hour is None else hour) * _MICROSECONDS_PER_HOUR
+                + (minutes if minute is None else minute) * _MICROSECONDS_PER_MINUTE
+                + (seconds if second is None else second) * _MICROSECONDS_PER_SECOND
+                + micros
+            )
+
+        if microsecond is not None:
+            time_of_day = time_of_day - time_of_day % _MICROSECONDS_PER_SECOND
+            time_of_day = time_of_day + microsecond
+
+        wall = _join(month_ordinals, days, time_of_day)
+        return self._from_wall(wall, tzinfo)  # type: ignore[no-any-return]
+
+    def set_zero(self) -> "DatetimeArray":
+        """Get rid of hour, minute, second and microsecond values."""
+        wall = self.wall
+        if epoch.np is not None:
+            wall = wall - wall % epoch.MICROSECONDS_PER_DAY
+        else:
+            wall = array(
+                "q", (value - value % epoch.MICROSECONDS_PER_DAY for value in wall)
+            )
+
+        return self._from_wall(wall)  # type: ignore[no-any-return]
+
+    def get_month_start(self) -> "DatetimeArray":
+        """Get an array with every element on the first day of its month."""
+        return self.set(day=1, zone=None)
+
+    def get_month_end(self) -> "DatetimeArray":
+        """Get an array with every element on the last day of its month."""
+        if epoch.np is None:
+            naives = [_to_naive(value) for value in self.wall]
+            wall = array(
+                "q",
+                (epoch.wall_micros(dt.replace(day=_last_day(dt))) for dt in naives),
+            )
+            return self._from_wall(wall)  # type: ignore[no-any-return]
+
+        month_ordinals, _, time_of_day = _split(self.wall)
+        wall = _join(month_ordinals, _month_days(month_ordinals), time_of_day)
+        return self._from_wall(wall)  # type: ignore[no-any-return]
+
+    def is_leap(self) -> Any:
+        """
+        Check which elements are in a leap year.
+
+        Returns
+        -------
+        Any
+            Booleans, as a Numpy array (or a list without Numpy).
+        """
+        if epoch.np is None:
+            return [calendar.isleap(_to_naive(value).year) for value in self.wall]
+
+        years = _split(self.wall)[0] // 12 + 1970
+        return (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+
+    @property
+    def days_in_month(self) -> Any:
+        """
+        Get the number of days in the month of every element.
+
+        Returns
+        -------
+        Any
+            Days, as a Numpy array (or a list without Numpy).
+        """
+        if epoch.np is None:
+            return [_last_day(_to_naive(value)) for value in self.wall]
+
+        return _month_days(_split(self.wall)[0])
+
+    def get_days_in_month(self) -> Any:
+        """Equivalent function of days_in_month property."""
+        return self.days_in_month
+
+    def _weekdays(self) -> Any:
+        """Get the wall clock day counts and weekday indexes of the elements."""
+        if epoch.np is None:
+            days = [value // epoch.MICROSECONDS_PER_DAY for value in self.wall]
+            return days, [(day + _EPOCH_WEEKDAY) % 7 for day in days]
+
+        days = self.wall // epoch.MICROSECONDS_PER_DAY
+        return days, (days + _EPOCH_WEEKDAY) % 7
+
+    def _from_days(self, days: Any) -> "DatetimeArray":
+        """Build an array at midnight of wall clock day counts."""
+        if epoch.np is None:
+            wall = array("q", (day * epoch.MICROSECONDS_PER_DAY for day in days))
+        else:
+            wall = days * epoch.MICROSECONDS_PER_DAY
+
+        return self._from_wall(wall)  # type: ignore[no-any-return]
+
+    def get_next(self, weekday: str) -> "DatetimeArray":
+        """
+        Get the next instance of a given weekday, for every element.
+
+        Does't consider the current day.
+
+        Returns
+        -------
+        DatetimeArray
+            Next closest given weekdays, at midnight.
+        """
+        target = _weekday_index(weekday)
+        days, weekdays = self._weekdays()
+
+        if epoch.np is None:
+            return self._from_days(
+                day + _days_to_next(current, target)
+                for day, current in zip(days, weekdays)
+            )
+
+        return self._from_days(days + _days_to_next(weekdays, target))
+
+    def get_last(self, weekday: str) -> "DatetimeArray":
+        """
+        Get the last instance of a given weekday, for every element.
+
+        Returns
+        -------
+        DatetimeArray
+            Last closest given weekdays, at midnight.
+        """
+        target = _weekday_index(weekday)
+        days, weekdays = self._weekdays()
+
+        if epoch.np is None:
+            return self._from_days(
+                day - _days_to_last(current, target)
+                for day, current in zip(days, weekdays)
+            )
+
+        return self._from_days(days - _days_to_last(weekdays, target))
+
+    def get_first_weekday_in_month(
+        self, weekday: str, week_start: Optional[str] = None
+    ) -> "DatetimeArray":
+        """
+        Apply `get_first_weekday_in_month` to every element.
+
+        Parameters
+        ----------
+        weekday: str
+            weekday name.
+        week_start : Optional[str], optional
+            week start day, by default None (monday)
+
+        Returns
+        -------
+        DatetimeArray
+            Elements already on the weekday are kept, other ones move (at midnight)
+            to the closest previous occurrence in their month, or to the next one.
+        """
+        if week_start:
+            _weekday_index(week_start)
+
+        target = _weekday_index(weekday.lower())
+        days, weekdays = self._weekdays()
+        wall = self.wall
+
+        if epoch.np is None:
+            result = array("q")
+            for value, day, current in zip(wall, days, weekdays):
+                back = _days_to_last(current, target)
+                if current == target:
+                    result.append(value)
+                elif back < _to_naive(value).day:
+                    result.append((day - back) * epoch.MICROSECONDS_PER_DAY)
+                else:
+                    forward = _days_to_next(current, target)
+                    result.append((day + forward) * epoch.MICROSECONDS_PER_DAY)
+            return self._from_wall(result)  # type: ignore[no-any-return]
+
+        back = _days_to_last(weekdays, target)
+        moved = epoch.np.where(
+            back < _split(wall)[1], days - back, days + _days_to_next(weekdays, target)
+        )
+        wall = epoch.np.where(
+            weekdays == target, wall, moved * epoch.MICROSECONDS_PER_DAY
+        )
+        return self._from_wall(wall)  # type: ignore[no-any-return]
+
+    def get_weekday_name(self, week_start: Optional[str] = None) -> List[str]:
+        """
+        Get the weekday name of every element.
+
+        Parameters
+        ----------
+        week_start : Optional[str], optional
+            First day of the week, by default None (monday). Names do not depend on
+            it, it is accepted for parity with `Datetime.get_weekday_name`.
+
+        Returns
+        -------
+        List[str]
+            Lower case weekday names.
+        """
+        if week_start:
+            _weekday_index(week_start)
+
+        names = _weekday_names()
+        wall = self.wall
+
+        if epoch.np is None:
+            return [
+                names[(value // epoch.MICROSECONDS_PER_DAY + _EPOCH_WEEKDAY) % 7]
+                for value in wall
+            ]
+
+        weekdays = (wall // epoch.MICROSECONDS_PER_DAY + _EPOCH_WEEKDAY) % 7
+        return [names[weekday] for weekday in weekdays.tolist()]
+
+    def format(self, format: Optional[str] = None) -> List[str]:
+        """
+        Format every element as a string to isoformat or custom format.
+
+        Parameters
+        ----------
+        format : Optional[str], optional
+            Follows the same rules as the python strftime, by default None
+
+        Returns
+        -------
+        List[str]
+            Datetime formated strings.
+        """
+        return list(get_formatter(format).format_many(self))
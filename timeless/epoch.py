@@ -0,0 +1,365 @@
+"""
+Epoch microsecond helpers for array-backed timestamp storage.
+
+Timestamps are stored as int64 microseconds since the UNIX epoch (UTC), in a Numpy
+array when Numpy is installed and in an `array.array("q")` otherwise, plus one shared
+timezone. Wall clock values ("local" microseconds) are the same count taken on the
+timezone clock instead of UTC.
+"""
+
+import calendar
+
+from array import array
+from datetime import datetime as _datetime
+from datetime import timedelta as _timedelta
+from datetime import timezone as _timezone
+from datetime import tzinfo as _tzinfo
+from typing import Any
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from timeless.datetime import Datetime
+
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore
+
+EPOCH = _datetime(1970, 1, 1)
+"""UNIX epoch, as a naive (wall clock) datetime."""
+
+UTC_EPOCH = _datetime(1970, 1, 1, tzinfo=_timezone.utc)
+"""UNIX epoch, as an UTC datetime."""
+
+ONE_MICROSECOND = _timedelta(microseconds=1)
+
+MICROSECONDS_PER_DAY = 86_400_000_000
+
+_EPOCH_ORDINAL = EPOCH.toordinal()
+
+Buffer = Any
+"""Numpy int64 array or `array.array("q")`."""
+
+
+def new_buffer(values: Iterable[int] = ()) -> Buffer:
+    """
+    Create an int64 buffer, backed by Numpy when available.
+
+    Parameters
+    ----------
+    values : Iterable[int], optional
+        Initial values, by default empty.
+
+    Returns
+    -------
+    Buffer
+        Numpy int64 array or `array.array("q")`.
+    """
+    if np is not None:
+        if isinstance(values, np.ndarray):
+            return values.astype(np.int64, copy=False)
+        return np.fromiter(values, dtype=np.int64)
+
+    if isinstance(values, array) and values.typecode == "q":
+        return values
+    return array("q", values)
+
+
+def arange(start: int, step: int, count: int) -> Buffer:
+    """Create a buffer with an arithmetic progression."""
+    if np is not None:
+        return start + np.arange(count, dtype=np.int64) * step
+
+    return array("q", range(start, start + step * count, step))
+
+
+def fixed_offset(tzinfo: Optional[_tzinfo]) -> Optional[int]:
+    """
+    Get the UTC offset (in microseconds) of a timezone without daylight saving.
+
+    Returns
+    -------
+    Optional[int]
+        Offset in microseconds, or None for timezones whose offset changes.
+    """
+    offset = tzinfo.utcoffset(None) if tzinfo is not None else _timedelta()
+    if offset is None:
+        return None
+
+    return offset // ONE_MICROSECOND
+
+
+def _offset(dt: _datetime, tzinfo: Optional[_tzinfo] = None) -> int:
+    """Get the UTC offset of a wall time (in microseconds)."""
+    offset = (tzinfo or dt.tzinfo).utcoffset(dt)  # type: ignore
+    return offset // ONE_MICROSECOND if offset is not None else 0
+
+
+def wall_micros(dt: _datetime) -> int:
+    """Get the wall clock value of a datetime, in microseconds since the epoch."""
+    return (
+        ((dt.toordinal() - _EPOCH_ORDINAL) * 86400 + dt.hour * 3600)
+        + dt.minute * 60
+        + dt.second
+    ) * 1_000_000 + dt.microsecond
+
+
+def utc_micros(dt: _datetime) -> int:
+    """Get the instant of an aware datetime, in microseconds since the epoch."""
+    offset = dt.utcoffset()
+    if offset is None:
+        return wall_micros(dt)
+
+    return wall_micros(dt) - offset // ONE_MICROSECOND
+
+
+def from_utc_micros(value: int, tzinfo: Optional[_tzinfo]) -> Datetime:
+    """
+    Build a Datetime from an instant in microseconds since the epoch.
+
+    Parameters
+    ----------
+    value : int
+        Microseconds since the epoch (UTC).
+    tzinfo : Optional[tzinfo]
+        Timezone of the new instance.
+
+    Returns
+    -------
+    Datetime
+        Instance at the given instant, in the given timezone.
+    """
+    value = int(value)
+    offset = fixed_offset(tzinfo)
+
+    if offset is not None:
+        local = EPOCH + _timedelta(microseconds=value + offset)
+    else:
+        local = (UTC_EPOCH + _timedelta(microseconds=value)).astimezone(tzinfo)
+
+    return Datetime._from_naive(local, tzinfo)
+
+
+def _transitions(start: int, end: int, tzinfo: _tzinfo) -> Tuple[Any, Any]:
+    """
+    Find the UTC offset changes of a timezone between two instants (in seconds).
+
+    Offsets are read once a day, and each change is then narrowed down to the second
+    by bisection (a change undone within the same day is not seen).
+
+    Returns
+    -------
+    Tuple[Any, Any]
+        Numpy arrays of the change instants (in microseconds) and of the offsets (in
+        microseconds): before the first change, then after each change.
+    """
+
+    def offset_at(second: int) -> int:
+        return _offset((UTC_EPOCH + _timedelta(seconds=second)).astimezone(tzinfo))
+
+    instants: List[int] = []
+    offsets = [offset_at(start)]
+    for low in range(start, end, 86400):
+        high = min(low + 86400, end)
+        target = offset_at(high)
+        while offsets[-1] != target:
+            # offset_at(low) is the last offset found, offset_at(high) is not
+            a, b = low, high
+            while b - a > 1:
+                middle = (a + b) // 2
+                if offset_at(middle) == offsets[-1]:
+                    a = middle
+                else:
+                    b = middle
+
+            instants.append(b * 1_000_000)
+            offsets.append(offset_at(b))
+            low = b
+
+    return np.array(instants, dtype=np.int64), np.array(offsets, dtype=np.int64)
+
+
+def _span(values: Buffer) -> Optional[Tuple[int, int]]:
+    """
+    Get the instants (in seconds) to find the offset changes of values in.
+
+    The span is a day wider than the values on both sides, so it also covers wall
+    clock values. None when looking every value up is cheaper (sparse values).
+    """
+    if np is None or not isinstance(values, np.ndarray) or not len(values):
+        return None
+
+    start = int(values.min()) // 1_000_000 - 86400
+    end = int(values.max()) // 1_000_000 + 86400
+    if (end - start) // 86400 >= len(values):
+        return None
+
+    return start, end
+
+
+def wall_to_utc(values: Buffer, tzinfo: Optional[_tzinfo]) -> Buffer:
+    """
+    Convert wall clock microseconds of a timezone to UTC microseconds.
+
+    Fixed offset timezones (such as UTC) are converted in a single vectorized step.
+    For other timezones the offset changes over the values are found once and looked
+    up with `np.searchsorted`; values in a daylight saving gap or fold are resolved
+    one by one, like the timezone does (fold=0).
+    """
+    offset = fixed_offset(tzinfo)
+    if offset is not None:
+        if np is not None:
+            return values - offset
+        return array("q", (value - offset for value in values))
+
+    span = _span(values)
+    if span is None:
+        return new_buffer(
+            value - _offset(EPOCH + _timedelta(microseconds=int(value)), tzinfo)
+            for value in values
+        )
+
+    instants, offsets = _transitions(*span, tzinfo)  # type: ignore[arg-type]
+    before, after = offsets[:-1], offsets[1:]
+
+    # wall times from the later wall clock reading of a change take the new offset,
+    # wall times from the earlier one are in a gap or a fold
+    index = np.searchsorted(instants + np.maximum(before, after), values, "right")
+    result = values - offsets[index]
+
+    lower = np.append(instants + np.minimum(before, after), np.iinfo(np.int64).max)
+    ambiguous = np.flatnonzero(values >= lower[index])
+    for position in ambiguous.tolist():
+        value = int(values[position])
+        wall = EPOCH + _timedelta(microseconds=value)
+        result[position] = value - _offset(wall, tzinfo)
+
+    return result
+
+
+def utc_to_wall(values: Buffer, tzinfo: Optional[_tzinfo]) -> Buffer:
+    """
+    Convert UTC microseconds to wall clock microseconds of a timezone.
+
+    Fixed offset timezones are converted in a single vectorized step, the offsets of
+    other timezones are looked up in their offset changes over the values.
+    """
+    offset = fixed_offset(tzinfo)
+    if offset is not None:
+        if np is not None:
+            return values + offset
+        return array("q", (value + offset for value in values))
+
+    span = _span(values)
+    if span is None:
+        return new_buffer(
+            value
+            + _offset(
+                (UTC_EPOCH + _timedelta(microseconds=int(value))).astimezone(tzinfo)
+            )
+            for value in values
+        )
+
+    instants, offsets = _transitions(*span, tzinfo)  # type: ignore[arg-type]
+    return values + offsets[np.searchsorted(instants, values, "right")]
+
+
+def drop_nonexistent(wall: Buffer, values: Buffer, tzinfo: Optional[_tzinfo]) -> Buffer:
+    """
+    Drop the instants of wall times that do not exist in a timezone.
+
+    Wall times in a daylight saving gap resolve to the same instants as the wall
+    times right after the gap (or to earlier ones), so a strictly increasing wall
+    clock grid crossing a gap is only strictly increasing in UTC without them.
+
+    Parameters
+    ----------
+    wall : Buffer
+        Wall clock epoch microseconds.
+    values : Buffer
+        Their UTC epoch microseconds, as given by `wall_to_utc`.
+    tzinfo : Optional[tzinfo]
+        Timezone of the wall clock.
+
+    Returns
+    -------
+    Buffer
+        UTC epoch microseconds of the wall times that exist.
+    """
+    round_trip = utc_to_wall(values, tzinfo)
+    if np is not None and isinstance(values, np.ndarray):
+        return values[round_trip == wall]
+
+    return array(
+        "q", (value for value, a, b in zip(values, wall, round_trip) if a == b)
+    )
+
+
+def add_micros(values: Buffer, micros: int) -> Buffer:
+    """Add a fixed number of microseconds to every value of a buffer."""
+    if np is not None:
+        return values + micros
+
+    return array("q", (value + micros for value in values))
+
+
+def add_months(values: Buffer, months: int) -> Buffer:
+    """
+    Add calendar months to wall clock microseconds, in one batched pass.
+
+    Each value moves by whole months on its own, and its day of month is clamped to
+    the length of the target month (like a relativedelta addition); the time of day
+    is kept.
+
+    Parameters
+    ----------
+    values : Buffer
+        Wall clock epoch microseconds.
+    months : int
+        Months to add (or subtract, when negative).
+
+    Returns
+    -------
+    Buffer
+        Shifted wall clock epoch microseconds.
+    """
+    if np is not None:
+        days, time_of_day = np.divmod(values, MICROSECONDS_PER_DAY)
+        dates = days.astype("datetime64[D]")
+        month_starts = dates.astype("datetime64[M]")
+        day_index = dates - month_starts.astype("datetime64[D]")
+        targets = month_starts + months
+        lengths = (targets + 1).astype("datetime64[D]") - targets.astype(
+            "datetime64[D]"
+        )
+        shifted = targets.astype("datetime64[D]") + np.minimum(day_index, lengths - 1)
+        return shifted.astype(np.int64) * MICROSECONDS_PER_DAY + time_of_day
+
+    result = array("q")
+    for value in values:
+        dt = EPOCH + _timedelta(microseconds=value)
+        year, month = divmod(dt.year * 12 + dt.month - 1 + months, 12)
+        day = min(dt.day, calendar.monthrange(year, month + 1)[1])
+        result.append(wall_micros(dt.replace(year=year, month=month + 1, day=day)))
+
+    return result
+
+
+def unique(values: Buffer) -> Buffer:
+    """Drop repeated values from a buffer, keeping first occurrences in order."""
+    if np is not None and isinstance(values, np.ndarray):
+        _, first = np.unique(values, return_index=True)
+        return values[np.sort(first)]
+
+    return array("q", dict.fromkeys(values))
+
+
+def is_sorted(values: Buffer) -> bool:
+    """Check if a buffer is strictly increasing."""
+    if np is not None and isinstance(values, np.ndarray):
+        return bool(np.all(values[1:] > values[:-1]))
+
+    return all(a < b for a, b in zip(values, values[1:]))
@@ -0,0 +1,307 @@
+"""Compiled datetime formatting and bulk string output."""
+
+import re
+
+from datetime import datetime as _datetime
+from datetime import timedelta as _timedelta
+from datetime import tzinfo as _tzinfo
+from functools import lru_cache
+from itertools import repeat
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from typing import Tuple
+
+from timeless import epoch
+
+
+# glibc does not zero pad years below 1000, other platforms do
+_YEAR = "{0:04d}" if _datetime(99, 1, 1).strftime("%Y") == "0099" else "{0}"
+
+_DIRECTIVES = {
+    "Y": _YEAR,
+    "y": "{7:02d}",
+    "m": "{1:02d}",
+    "d": "{2:02d}",
+    "H": "{3:02d}",
+    "M": "{4:02d}",
+    "S": "{5:02d}",
+    "f": "{6:06d}",
+    "z": "{8}",
+    "Z": "{9}",
+    "%": "%",
+}
+"""strftime directives rendered from the datetime fields, as str.format fields."""
+
+_ISO_DATETIME = "{0:04d}-{1:02d}-{2:02d}T{3:02d}:{4:02d}:{5:02d}"
+
+_Fields = Tuple[int, int, int, int, int, int, int]
+
+
+def _compile(format: str) -> Optional[str]:
+    """
+    Translate a strftime format into a str.format template.
+
+    Returns
+    -------
+    Optional[str]
+        Template, or None if the format has directives that need strftime.
+    """
+    template = []
+    for index, token in enumerate(re.split(r"(%.)", format)):
+        if index % 2 == 0:
+            template.append(token.replace("{", "{{").replace("}", "}}"))
+        elif token[1] in _DIRECTIVES:
+            template.append(_DIRECTIVES[token[1]])
+        else:
+            return None
+
+    return "".join(template)
+
+
+@lru_cache(maxsize=None)
+def _offset(offset: Optional[_timedelta], iso: bool) -> str:
+    """Format a UTC offset like isoformat (+HH:MM) or strftime's %z (+HHMM) do."""
+    if offset is None:
+        return ""
+
+    sign = "-" if offset < _timedelta() else "+"
+    micros = abs(offset) // epoch.ONE_MICROSECOND
+    seconds, microsecond = divmod(micros, 1_000_000)
+    hours, rest = divmod(seconds, 3600)
+    minutes, second = divmod(rest, 60)
+
+    separator = ":" if iso else ""
+    text = f"{sign}{hours:02d}{separator}{minutes:02d}"
+    if second or microsecond:
+        text += f"{separator}{second:02d}"
+    if microsecond:
+        text += f".{microsecond:06d}"
+
+    return text
+
+
+def _wall_fields(wall: epoch.Buffer) -> Iterator[_Fields]:
+    """Split wall clock epoch microseconds into datetime fields, in one pass."""
+    np = epoch.np
+    if np is None or not isinstance(wall, np.ndarray):
+        for value in wall:
+            dt = epoch.EPOCH + _timedelta(microseconds=int(value))
+            yield (
+                dt.year,
+                dt.month,
+                dt.day,
+                dt.hour,
+                dt.minute,
+                dt.second,
+                dt.microsecond,
+            )
+        return
+
+    days, time_of_day = np.divmod(wall, epoch.MICROSECONDS_PER_DAY)
+    dates = days.astype("datetime64[D]")
+    months = dates.astype("datetime64[M]")
+    years, month_index = np.divmod(months.astype(np.int64), 12)
+    day = (dates - months.astype("datetime64[D]")).astype(np.int64) + 1
+    seconds, microsecond = np.divmod(time_of_day, 1_000_000)
+    minutes, second = np.divmod(seconds, 60)
+    hour, minute = np.divmod(minutes, 60)
+
+    yield from zip(
+        (years + 1970).tolist(),
+        (month_index + 1).tolist(),
+        day.tolist(),
+        hour.tolist(),
+        minute.tolist(),
+        second.tolist(),
+        microsecond.tolist(),
+    )
+
+
+class Formatter:
+    """
+    strftime pattern compiled once and applied to many datetimes.
+
+    Numeric directives (%Y %y %m %d %H %M %S %f %z %Z %%) are rendered from the
+    datetime fields with a single `str.format` template and ISO 8601 output (no
+    pattern) has its own writer; patterns with other directives use strftime. The
+    output is the same as `Datetime.format`.
+    """
+
+    def __init__(self, format: Optional[str] = None):
+        """
+        Compile a strftime pattern.
+
+        Parameters
+        ----------
+        format : Optional[str], optional
+            Follows the same rules as the python strftime, by default None
+            (isoformat)
+        """
+        self.format = format
+        self._template = _compile(format) if format is not None else None
+        self._needs_zone = format is not None and ("%z" in format or "%Z" in format)
+
+    def __call__(self, dt: _datetime) -> str:
+        """Format one datetime."""
+        if self.format is None:
+            return self._iso(
+                (
+                    dt.year,
+                    dt.month,
+                    dt.day,
+                    dt.hour,
+                    dt.minute,
+                    dt.second,
+                    dt.microsecond,
+                ),
+                dt.utcoffset(),
+            )
+
+        if self._template is None:
+            return dt.strftime(self.format)
+
+        return self._template.format(
+            dt.year,
+            dt.month,
+            dt.day,
+            dt.hour,
+            dt.minute,
+            dt.second,
+            dt.microsecond,
+            dt.year % 100,
+            _offset(dt.utcoffset(), False) if self._needs_zone else "",
+            (dt.tzname() or "") if self._needs_zone else "",
+        )
+
+    def __repr__(self) -> str:
+        """Represent the formatter by its pattern."""
+        return f"{self.__class__.__name__}({self.format!r})"
+
+    def _iso(self, fields: _Fields, offset: Optional[_timedelta]) -> str:
+        """Format datetime fields and offset like isoformat does."""
+        text = _ISO_DATETIME.format(*fields)
+        if fields[6]:
+            text += f".{fields[6]:06d}"
+
+        return text + _offset(offset, True)
+
+    def _buffer(self, values: epoch.Buffer, tzinfo: _tzinfo) -> Iterator[str]:
+        """Format UTC epoch microseconds of a timezone, without building datetimes."""
+        wall = epoch.utc_to_wall(values, tzinfo)
+        fixed = epoch.fixed_offset(tzinfo)
+        if fixed is not None:
+            offsets: Iterable[int] = repeat(fixed)
+        else:
+            offsets = (int(a) - int(b) for a, b in zip(wall, values))
+
+        iso = self.format is None
+        zone = (tzinfo.tzname(None) or "") if not iso else ""
+        strings: Dict[int, str] = {}
+        for fields, offset in zip(_wall_fields(wall), offsets):
+            if offset not in strings:
+                strings[offset] = _offset(_timedelta(microseconds=offset), iso)
+
+            if iso:
+                text = _ISO_DATETIME.format(*fields)
+                if fields[6]:
+                    text += f".{fields[6]:06d}"
+                yield text + strings[offset]
+            else:
+                yield self._template.format(  # type: ignore[union-attr]
+                    *fields, fields[0] % 100, strings[offset], zone
+                )
+
+    def format_many(self, values: Iterable[_datetime]) -> Iterator[str]:
+        """
+        Format many datetimes, one at a time.
+
+        Array-backed values (CompactPeriod, DatetimeArray) are formatted straight
+        from their epoch microseconds buffer, without building datetimes.
+
+        Parameters
+        ----------
+        values : Iterable[datetime]
+            Datetimes, periods or arrays.
+
+        Yields
+        ------
+        Iterator[str]
+            Formatted strings.
+        """
+        tzinfo = getattr(values, "tzinfo", None)
+        buffer = getattr(values, "values", None)
+
+        # time zone names of zones with daylight saving change along the buffer
+        has_names = self.format is not None and "%Z" in self.format
+        if (
+            buffer is not None
+            and isinstance(tzinfo, _tzinfo)
+            and (self.format is None or self._template is not None)
+            and not (has_names and epoch.fixed_offset(tzinfo) is None)
+        ):
+            yield from self._buffer(buffer, tzinfo)
+            return
+
+        for value in values:
+            yield self(value)
+
+
+@lru_cache(maxsize=64)
+def get_formatter(format: Optional[str] = None) -> Formatter:
+    """Get the (shared) compiled formatter of a strftime pattern."""
+    return Formatter(format)
+
+
+def format_many(
+    values: Iterable[_datetime],
+    format: Optional[str] = None,
+    output: Any = "list",
+    separator: str = "\n",
+) -> Any:
+    """
+    Format many datetimes in one pass.
+
+    Parameters
+    ----------
+    values : Iterable[datetime]
+        Datetimes, periods (Period, LazyPeriod, CompactPeriod) or a DatetimeArray.
+    format : Optional[str], optional
+        Follows the same rules as the python strftime, by default None (isoformat)
+    output : Any, optional
+        "list", "str" (strings joined by the separator) or a text stream (each string
+        is written followed by the separator), by default "list"
+    separator : str, optional
+        String between formatted datetimes, by default a new line
+
+    Returns
+    -------
+    Any
+        List of strings, joined string, or the number of strings written to the
+        stream.
+
+    Raises
+    ------
+    ValueError
+        Unknown output.
+    """
+    strings = get_formatter(format).format_many(values)
+
+    if output == "list":
+        return list(strings)
+
+    if output == "str":
+        return separator.join(strings)
+
+    if not hasattr(output, "write"):
+        raise ValueError(f"Unknown output: {output}")
+
+    count = 0
+    for string in strings:
+        output.write(string)
+        output.write(separator)
+        count += 1
+
+    return count
@@ -0,0 +1,367 @@
+"""Bulk parsing of datetime strings."""
+
+import re
+
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime as _datetime
+from functools import lru_cache
+from itertools import chain
+from itertools import islice
+from typing import Any
+from typing import Callable
+from typing import Deque
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Pattern
+from typing import Set
+from typing import Tuple
+
+from timeless.datetime import _ISO_8601
+from timeless.datetime import Datetime
+from timeless.datetime import _from_parsed
+from timeless.datetime import _get_zone
+from timeless.datetime import _parse_iso
+from timeless.datetime import _parsed_zone
+from timeless.datetime import _parser
+from timeless.datetime_array import DatetimeArray
+from timeless.period import Period
+
+
+OUTPUTS = ("list", "period", "array")
+"""Result types of `parse_many`."""
+
+_TIMES = ("", " %H:%M", " %H:%M:%S", " %H:%M:%S.%f")
+
+
+def _candidate_formats(day_first: bool) -> List[str]:
+    """
+    Get the numeric strptime formats tried when inferring the format of a sample.
+
+    Day and month come in the order dateutil prefers for ambiguous values, so a
+    sample where they cannot be told apart (such as 01/01) picks the same reading.
+    """
+    day_month = ["%d", "%m"] if day_first else ["%m", "%d"]
+    formats = []
+    for separator in "/.-":
+        for time in _TIMES:
+            formats.append(separator.join(day_month + ["%Y"]) + time)
+            formats.append(separator.join(["%Y"] + day_month) + time)
+
+    compact = "".join(["%Y"] + day_month)
+    return formats + [compact + "T%H%M%S", compact + "%H%M%S", compact]
+
+
+_FIELDS = {
+    "Y": ("year", 4),
+    "m": ("month", 2),
+    "d": ("day", 2),
+    "H": ("hour", 2),
+    "M": ("minute", 2),
+    "S": ("second", 2),
+    "f": ("microsecond", 6),
+}
+
+_Fields = Tuple[int, int, int, int, int, int, int, str]
+
+
+def _format_regex(format: str) -> Optional[Pattern[str]]:
+    """
+    Compile a strptime format into a regular expression with named groups.
+
+    Only numeric directives are supported. Fields next to another directive get a
+    fixed width, other ones accept unpadded values like strptime does.
+
+    Returns
+    -------
+    Optional[Pattern[str]]
+        Compiled expression, or None if the format is not supported.
+    """
+    # literals at even positions, directives at odd ones
+    tokens = re.split(r"(%.)", format)
+    pattern: List[str] = []
+    names: Set[str] = set()
+
+    for index, token in enumerate(tokens):
+        if index % 2 == 0:
+            pattern.extend(
+                r"\s+" if char.isspace() else re.escape(char) for char in token
+            )
+            continue
+
+        if token == "%%":
+            pattern.append("%")
+            continue
+
+        if token[1] not in _FIELDS or token[1] in names:
+            return None
+
+        names.add(token[1])
+        name, width = _FIELDS[token[1]]
+        before = index > 1 and not tokens[index - 1]
+        after = index + 2 < len(tokens) and not tokens[index + 1]
+
+        # variable width fractions glued to another field are ambiguous
+        if name == "microsecond" and after:
+            return None
+
+        minimum = width if before or after or name == "year" else 1
+        pattern.append(rf"(?P<{name}>\d{{{minimum},{width}}})")
+
+    return re.compile("".join(pattern), re.IGNORECASE)
+
+
+@lru_cache(maxsize=None)
+def _compile(
+    format: Optional[str], inferred: bool, day_first: bool, year_first: bool
+) -> Callable[[str], _datetime]:
+    """
+    Build a parser for one kind of string.
+
+    Parameters
+    ----------
+    format : Optional[str]
+        strptime format, or None for ISO 8601 / dateutil parsing.
+    inferred : bool
+        The format was inferred from a sample: strings that do not follow it are
+        parsed with dateutil instead of failing.
+    day_first : bool
+        dateutil's dayfirst.
+    year_first : bool
+        dateutil's yearfirst.
+
+    Returns
+    -------
+    Callable[[str], _datetime]
+        Parser function.
+    """
+    fallback: Callable[[str], _datetime] = _parser(day_first, year_first).parse
+
+    if format is None:
+        if day_first:
+            return fallback
+
+        return lambda string: _parse_iso(string) or fallback(string)
+
+    if not inferred:
+
+        def fallback(string: str) -> _datetime:
+            return _datetime.strptime(string, format)  # type: ignore[arg-type]
+
+    regex = _format_regex(format)
+    if regex is None:
+        return fallback
+
+    def parse_format(string: str) -> _datetime:
+        match = regex.fullmatch(string)  # type: ignore[union-attr]
+        if match is None:
+            return fallback(string)
+
+        fields = match.groupdict()
+        microsecond = fields.pop("microsecond", None)
+        try:
+            return _datetime(
+                int(fields.get("year", 1900)),
+                int(fields.get("month", 1)),
+                int(fields.get("day", 1)),
+                int(fields.get("hour", 0)),
+                int(fields.get("minute", 0)),
+                int(fields.get("second", 0)),
+                int(microsecond.ljust(6, "0")) if microsecond else 0,
+            )
+        except ValueError:
+            return fallback(string)
+
+    return parse_format
+
+
+def _infer_format(
+    sample: List[str], day_first: bool, year_first: bool
+) -> Optional[str]:
+    """
+    Infer the strptime format of a sample of strings.
+
+    A candidate format is only picked if it reads every string of the sample the same
+    way dateutil does.
+
+    Returns
+    -------
+    Optional[str]
+        strptime format, or None when the sample is ISO 8601 or has no known format.
+    """
+    if not sample or all(_ISO_8601.fullmatch(string) for string in sample):
+        return None
+
+    try:
+        expected = [_parser(day_first, year_first).parse(string) for string in sample]
+    except ValueError:
+        return None
+
+    if any(parsed.tzinfo is not None for parsed in expected):
+        return None
+
+    for format in _candidate_formats(day_first):
+        try:
+            parsed = [_datetime.strptime(string, format) for string in sample]
+        except ValueError:
+            continue
+
+        if parsed == expected:
+            return format
+
+    return None
+
+
+def _parse_chunk(
+    strings: List[str],
+    format: Optional[str],
+    inferred: bool,
+    zone: Optional[str],
+    day_first: bool,
+    year_first: bool,
+) -> List[_Fields]:
+    """Parse a chunk of strings in a worker process, into picklable fields."""
+    parse = _compile(format, inferred, day_first, year_first)
+    fields = []
+    for string in strings:
+        parsed = parse(string)
+        fields.append(
+            (
+                parsed.year,
+                parsed.month,
+                parsed.day,
+                parsed.hour,
+                parsed.minute,
+                parsed.second,
+                parsed.microsecond,
+                _parsed_zone(parsed, zone),
+            )
+        )
+
+    return fields
+
+
+def _chunks(strings: Iterable[str], size: int) -> Iterator[List[str]]:
+    """Split strings into lists of a given size."""
+    strings = iter(strings)
+    chunk = list(islice(strings, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(strings, size))
+
+
+def _parse_pool(
+    strings: Iterable[str], workers: int, chunk_size: int, *args: Any
+) -> Iterator[Datetime]:
+    """Parse strings across a process pool, keeping at most two chunks per worker."""
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: Deque[Future] = deque()
+        for chunk in _chunks(strings, chunk_size):
+            pending.append(executor.submit(_parse_chunk, chunk, *args))
+            if len(pending) >= 2 * workers:
+                yield from _from_fields(pending.popleft().result())
+
+        while pending:
+            yield from _from_fields(pending.popleft().result())
+
+
+def _from_fields(fields: List[_Fields]) -> Iterator[Datetime]:
+    """Build Datetimes from parsed fields."""
+    for year, month, day, hour, minute, second, microsecond, zone in fields:
+        yield Datetime._from_fields(
+            year, month, day, hour, minute, second, microsecond, _get_zone(zone)
+        )
+
+
+def parse_many(
+    strings: Iterable[str],
+    format: Optional[str] = None,
+    zone: Optional[str] = None,
+    day_first: bool = False,
+    year_first: bool = False,
+    output: str = "list",
+    workers: Optional[int] = None,
+    chunk_size: int = 100_000,
+    sample_size: int = 16,
+) -> Any:
+    """
+    Parse many datetime strings at once.
+
+    The format is worked out once, from the first strings, and compiled into a
+    single parser applied to the whole input as a stream: ISO 8601 / RFC 3339
+    strings use the fast path of `parse`, strings matching a common numeric format
+    are read with a precompiled expression, and other ones go through dateutil.
+    Every string gives the same result `parse` would.
+
+    Parameters
+    ----------
+    strings : Iterable[str]
+        Datetime strings (any iterable, consumed once).
+    format : Optional[str], optional
+        strptime format, by default None (inferred)
+    zone : Optional[str], optional
+        timezone name (overrides parsed value), by default None
+    day_first : bool, optional
+        Whether to interpret the first value in an ambiguous 3-integer date as the day,
+        by default False
+    year_first : bool, optional
+        Whether to interpret the first value in an ambiguous 3-integer date as the year,
+        by default False
+    output : str, optional
+        "list", "period" or "array" (DatetimeArray), by default "list"
+    workers : Optional[int], optional
+        Number of worker processes, by default None (parse in this process)
+    chunk_size : int, optional
+        Strings per worker task, by default 100_000
+    sample_size : int, optional
+        Strings used to infer the format, by default 16
+
+    Returns
+    -------
+    Any
+        Parsed datetimes, as a list, a Period or a DatetimeArray.
+
+    Raises
+    ------
+    ValueError
+        Unknown output, or a string cannot be parsed.
+    TypeError
+        Duplicate datetimes for a Period output.
+    """
+    if output not in OUTPUTS:
+        raise ValueError(f"Unknown output: {output}")
+
+    strings = iter(strings)
+    sample = list(islice(strings, sample_size))
+    inferred = format is None
+    if format is None:
+        format = _infer_format(sample, day_first, year_first)
+
+    items = chain(sample, strings)
+    parsed: Iterable[Datetime]
+    if workers:
+        args = (format, inferred, zone, day_first, year_first)
+        parsed = _parse_pool(items, workers, chunk_size, *args)
+    else:
+        parse = _compile(format, inferred, day_first, year_first)
+        parsed = (_from_parsed(parse(string), zone) for string in items)
+
+    if output == "array":
+        return DatetimeArray(parsed, zone)
+
+    result = list(parsed)
+    if output == "list":
+        return result
+
+    period = Period._build(result, "days", 1, False)
+    if len(period._members) != len(result):
+        raise TypeError("Period cannot have duplicate items")
+
+    if result:
+        period.start = min(result)
+        period.end = max(result)
+
+    return period
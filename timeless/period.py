@@ -1,110 +1,563 @@
 """Friendly interface for time span manipulations."""
 
+import calendar
+
+from bisect import bisect_left
+from bisect import bisect_right
+from datetime import datetime as _datetime
+from datetime import timedelta as _timedelta
+from datetime import tzinfo as _tzinfo
+from functools import lru_cache
+from math import gcd
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Generic
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Set
+from typing import Tuple
+from typing import Type
 from typing import TypedDict
+from typing import TypeVar
 from typing import Union
 
 from dateutil.relativedelta import relativedelta
+from timeless import epoch
 from timeless.datetime import Datetime
+from timeless.datetime import _get_zone
 from timeless.datetime import parse
 from timeless.datetime import today
+from timeless.helpers import DAYS_PER_MONTHS
 from typing_extensions import SupportsIndex
 from typing_extensions import Unpack
 
 
-class Period(list):
-    """Timeless time span."""
+FIXED_UNITS = {
+    "weeks": _timedelta(weeks=1),
+    "days": _timedelta(days=1),
+    "hours": _timedelta(hours=1),
+    "minutes": _timedelta(minutes=1),
+    "seconds": _timedelta(seconds=1),
+    "microseconds": _timedelta(microseconds=1),
+}
+"""Frequencies with a fixed length, stepped with plain timedelta arithmetic."""
 
-    def __init__(
-        self,
-        start: Union[str, Datetime],
-        end: Union[str, Datetime],
-        freq: str = "days",
-        step: int = 1,
-        parse_kwargs: dict = dict(),
-    ):
-        list.__init__(self)
+CALENDAR_UNITS = {"months": 1, "years": 12}
+"""Frequencies with a variable length, stepped by month ordinal (in months)."""
 
-        if isinstance(start, str):
-            start = parse(start, **parse_kwargs)
+# month lengths repeat every 400 years (4800 months)
+_MONTHS_PER_CYCLE = 4800
 
-        if isinstance(end, str):
-            end = parse(end, **parse_kwargs)
+if epoch.np is not None:
+    _MONTH_LENGTHS = epoch.np.array(
+        [list(DAYS_PER_MONTHS[leap].values()) for leap in (0, 1)]
+    )
 
-        if end < start:
-            raise ValueError("End date must be greater than start date")
 
-        self.start = start
-        self.end = end
-        self.freq = freq
-        self.step = step
+def _check_freq(freq: str, step: int) -> None:
+    """Validate a Period frequency and step."""
+    if freq not in FIXED_UNITS and freq not in CALENDAR_UNITS:
+        raise ValueError(f"Unknown frequency: {freq}")
 
-        self.append(start)
-        while start < end:
-            start = start.add(**{freq: step})
-            self.append(start)
+    if step < 1:
+        raise ValueError("Step must be a positive integer")
 
-    def append(self, item: Datetime) -> None:
-        """
-        Append a datetime instance to the end of the period.
 
-        Parameters
-        ----------
-        item : Datetime
-            Datetime instance to append.
+def _naive(dt: _datetime) -> _datetime:
+    """Wall clock value of a datetime, without timezone."""
+    return _datetime(
+        dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second, dt.microsecond
+    )
 
-        Raises
-        ------
-        ValueError
-            Only Datetime instances allowed.
-        TypeError
-            Periods cannot have duplicate items.
-        """
-        if not isinstance(item, Datetime):
-            raise ValueError("Only Datetime instances allowed")
 
-        if item in self:
-            raise TypeError("Period cannot have duplicate items")
+def _month_ordinal(dt: _datetime) -> int:
+    """Months elapsed since year zero."""
+    return dt.year * 12 + dt.month - 1
 
-        super(Period, self).append(item)
-        self.start = min(self)
-        self.end = max(self)
 
-    def insert(self, index: SupportsIndex, item: Datetime) -> None:
-        """
-        Insert a datetime instance at the given index.
+@lru_cache(maxsize=256)
+def _clamp_steps(day: int, ordinal: int, months: int) -> Tuple[Tuple[int, int], ...]:
+    """
+    Find the steps where the clamped day of month of a monthly grid decreases.
 
-        Parameters
-        ----------
-        index : int
-            List index to insert at.
-        item : Datetime
-            Datetime instance to insert.
+    Months are visited once over a whole 400 years cycle at most, and only until the
+    day reaches 28, so later lookups are a few comparisons.
 
-        Raises
-        ------
-        ValueError
-            Only Datetime instances allowed.
-        TypeError
-            Periods cannot have duplicate items.
-        """
-        if not isinstance(item, Datetime):
-            raise ValueError("Only Datetime instances allowed")
+    Returns
+    -------
+    Tuple[Tuple[int, int], ...]
+        Step index and new day of month, for every decrease (three at most).
+    """
+    steps = []
+    cycle = _MONTHS_PER_CYCLE // gcd(months, _MONTHS_PER_CYCLE)
+    for i in range(1, cycle + 1):
+        year, month = divmod(ordinal + i * months, 12)
+        length = DAYS_PER_MONTHS[calendar.isleap(year)][month + 1]
+        if length < day:
+            day = length
+            steps.append((i, day))
+            if day == 28:
+                break
 
-        if item in self:
-            raise TypeError("Period cannot have duplicate items")
+    return tuple(steps)
 
-        super(Period, self).insert(index, item)
-        self.start = min(self)
-        self.end = max(self)
 
-    def _add(self, other: relativedelta) -> "Period":
+def _clamp_day(day: int, ordinal: int, months: int, index: int) -> int:
+    """
+    Day of month of the index-th monthly step.
+
+    Repeatedly adding a relativedelta clamps the day to the shortest month visited
+    so far, so the day is the minimum over every month length up to the index.
+
+    Parameters
+    ----------
+    day : int
+        Start day of month.
+    ordinal : int
+        Start month ordinal.
+    months : int
+        Months per step.
+    index : int
+        Step index.
+
+    Returns
+    -------
+    int
+        Clamped day of month.
+    """
+    if day <= 28:
+        return day
+
+    # month lengths only depend on the position in the 400 years cycle
+    for step, clamped in _clamp_steps(day, ordinal % _MONTHS_PER_CYCLE, months):
+        if step > index:
+            break
+        day = clamped
+
+    return day
+
+
+def _nth(start: Datetime, freq: str, step: int, index: int) -> Datetime:
+    """
+    Get the index-th element of a regular period, without the ones before it.
+
+    Parameters
+    ----------
+    start : Datetime
+        First element.
+    freq : str
+        Period frequency.
+    step : int
+        Period step.
+    index : int
+        Element position.
+
+    Returns
+    -------
+    Datetime
+        Period element.
+    """
+    if freq in FIXED_UNITS:
+        value = _naive(start) + FIXED_UNITS[freq] * (step * index)
+        return Datetime._from_naive(value, start.tzinfo)
+
+    months = CALENDAR_UNITS[freq] * step
+    ordinal = _month_ordinal(start)
+    year, month = divmod(ordinal + months * index, 12)
+    value = _naive(start).replace(
+        year=year,
+        month=month + 1,
+        day=_clamp_day(start.day, ordinal, months, index),
+    )
+    return Datetime._from_naive(value, start.tzinfo)
+
+
+def _iter_grid(start: Datetime, freq: str, step: int, count: int) -> Iterator[Datetime]:
+    """
+    Yield the first count elements of a regular period, one step at a time.
+
+    Parameters
+    ----------
+    start : Datetime
+        First element.
+    freq : str
+        Period frequency.
+    step : int
+        Period step.
+    count : int
+        Number of elements.
+
+    Yields
+    ------
+    Iterator[Datetime]
+        Period elements.
+    """
+    tzinfo = start.tzinfo
+    value = _naive(start)
+
+    if freq in FIXED_UNITS:
+        delta = FIXED_UNITS[freq] * step
+        for _ in range(count):
+            yield Datetime._from_naive(value, tzinfo)
+            value += delta
+        return
+
+    months = CALENDAR_UNITS[freq] * step
+    ordinal = _month_ordinal(start)
+    day = start.day
+    for index in range(count):
+        year, month = divmod(ordinal + months * index, 12)
+        day = min(day, DAYS_PER_MONTHS[calendar.isleap(year)][month + 1])
+        yield Datetime._from_naive(
+            value.replace(year=year, month=month + 1, day=day), tzinfo
+        )
+
+
+def _month_fields(start: _datetime, months: int, count: int) -> Tuple[Any, Any, Any]:
+    """
+    Compute month ordinals and days of month of a monthly grid in one batched pass.
+
+    Months come straight from the `year * 12 + month` ordinal and days of month are
+    clamped cumulatively (running minimum of month lengths), matching repeated
+    relativedelta additions. Vectorized with Numpy when available.
+
+    Parameters
+    ----------
+    start : _datetime
+        First element.
+    months : int
+        Months per step.
+    count : int
+        Number of elements.
+
+    Returns
+    -------
+    Tuple[Any, Any, Any]
+        Years, months (1-12) and days, as Numpy arrays or lists.
+    """
+    ordinal = _month_ordinal(start)
+    np = epoch.np
+
+    if np is not None:
+        ordinals = ordinal + np.arange(count, dtype=np.int64) * months
+        years, month_index = np.divmod(ordinals, 12)
+        leap = (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+        lengths = _MONTH_LENGTHS[leap.astype(np.int64), month_index]
+        days = np.minimum.accumulate(np.minimum(lengths, start.day))
+        return years, month_index + 1, days
+
+    years, month_numbers, days = [], [], []
+    day = start.day
+    for index in range(count):
+        year, month = divmod(ordinal + months * index, 12)
+        day = min(day, DAYS_PER_MONTHS[calendar.isleap(year)][month + 1])
+        years.append(year)
+        month_numbers.append(month + 1)
+        days.append(day)
+
+    return years, month_numbers, days
+
+
+def _calendar_grid(start: Datetime, months: int, count: int) -> List[Datetime]:
+    """Build every element of a monthly grid from its closed-form fields."""
+    tzinfo = start.tzinfo
+    time = (start.hour, start.minute, start.second, start.microsecond)
+    years, months_, days = _month_fields(start, months, count)
+
+    if epoch.np is not None:
+        years, months_, days = years.tolist(), months_.tolist(), days.tolist()
+
+    return [
+        Datetime._from_naive(_datetime(year, month, day, *time), tzinfo)
+        for year, month, day in zip(years, months_, days)
+    ]
+
+
+def _grid_items(start: Datetime, freq: str, step: int, count: int) -> List[Datetime]:
+    """Build every element of a regular period."""
+    if freq in FIXED_UNITS:
+        return list(_iter_grid(start, freq, step, count))
+
+    return _calendar_grid(start, CALENDAR_UNITS[freq] * step, count)
+
+
+def _calendar_wall_micros(start: Datetime, months: int, count: int) -> epoch.Buffer:
+    """Wall clock epoch microseconds of every element of a monthly grid."""
+    years, months_, days = _month_fields(start, months, count)
+    time_of_day = epoch.wall_micros(start) % epoch.MICROSECONDS_PER_DAY
+    np = epoch.np
+
+    if np is not None:
+        month_starts = (
+            ((years - 1970) * 12 + months_ - 1)
+            .astype("datetime64[M]")
+            .astype("datetime64[D]")
+            .astype(np.int64)
+        )
+        return (month_starts + days - 1) * epoch.MICROSECONDS_PER_DAY + time_of_day
+
+    return epoch.new_buffer(
+        epoch.wall_micros(_datetime(year, month, day)) + time_of_day
+        for year, month, day in zip(years, months_, days)
+    )
+
+
+def _grid_wall_micros(
+    start: Datetime, freq: str, step: int, count: int
+) -> epoch.Buffer:
+    """Wall clock epoch microseconds of every element of a regular grid."""
+    if freq in FIXED_UNITS:
+        return epoch.arange(
+            epoch.wall_micros(start),
+            FIXED_UNITS[freq] * step // epoch.ONE_MICROSECOND,
+            count,
+        )
+
+    return _calendar_wall_micros(start, CALENDAR_UNITS[freq] * step, count)
+
+
+def _estimate(start: Datetime, freq: str, step: int, item: _datetime) -> int:
+    """Approximate (floor) position of a datetime in a regular period."""
+    if freq in FIXED_UNITS:
+        return (item - start) // (FIXED_UNITS[freq] * step)
+
+    return (_month_ordinal(item) - _month_ordinal(start)) // (
+        CALENDAR_UNITS[freq] * step
+    )
+
+
+def _count(start: Datetime, end: Datetime, freq: str, step: int) -> int:
+    """
+    Count the elements a period generates from start to end.
+
+    Generation stops at the first element greater than or equal to end, and that
+    element is included.
+
+    Parameters
+    ----------
+    start : Datetime
+        First element.
+    end : Datetime
+        Period end.
+    freq : str
+        Period frequency.
+    step : int
+        Period step.
+
+    Returns
+    -------
+    int
+        Number of elements.
+    """
+    index = max(_estimate(start, freq, step, end), 0)
+
+    # the estimate is exact up to timezone and day clamping effects
+    while index > 0 and _nth(start, freq, step, index - 1) >= end:
+        index -= 1
+    while _nth(start, freq, step, index) < end:
+        index += 1
+
+    return index + 1
+
+
+def _unit_of(delta: int, prefer: Optional[str] = None) -> Tuple[str, int]:
+    """Express a fixed step in microseconds as a frequency and a step."""
+    for freq in ([prefer] if prefer in FIXED_UNITS else []) + list(FIXED_UNITS):
+        size = FIXED_UNITS[freq] // epoch.ONE_MICROSECOND
+        if delta % size == 0:
+            return freq, delta // size
+
+    raise ValueError(f"Invalid step: {delta}")  # pragma: no cover
+
+
+def _wall_grid(period: Any) -> Optional[Tuple[Optional[_tzinfo], int, int, int]]:
+    """
+    Get the wall clock grid of a regular, fixed unit period.
+
+    Returns
+    -------
+    Optional[Tuple[Optional[tzinfo], int, int, int]]
+        Timezone, first element, step and last element (in wall clock epoch
+        microseconds), or None if the period has no such grid.
+    """
+    if not period._regular or period.freq not in FIXED_UNITS or not len(period):
+        return None
+
+    # compact periods store instants: daylight saving gaps break their wall grid
+    if isinstance(period, CompactPeriod) and epoch.fixed_offset(period.tzinfo) is None:
+        return None
+
+    step = FIXED_UNITS[period.freq] * period.step // epoch.ONE_MICROSECOND
+    first = epoch.wall_micros(period.start)
+    return period.start.tzinfo, first, step, first + step * (len(period) - 1)
+
+
+def _merge(
+    left: Iterable[Datetime],
+    right: Iterable[Datetime],
+    left_only: bool,
+    both: bool,
+    right_only: bool,
+) -> List[Datetime]:
+    """
+    Merge two sorted sequences of unique datetimes.
+
+    Parameters
+    ----------
+    left : Iterable[Datetime]
+        Sorted datetimes.
+    right : Iterable[Datetime]
+        Sorted datetimes.
+    left_only : bool
+        Keep datetimes found only on the left.
+    both : bool
+        Keep datetimes found on both sides (the left instance is kept).
+    right_only : bool
+        Keep datetimes found only on the right.
+
+    Returns
+    -------
+    List[Datetime]
+        Sorted datetimes.
+    """
+    result: List[Datetime] = []
+    lefts, rights = iter(left), iter(right)
+    a, b = next(lefts, None), next(rights, None)
+
+    while a is not None and b is not None:
+        if a < b:
+            if left_only:
+                result.append(a)
+            a = next(lefts, None)
+        elif b < a:
+            if right_only:
+                result.append(b)
+            b = next(rights, None)
+        else:
+            if both:
+                result.append(a)
+            a, b = next(lefts, None), next(rights, None)
+
+    if left_only and a is not None:
+        result.append(a)
+        result.extend(lefts)
+
+    if right_only and b is not None:
+        result.append(b)
+        result.extend(rights)
+
+    return result
+
+
+def _shift_items(
+    items: Iterable[Datetime], months: int, delta: _timedelta
+) -> List[Datetime]:
+    """Move datetimes by calendar months, then by a fixed wall clock delta."""
+    if not months:
+        return [
+            Datetime._from_naive(_naive(item) + delta, item.tzinfo) for item in items
+        ]
+
+    shifted = []
+    for item in items:
+        year, month = divmod(_month_ordinal(item) + months, 12)
+        value = _naive(item).replace(
+            year=year,
+            month=month + 1,
+            day=min(item.day, DAYS_PER_MONTHS[calendar.isleap(year)][month + 1]),
+        )
+        shifted.append(Datetime._from_naive(value + delta, item.tzinfo))
+
+    return shifted
+
+
+def _shift_period(
+    cls: Type["Period"],
+    items: Iterable[Datetime],
+    months: int,
+    delta: _timedelta,
+    freq: str,
+    step: int,
+    regular: bool,
+) -> "Period":
+    """Build an eager period from shifted datetimes, in their original order."""
+    shifted = _shift_items(items, months, delta)
+
+    # month clamping can send several datetimes to the same day
+    if months:
+        shifted = list(dict.fromkeys(shifted))
+
+    period = cls._build(shifted, freq, step, regular)
+    if shifted and not regular:
+        period.start = min(shifted)
+        period.end = max(shifted)
+
+    return period
+
+
+_Result = TypeVar("_Result", bound="_PeriodMixin[Any]")
+"""Period type returned by the operations of a Period flavour."""
+
+
+class _PeriodMixin(Generic[_Result]):
+    """Behaviour shared by every Period flavour, returning `_Result` periods."""
+
+    start: Datetime
+    end: Datetime
+    freq: str
+    step: int
+    _regular: bool
+
+    if TYPE_CHECKING:  # pragma: no cover
+
+        def __len__(self) -> int:
+            ...
+
+        def __getitem__(self, index: Any) -> Any:
+            ...
+
+        def __iter__(self) -> Iterator[Datetime]:
+            ...
+
+        @classmethod
+        def _from_grid(
+            cls, start: Datetime, freq: str, step: int, count: int
+        ) -> _Result:
+            ...
+
+        def _from_items(self, items: List[Datetime]) -> _Result:
+            ...
+
+        def _shift(self, months: int, delta: _timedelta) -> _Result:
+            ...
+
+    def _keeps_grid(self, months: int, delta: _timedelta) -> bool:
+        """Check if shifting a regular period by a delta gives a regular period."""
+        if not self._regular or not len(self):
+            return False
+
+        if self.freq in FIXED_UNITS:
+            return not months
+
+        # days past the 28th get clamped differently once moved
+        return not delta and self.start.day <= 28
+
+    def _add(self, other: relativedelta) -> _Result:
         """
         Sum a given timedelta to the period.
 
+        The delta is applied to every stored element (irregular ones included) in a
+        single batched pass, like `Datetime.add` would: calendar months first, with
+        the day of month clamped to the target month, then the fixed part on the wall
+        clock. Elements that collide after clamping are kept once.
+
         Parameters
         ----------
         other : relativedelta
-            _description_
+            Relative delta to apply.
 
         Returns
         -------
@@ -117,22 +570,18 @@ class Period(list):
             Currently only supports relativedelta.
         """
         if isinstance(other, relativedelta):
-            delta = {
-                "years": other.years,
-                "months": other.months,
-                "days": other.days,
-                "hours": other.hours,
-                "minutes": other.minutes,
-                "seconds": other.seconds,
-                "microseconds": other.microseconds,
-            }
-            start = self.start.add(**delta)
-            end = self.end.add(**delta)
-            return self.__class__(start, end, self.freq, self.step)
+            delta = _timedelta(
+                days=other.days,
+                hours=other.hours,
+                minutes=other.minutes,
+                seconds=other.seconds,
+                microseconds=other.microseconds,
+            )
+            return self._shift(other.years * 12 + other.months, delta)
 
         raise NotImplementedError
 
-    def _subtract(self, other: relativedelta) -> "Period":
+    def _subtract(self, other: relativedelta) -> _Result:
         """
         Sum (subtract) a given timedelta to the period.
 
@@ -156,7 +605,7 @@ class Period(list):
         minutes: int = 0,
         seconds: int = 0,
         microseconds: int = 0,
-    ) -> "Period":
+    ) -> _Result:
         """
         Sum or subtract a timedelta from the period.
 
@@ -196,6 +645,84 @@ class Period(list):
             )
         )
 
+    def _ordered(self) -> Tuple[Sequence[Datetime], Optional[Sequence[int]]]:
+        """Get the elements in chronological order, and their positions if moved."""
+        return self, None  # type: ignore[return-value]
+
+    def _rank(self, item: Datetime, right: bool = False) -> int:
+        """Count the elements before (or up to, when right) a datetime."""
+        size = len(self)
+        if not size:
+            return 0
+
+        if not self._regular:
+            items, _ = self._ordered()
+            return (bisect_right if right else bisect_left)(items, item)
+
+        zone = self.start.tzinfo
+        if item.tzinfo is not None and zone is not None and item.tzinfo is not zone:
+            item = epoch.from_utc_micros(epoch.utc_micros(item), zone)
+
+        estimate = _estimate(self.start, self.freq, self.step, item)
+        position = min(max(estimate + 1, 0), size)
+
+        # the estimate can be one step off (timezone changes, clamped month days)
+        while position > 0 and (
+            self[position - 1] > item if right else self[position - 1] >= item
+        ):
+            position -= 1
+        while position < size and (
+            self[position] <= item if right else self[position] < item
+        ):
+            position += 1
+
+        return position
+
+    def locate(self, item: Datetime, side: str = "left") -> int:
+        """
+        Find where a datetime falls in the period.
+
+        Works like `bisect`/`numpy.searchsorted` over the elements in chronological
+        order: O(1) for regular periods, O(log n) otherwise. The bucket (element) a
+        datetime falls in is `locate(item, side="right") - 1`.
+
+        Parameters
+        ----------
+        item : Datetime
+            Datetime to locate.
+        side : str, optional
+            "left" (count of elements before the datetime), "right" (count of
+            elements before or equal to the datetime) or "nearest" (position of the
+            closest element, the earliest one on ties), by default "left"
+
+        Returns
+        -------
+        int
+            Insertion point or element position.
+
+        Raises
+        ------
+        ValueError
+            Unknown side, or nearest element of an empty period.
+        """
+        if side == "left" or side == "right":
+            return self._rank(item, side == "right")
+
+        if side != "nearest":
+            raise ValueError(f"Unknown side: {side}")
+
+        if not len(self):
+            raise ValueError("Cannot locate the nearest element of an empty period")
+
+        position = self._rank(item)
+        items, order = self._ordered()
+        if position == len(self) or (
+            position and item - items[position - 1] <= items[position] - item
+        ):
+            position -= 1
+
+        return int(order[position]) if order is not None else position
+
     @property
     def duration(self) -> float:
         """
@@ -206,6 +733,9 @@ class Period(list):
         float
             total seconds in the time span.
         """
+        if not len(self):
+            return 0.0
+
         delta = self.start - self.end
         return abs(delta.total_seconds())
 
@@ -213,41 +743,1141 @@ class Period(list):
         """Equivalent function of duration property."""
         return self.duration
 
-    def lt(self, other: "Period") -> bool:
+    def lt(self, other: "_PeriodMixin") -> bool:
         """Less than."""
         if self.duration < other.duration:
             return True
 
         return False
 
-    def le(self, other: "Period") -> bool:
+    def le(self, other: "_PeriodMixin") -> bool:
         """Less than or equal."""
         if self.duration <= other.duration:
             return True
 
         return False
 
-    def eq(self, other: "Period") -> bool:
+    def eq(self, other: "_PeriodMixin") -> bool:
         """Equal."""
         if self.duration == other.duration:
             return True
 
         return False
 
-    def gt(self, other: "Period") -> bool:
+    def gt(self, other: "_PeriodMixin") -> bool:
         """Greater than."""
         if self.duration > other.duration:
             return True
 
         return False
 
-    def ge(self, other: "Period") -> bool:
+    def ge(self, other: "_PeriodMixin") -> bool:
         """Greater than or equal."""
         if self.duration >= other.duration:
             return True
 
         return False
 
+    def _from_wall_grid(
+        self, tzinfo: Optional[_tzinfo], first: int, step: int, count: int
+    ) -> _Result:
+        """Build a period of the same flavour from a wall clock grid."""
+        if count <= 0:
+            return self._from_items([])
+
+        freq, step = _unit_of(step, self.freq)
+        start = Datetime._from_naive(
+            epoch.EPOCH + _timedelta(microseconds=first), tzinfo
+        )
+        return self._from_grid(start, freq, step, count)
+
+    def overlaps(self, other: "_PeriodMixin") -> bool:
+        """
+        Check if the time spans of two periods overlap.
+
+        Parameters
+        ----------
+        other : Period
+            Other period.
+
+        Returns
+        -------
+        bool
+            True if both spans share at least one instant.
+        """
+        if not len(self) or not len(other):
+            return False
+
+        return self.start <= other.end and other.start <= self.end
+
+    def intersection(self, other: "_PeriodMixin") -> _Result:
+        """
+        Get the datetimes found in both periods.
+
+        Regular periods with fixed units in the same timezone are intersected
+        arithmetically (the common elements are a grid stepping by the least common
+        multiple of both steps), without building either side. Other periods are
+        merged in sorted order.
+
+        Parameters
+        ----------
+        other : Period
+            Other period.
+
+        Returns
+        -------
+        Period
+            Period of the same flavour with the common datetimes.
+        """
+        a, b = _wall_grid(self), _wall_grid(other)
+
+        if a is not None and b is not None and a[0] is b[0]:
+            tzinfo, first_a, step_a, last_a = a
+            _, first_b, step_b, last_b = b
+
+            divisor = gcd(step_a, step_b)
+            if (first_b - first_a) % divisor:
+                return self._from_items([])
+
+            # first_a + step_a * k == first_b (mod step_b)
+            modulo = step_b // divisor
+            k = (
+                (first_b - first_a) // divisor * pow(step_a // divisor, -1, modulo)
+            ) % (modulo)
+            common = first_a + step_a * k
+            step = step_a * modulo
+            low, high = max(first_a, first_b), min(last_a, last_b)
+            first = common - (common - low) // step * step
+
+            return self._from_wall_grid(tzinfo, first, step, (high - first) // step + 1)
+
+        if not self.overlaps(other):
+            return self._from_items([])
+
+        return self._from_items(_merge(sorted(self), sorted(other), False, True, False))
+
+    def union(self, other: "_PeriodMixin") -> _Result:
+        """
+        Get the datetimes found in any of the periods.
+
+        Aligned regular periods with the same fixed step and timezone that touch or
+        overlap are joined arithmetically. Other periods are merged in sorted order.
+
+        Parameters
+        ----------
+        other : Period
+            Other period.
+
+        Returns
+        -------
+        Period
+            Period of the same flavour with the datetimes of both periods.
+        """
+        a, b = _wall_grid(self), _wall_grid(other)
+
+        if a is not None and b is not None and a[0] is b[0]:
+            tzinfo, first_a, step, last_a = a
+            _, first_b, step_b, last_b = b
+
+            if (
+                step == step_b
+                and (first_b - first_a) % step == 0
+                and first_b <= last_a + step
+                and first_a <= last_b + step
+            ):
+                first, last = min(first_a, first_b), max(last_a, last_b)
+                return self._from_wall_grid(
+                    tzinfo, first, step, (last - first) // step + 1
+                )
+
+        return self._from_items(_merge(sorted(self), sorted(other), True, True, True))
+
+    def difference(self, other: "_PeriodMixin") -> _Result:
+        """
+        Get the datetimes of this period not found in the other one.
+
+        When the other period holds every element of a regular period within its
+        span (or does not overlap it at all), the result is computed arithmetically.
+        Other periods are merged in sorted order.
+
+        Parameters
+        ----------
+        other : Period
+            Other period.
+
+        Returns
+        -------
+        Period
+            Period of the same flavour with the remaining datetimes.
+        """
+        a, b = _wall_grid(self), _wall_grid(other)
+
+        if a is not None and b is not None and a[0] is b[0]:
+            tzinfo, first_a, step_a, last_a = a
+            _, first_b, step_b, last_b = b
+            count = len(self)
+
+            if (
+                first_b > last_a
+                or last_b < first_a
+                or (step_a % step_b == 0 and (first_a - first_b) % step_b == 0)
+            ):
+                # elements before and after the other period span
+                before = min(max(-((first_a - first_b) // step_a), 0), count)
+                after = min(max((last_b - first_a) // step_a + 1, 0), count)
+
+                if after == count or before == 0:
+                    first = first_a + step_a * after if before == 0 else first_a
+                    size = count - after if before == 0 else before
+                    return self._from_wall_grid(tzinfo, first, step_a, size)
+
+        return self._from_items(_merge(sorted(self), sorted(other), True, False, False))
+
+
+class Period(_PeriodMixin["Period"], list):
+    """
+    Timeless time span.
+
+    Membership is tracked in a hash index and the start/end bounds are updated
+    incrementally, so `in`, `append` and `insert` run in constant time.
+    """
+
+    # chronological order of irregular periods, built on demand by `locate`
+    _order: Optional[Tuple[List[Datetime], List[int]]] = None
+
+    def __init__(
+        self,
+        start: Union[str, Datetime],
+        end: Union[str, Datetime],
+        freq: str = "days",
+        step: int = 1,
+        parse_kwargs: dict = dict(),
+    ):
+        list.__init__(self)
+        self._members: Set[Datetime] = set()
+
+        if isinstance(start, str):
+            start = parse(start, **parse_kwargs)
+
+        if isinstance(end, str):
+            end = parse(end, **parse_kwargs)
+
+        if end < start:
+            raise ValueError("End date must be greater than start date")
+
+        self.start = start
+        self.end = end
+        self.freq = freq
+        self.step = step
+
+        _check_freq(freq, step)
+
+        # regular elements are unique and sorted: no need to check each one
+        items = _grid_items(start, freq, step, _count(start, end, freq, step))
+        super(Period, self).extend(items)
+        self._members.update(items)
+        self.end = items[-1]
+        self._regular = True
+
+    @classmethod
+    def _build(
+        cls, items: List[Datetime], freq: str, step: int, regular: bool
+    ) -> "Period":
+        """Build a period straight from sorted, unique datetimes."""
+        period: Period = list.__new__(cls)
+        list.__init__(period, items)
+        period._members = set(items)
+        period.start = items[0] if items else None  # type: ignore
+        period.end = items[-1] if items else None  # type: ignore
+        period.freq = freq
+        period.step = step
+        period._regular = regular
+        return period
+
+    @classmethod
+    def _from_grid(cls, start: Datetime, freq: str, step: int, count: int) -> "Period":
+        """Build a regular period straight from its start, frequency, step and length."""
+        return cls._build(_grid_items(start, freq, step, count), freq, step, True)
+
+    def _from_items(self, items: List[Datetime]) -> "Period":
+        """Build an irregular period from sorted datetimes, keeping freq and step."""
+        return self._build(items, self.freq, self.step, False)
+
+    def _shift(self, months: int, delta: _timedelta) -> "Period":
+        """Move every element by calendar months, then by a fixed wall clock delta."""
+        regular = self._keeps_grid(months, delta)
+        return _shift_period(
+            self.__class__, self, months, delta, self.freq, self.step, regular
+        )
+
+    def __reduce__(self) -> Any:
+        """Pickle and copy support, rebuilding the membership index on load."""
+        state = self.__dict__.copy()
+        del state["_members"]
+        state.pop("_order", None)
+        return (_restore_period, (self.__class__, list(self), state))
+
+    def _check_new(self, item: Any) -> None:
+        """
+        Validate a datetime about to join the period.
+
+        Raises
+        ------
+        ValueError
+            Only Datetime instances allowed.
+        TypeError
+            Periods cannot have duplicate items.
+        """
+        if not isinstance(item, Datetime):
+            raise ValueError("Only Datetime instances allowed")
+
+        if item in self._members:
+            raise TypeError("Period cannot have duplicate items")
+
+    def _track(self, item: Datetime) -> None:
+        """Register a datetime that joined the period, widening the bounds."""
+        self._members.add(item)
+        self._regular = False
+        self._order = None
+
+        if len(self) == 1:
+            self.start = item
+            self.end = item
+        elif item < self.start:
+            self.start = item
+        elif item > self.end:
+            self.end = item
+
+    def _untrack(self, items: Iterable[Datetime]) -> None:
+        """Forget datetimes that left the period, shrinking the bounds if needed."""
+        self._regular = False
+        self._order = None
+        edges = False
+        for item in items:
+            self._members.discard(item)
+            edges = edges or item == self.start or item == self.end
+
+        if edges and len(self):
+            self.start = min(self)
+            self.end = max(self)
+
+    def __contains__(self, item: object) -> bool:
+        """Check if a datetime is part of the period."""
+        return item in self._members
+
+    def _ordered(self) -> Tuple[Sequence[Datetime], Optional[Sequence[int]]]:
+        """Get the elements in chronological order, and their positions if moved."""
+        if self._regular:
+            return self, None
+
+        if self._order is None:
+            order = sorted(range(len(self)), key=self.__getitem__)
+            self._order = ([self[position] for position in order], order)
+
+        return self._order
+
+    def index(  # type: ignore[override]
+        self, item: Any, start: int = 0, stop: int = 9223372036854775807
+    ) -> int:
+        """
+        Get the position of a datetime in the period.
+
+        Missing datetimes are rejected by the membership index, and regular periods
+        compute the position instead of scanning.
+
+        Raises
+        ------
+        ValueError
+            The datetime is not part of the period.
+        """
+        if item not in self._members:
+            raise ValueError(f"{item} is not in period")
+
+        if not self._regular:
+            return super(Period, self).index(item, start, stop)
+
+        position = self._rank(item)
+        if position not in range(len(self))[start:stop]:
+            raise ValueError(f"{item} is not in period")
+
+        return position
+
+    def append(self, item: Datetime) -> None:
+        """
+        Append a datetime instance to the end of the period.
+
+        Parameters
+        ----------
+        item : Datetime
+            Datetime instance to append.
+
+        Raises
+        ------
+        ValueError
+            Only Datetime instances allowed.
+        TypeError
+            Periods cannot have duplicate items.
+        """
+        self._check_new(item)
+        super(Period, self).append(item)
+        self._track(item)
+
+    def insert(self, index: SupportsIndex, item: Datetime) -> None:
+        """
+        Insert a datetime instance at the given index.
+
+        Parameters
+        ----------
+        index : int
+            List index to insert at.
+        item : Datetime
+            Datetime instance to insert.
+
+        Raises
+        ------
+        ValueError
+            Only Datetime instances allowed.
+        TypeError
+            Periods cannot have duplicate items.
+        """
+        self._check_new(item)
+        super(Period, self).insert(index, item)
+        self._track(item)
+
+    def extend(self, items: Iterable[Datetime]) -> None:
+        """
+        Append every given datetime instance to the end of the period.
+
+        Parameters
+        ----------
+        items : Iterable[Datetime]
+            Datetime instances to append.
+        """
+        for item in items:
+            self.append(item)
+
+    def extend_to(self, end: Union[str, Datetime], parse_kwargs: dict = dict()) -> None:
+        """
+        Move the period end forward, generating only the missing steps.
+
+        Steps continue from the current end, with the same stopping rule as the
+        constructor (the first element at or after the new end is included). An end
+        before the current one leaves the period untouched.
+
+        Parameters
+        ----------
+        end : Union[str, Datetime]
+            New period end.
+        parse_kwargs : dict, optional
+            Arguments passed to `parse` for a string end.
+
+        Raises
+        ------
+        ValueError
+            The period is empty.
+        """
+        if isinstance(end, str):
+            end = parse(end, **parse_kwargs)
+
+        if not len(self):
+            raise ValueError("Cannot extend an empty period")
+
+        if end <= self.end:
+            return
+
+        count = _count(self.end, end, self.freq, self.step)
+        items = _grid_items(self.end, self.freq, self.step, count)[1:]
+
+        # new steps come after every element: no duplicate or bounds check needed
+        super(Period, self).extend(items)
+        self._members.update(items)
+        self._order = None
+        self.end = items[-1]
+
+    def trim_before(
+        self, start: Union[str, Datetime], parse_kwargs: dict = dict()
+    ) -> None:
+        """
+        Drop every element before a datetime.
+
+        Regular periods find the cut position arithmetically and drop the head in one
+        go; other ones are filtered in a single pass.
+
+        Parameters
+        ----------
+        start : Union[str, Datetime]
+            Earliest element to keep.
+        parse_kwargs : dict, optional
+            Arguments passed to `parse` for a string start.
+        """
+        if isinstance(start, str):
+            start = parse(start, **parse_kwargs)
+
+        if not len(self) or start <= self.start:
+            return
+
+        if self._regular:
+            position = self._rank(start)
+            expired = self[:position]
+            super(Period, self).__delitem__(slice(0, position))
+        else:
+            expired = [item for item in self if item < start]
+            super(Period, self).__setitem__(
+                slice(None), [item for item in self if item >= start]
+            )
+            self._order = None
+
+        self._members.difference_update(expired)
+        if not len(self):
+            self.start = self.end = None  # type: ignore
+        else:
+            self.start = self[0] if self._regular else min(self)
+
+    def __iadd__(self, items: Iterable[Datetime]) -> "Period":  # type: ignore
+        """Append every given datetime instance to the end of the period."""
+        self.extend(items)
+        return self
+
+    def remove(self, item: Datetime) -> None:
+        """
+        Remove a datetime instance from the period.
+
+        Parameters
+        ----------
+        item : Datetime
+            Datetime instance to remove.
+        """
+        super(Period, self).remove(item)
+        self._untrack([item])
+
+    def pop(self, index: SupportsIndex = -1) -> Datetime:
+        """
+        Remove and return the datetime instance at the given index.
+
+        Parameters
+        ----------
+        index : int, optional
+            List index to remove, by default -1 (last)
+
+        Returns
+        -------
+        Datetime
+            Removed datetime instance.
+        """
+        item: Datetime = super(Period, self).pop(index)
+        self._untrack([item])
+        return item
+
+    def clear(self) -> None:
+        """Remove every datetime instance from the period."""
+        super(Period, self).clear()
+        self._members.clear()
+        self._regular = False
+        self._order = None
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        """Sort the period in place."""
+        super(Period, self).sort(*args, **kwargs)
+        self._regular = False
+        self._order = None
+
+    def reverse(self) -> None:
+        """Reverse the period in place."""
+        super(Period, self).reverse()
+        self._regular = False
+        self._order = None
+
+    def __delitem__(self, index: Union[SupportsIndex, slice]) -> None:
+        """Remove the datetime instance(s) at the given index or slice."""
+        items = self[index] if isinstance(index, slice) else [self[index]]
+        super(Period, self).__delitem__(index)
+        self._untrack(items)
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        """Replace the datetime instance(s) at the given index or slice."""
+        if not isinstance(index, slice):
+            old = self[index]
+            if value != old:
+                self._check_new(value)
+            super(Period, self).__setitem__(index, value)
+            self._untrack([old])
+            self._track(value)
+            return
+
+        old_items = self[index]
+        new_items = list(value)
+        members = self._members.difference(old_items)
+        for item in new_items:
+            if not isinstance(item, Datetime):
+                raise ValueError("Only Datetime instances allowed")
+            if item in members:
+                raise TypeError("Period cannot have duplicate items")
+            members.add(item)
+
+        super(Period, self).__setitem__(index, new_items)
+        self._members = members
+        self._regular = False
+        self._order = None
+        if len(self):
+            self.start = min(self)
+            self.end = max(self)
+
+
+def _restore_period(cls: type, items: List[Datetime], state: dict) -> Period:
+    """Rebuild a pickled or copied Period."""
+    period: Period = list.__new__(cls)
+    list.extend(period, items)
+    period.__dict__.update(state)
+    period._members = set(items)
+    return period
+
+
+class LazyPeriod(_PeriodMixin[Union["LazyPeriod", "Period"]], Sequence[Datetime]):
+    """
+    Read-only time span that computes its elements on demand.
+
+    Behaves like `range`: only start, frequency, step and length are stored, and
+    `len()`, indexing, membership and iteration are computed arithmetically. A
+    Datetime is only built when an element is accessed. Holds the same elements a
+    Period with the same arguments would.
+    """
+
+    _regular = True
+
+    def __init__(
+        self,
+        start: Union[str, Datetime],
+        end: Union[str, Datetime],
+        freq: str = "days",
+        step: int = 1,
+        parse_kwargs: dict = dict(),
+    ):
+        if isinstance(start, str):
+            start = parse(start, **parse_kwargs)
+
+        if isinstance(end, str):
+            end = parse(end, **parse_kwargs)
+
+        if end < start:
+            raise ValueError("End date must be greater than start date")
+
+        _check_freq(freq, step)
+
+        self.start = start
+        self.freq = freq
+        self.step = step
+        self._count = _count(start, end, freq, step)
+        self.end = self[-1]
+
+    @classmethod
+    def _from_grid(
+        cls, start: Datetime, freq: str, step: int, count: int
+    ) -> "LazyPeriod":
+        """Build a lazy period straight from its start, frequency, step and length."""
+        self = cls.__new__(cls)
+        self.start = start
+        self.freq = freq
+        self.step = step
+        self._count = count
+        self.end = self[-1]
+        return self
+
+    def _from_items(self, items: List[Datetime]) -> Period:
+        """Build an (eager) Period from sorted datetimes, keeping freq and step."""
+        return Period._build(items, self.freq, self.step, False)
+
+    def _shift(self, months: int, delta: _timedelta) -> Union["LazyPeriod", Period]:
+        """
+        Move every element by calendar months, then by a fixed wall clock delta.
+
+        Stays lazy when the shifted elements still form a grid (only the start moves),
+        otherwise builds an eager Period.
+        """
+        if self._keeps_grid(months, delta):
+            start = _shift_items([self.start], months, delta)[0]
+            return self._from_grid(start, self.freq, self.step, self._count)
+
+        return _shift_period(Period, self, months, delta, self.freq, self.step, False)
+
+    def __len__(self) -> int:
+        """Get the number of elements in the period."""
+        return self._count
+
+    def __getitem__(self, index: Any) -> Any:
+        """
+        Get an element (or a slice) of the period.
+
+        Slices keeping a regular spacing are lazy periods too, other slices are
+        lists of Datetime instances.
+        """
+        if isinstance(index, slice):
+            positions = range(self._count)[index]
+            if len(positions) == 0:
+                return []
+
+            if positions.step > 0 and (self.freq in FIXED_UNITS or positions.step == 1):
+                return self._from_grid(
+                    self[positions.start],
+                    self.freq,
+                    self.step * positions.step,
+                    len(positions),
+                )
+
+            return [self[position] for position in positions]
+
+        position = range(self._count)[index]
+        return _nth(self.start, self.freq, self.step, position)
+
+    def __iter__(self) -> Iterator[Datetime]:
+        """Iterate over the period, building one element at a time."""
+        return _iter_grid(self.start, self.freq, self.step, self._count)
+
+    def __reversed__(self) -> Iterator[Datetime]:
+        """Iterate over the period backwards."""
+        for position in reversed(range(self._count)):
+            yield self[position]
+
+    def __contains__(self, item: object) -> bool:
+        """Check if a datetime is part of the period."""
+        try:
+            self.index(item)
+        except ValueError:
+            return False
+
+        return True
+
+    def index(self, item: Any, start: int = 0, stop: int = 9223372036854775807) -> int:
+        """
+        Get the position of a datetime in the period.
+
+        Parameters
+        ----------
+        item : Datetime
+            Datetime to look for.
+        start : int, optional
+            Lowest position to consider, by default 0
+        stop : int, optional
+            Position to stop at, by default the period length
+
+        Returns
+        -------
+        int
+            Element position.
+
+        Raises
+        ------
+        ValueError
+            The datetime is not part of the period.
+        """
+        if isinstance(item, _datetime) and item.tzinfo is not None:
+            position = self._rank(item)  # type: ignore[arg-type]
+            if position in range(self._count)[start:stop] and self[position] == item:
+                return position
+
+        raise ValueError(f"{item} is not in period")
+
+    def count(self, item: Any) -> int:
+        """Count the occurrences of a datetime in the period (0 or 1)."""
+        return int(item in self)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the period elements with any other sequence."""
+        if isinstance(other, LazyPeriod):
+            if len(self) != len(other):
+                return False
+
+            if len(self) == 0 or (
+                self.start == other.start
+                and self.freq == other.freq
+                and self.step == other.step
+            ):
+                return True
+
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        """Representation of the period."""
+        return (
+            f"{self.__class__.__name__}(start={self.start!r}, end={self.end!r}, "
+            f"freq={self.freq!r}, step={self.step!r})"
+        )
+
+
+class CompactPeriod(_PeriodMixin["CompactPeriod"], Sequence[Datetime]):
+    """
+    Read-only time span storing its elements as int64 UTC epoch microseconds.
+
+    Elements live in a single Numpy int64 array (or an `array.array("q")` when Numpy
+    is not installed) sharing one timezone, and become Datetime instances only when
+    accessed. Uses 8 bytes per element instead of a full Datetime object.
+
+    Elements are generated on the wall clock like Period does, then stored as
+    instants: wall times that do not exist in the timezone (daylight saving gaps)
+    are stored as the instant the standard library resolves them to, unless that
+    instant is already in the period (or earlier), in which case they are dropped;
+    elements never repeat.
+    """
+
+    def __init__(
+        self,
+        start: Union[str, Datetime],
+        end: Union[str, Datetime],
+        freq: str = "days",
+        step: int = 1,
+        parse_kwargs: dict = dict(),
+    ):
+        if isinstance(start, str):
+            start = parse(start, **parse_kwargs)
+
+        if isinstance(end, str):
+            end = parse(end, **parse_kwargs)
+
+        if end < start:
+            raise ValueError("End date must be greater than start date")
+
+        _check_freq(freq, step)
+
+        grid = self._from_grid(start, freq, step, _count(start, end, freq, step))
+        self._init(grid._values, grid.tzinfo, freq, step, grid._regular)
+
+    @classmethod
+    def from_epoch(
+        cls,
+        values: Iterable[int],
+        zone: Union[str, _tzinfo] = "UTC",
+        freq: Optional[str] = None,
+        step: int = 1,
+    ) -> "CompactPeriod":
+        """
+        Build a period straight from UTC epoch microseconds.
+
+        The values are kept as given (any order, any spacing); they must not repeat.
+
+        Parameters
+        ----------
+        values : Iterable[int]
+            Microseconds since the UNIX epoch (UTC). Numpy int64 arrays and
+            `array.array("q")` buffers are used without copying.
+        zone : Union[str, tzinfo], optional
+            Period timezone, by default "UTC"
+        freq : Optional[str], optional
+            Nominal frequency of the values, by default None (unknown)
+        step : int, optional
+            Nominal step of the values, by default 1
+
+        Returns
+        -------
+        CompactPeriod
+            New period.
+        """
+        if freq is not None:
+            _check_freq(freq, step)
+
+        return cls._from_values(
+            epoch.new_buffer(values), _get_zone(zone), freq, step if freq else None
+        )
+
+    def _init(
+        self,
+        values: epoch.Buffer,
+        tzinfo: Optional[_tzinfo],
+        freq: Optional[str],
+        step: Optional[int],
+        regular: bool,
+    ) -> None:
+        """Set up the period from an epoch microseconds buffer."""
+        self._values = values
+        self.tzinfo = tzinfo
+        self.freq = freq  # type: ignore
+        self.step = step  # type: ignore
+        self._regular = regular
+        self._sorted = epoch.is_sorted(values)
+        self._order: Optional[Tuple[CompactPeriod, Any]] = None
+
+        if len(values):
+            self.start = self[0] if self._sorted else self._at(min(values))
+            self.end = self[-1] if self._sorted else self._at(max(values))
+        else:
+            self.start = self.end = None  # type: ignore
+
+    @classmethod
+    def _from_values(
+        cls,
+        values: epoch.Buffer,
+        tzinfo: Optional[_tzinfo],
+        freq: Optional[str] = None,
+        step: Optional[int] = None,
+        regular: bool = False,
+    ) -> "CompactPeriod":
+        """Build a compact period straight from an epoch microseconds buffer."""
+        self = cls.__new__(cls)
+        self._init(values, tzinfo, freq, step, regular)
+        return self
+
+    @classmethod
+    def _from_grid(
+        cls, start: Datetime, freq: str, step: int, count: int
+    ) -> "CompactPeriod":
+        """Build a regular period straight from its start, frequency, step and length."""
+        wall = _grid_wall_micros(start, freq, step, count)
+        values = epoch.wall_to_utc(wall, start.tzinfo)
+        regular = True
+        if not epoch.is_sorted(values):
+            # a daylight saving gap inside the grid would repeat instants
+            values = epoch.drop_nonexistent(wall, values, start.tzinfo)
+            regular = False
+
+        return cls._from_values(values, start.tzinfo, freq, step, regular)
+
+    def _from_items(self, items: List[Datetime]) -> "CompactPeriod":
+        """Build an irregular period from sorted datetimes, keeping freq and step."""
+        return self._from_values(
+            epoch.new_buffer(epoch.utc_micros(item) for item in items),
+            self.tzinfo,
+            self.freq,
+            self.step,
+        )
+
+    def _shift(self, months: int, delta: _timedelta) -> "CompactPeriod":
+        """Move every element by calendar months, then by a fixed wall clock delta."""
+        wall = epoch.utc_to_wall(self._values, self.tzinfo)
+        if months:
+            wall = epoch.add_months(wall, months)
+        if delta:
+            wall = epoch.add_micros(wall, delta // epoch.ONE_MICROSECOND)
+
+        values = epoch.wall_to_utc(wall, self.tzinfo)
+        if not epoch.is_sorted(values):
+            values = epoch.unique(values)
+
+        return self._from_values(
+            values, self.tzinfo, self.freq, self.step, self._keeps_grid(months, delta)
+        )
+
+    @property
+    def values(self) -> epoch.Buffer:
+        """UTC epoch microseconds buffer holding the elements."""
+        return self._values
+
+    @property
+    def zone(self) -> str:
+        """Timezone name shared by every element."""
+        return str(self.tzinfo)
+
+    def _ordered(self) -> Tuple[Sequence[Datetime], Optional[Sequence[int]]]:
+        """Get the elements in chronological order, and their positions if moved."""
+        if self._sorted:
+            return self, None
+
+        if self._order is None:
+            if epoch.np is not None:
+                order = epoch.np.argsort(self._values, kind="stable")
+                values = self._values[order]
+            else:
+                order = sorted(range(len(self)), key=self._values.__getitem__)
+                values = epoch.new_buffer(self._values[i] for i in order)
+            self._order = (self._from_values(values, self.tzinfo), order)
+
+        return self._order
+
+    def _rank(self, item: Datetime, right: bool = False) -> int:
+        """Count the elements before (or up to, when right) a datetime."""
+        ordered: CompactPeriod = self._ordered()[0]  # type: ignore[assignment]
+        values, value = ordered._values, epoch.utc_micros(item)
+
+        if epoch.np is not None and isinstance(values, epoch.np.ndarray):
+            return int(values.searchsorted(value, "right" if right else "left"))
+
+        return (bisect_right if right else bisect_left)(values, value)
+
+    def _at(self, value: int) -> Datetime:
+        """Build the Datetime of an epoch microseconds value."""
+        return epoch.from_utc_micros(value, self.tzinfo)
+
+    def __len__(self) -> int:
+        """Get the number of elements in the period."""
+        return len(self._values)
+
+    def __getitem__(self, index: Any) -> Any:
+        """
+        Get an element (or a slice) of the period.
+
+        Slices are compact periods too, sharing the buffer when Numpy is installed.
+        """
+        if isinstance(index, slice):
+            positions = range(len(self._values))[index]
+            regular = (
+                self._regular
+                and positions.step > 0
+                and (self.freq in FIXED_UNITS or positions.step == 1)
+            )
+            return self._from_values(
+                self._values[index],
+                self.tzinfo,
+                self.freq,
+                self.step * positions.step if regular else self.step,
+                regular,
+            )
+
+        return self._at(self._values[index])
+
+    def __iter__(self) -> Iterator[Datetime]:
+        """Iterate over the period, building one element at a time."""
+        for value in self._values:
+            yield self._at(value)
+
+    def __contains__(self, item: object) -> bool:
+        """Check if a datetime is part of the period."""
+        try:
+            self.index(item)
+        except ValueError:
+            return False
+
+        return True
+
+    def index(self, item: Any, start: int = 0, stop: int = 9223372036854775807) -> int:
+        """
+        Get the position of a datetime in the period.
+
+        Sorted periods are binary searched, other ones are scanned.
+
+        Parameters
+        ----------
+        item : Datetime
+            Datetime to look for.
+        start : int, optional
+            Lowest position to consider, by default 0
+        stop : int, optional
+            Position to stop at, by default the period length
+
+        Returns
+        -------
+        int
+            Element position.
+
+        Raises
+        ------
+        ValueError
+            The datetime is not part of the period.
+        """
+        if isinstance(item, _datetime) and item.tzinfo is not None:
+            value = epoch.utc_micros(item)
+            positions = range(len(self._values))[start:stop]
+
+            if self._sorted:
+                position = bisect_left(self._values, value)
+            else:
+                position = next(
+                    (i for i, other in enumerate(self._values) if other == value), -1
+                )
+
+            if position in positions and self._values[position] == value:
+                return position
+
+        raise ValueError(f"{item} is not in period")
+
+    def count(self, item: Any) -> int:
+        """Count the occurrences of a datetime in the period (0 or 1)."""
+        return int(item in self)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the period elements with any other sequence."""
+        if isinstance(other, CompactPeriod):
+            return len(self) == len(other) and all(
+                a == b for a, b in zip(self._values, other._values)
+            )
+
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        """Representation of the period."""
+        if not len(self):
+            return f"{self.__class__.__name__}([], zone={self.zone!r})"
+
+        return (
+            f"{self.__class__.__name__}(start={self.start!r}, end={self.end!r}, "
+            f"freq={self.freq!r}, step={self.step!r}, length={len(self)})"
+        )
+
+
+def iter_period(
+    start: Union[str, Datetime],
+    end: Union[str, Datetime],
+    freq: str = "days",
+    step: int = 1,
+    parse_kwargs: dict = dict(),
+) -> Iterator[Datetime]:
+    """
+    Walk a time span one Datetime at a time, in constant memory.
+
+    Yields the same elements a Period built with the same arguments holds, without
+    keeping any of them around.
+
+    Parameters
+    ----------
+    start : Union[str, Datetime]
+        First element.
+    end : Union[str, Datetime]
+        Span end.
+    freq : str, optional
+        Step unit, by default "days"
+    step : int, optional
+        Number of units per step, by default 1
+    parse_kwargs : dict, optional
+        Arguments passed to `parse` for string start and end values.
+
+    Returns
+    -------
+    Iterator[Datetime]
+        Time span elements. Arguments are checked when called, not when iterated.
+
+    Raises
+    ------
+    ValueError
+        End date is before start date, or invalid frequency/step.
+    """
+    if isinstance(start, str):
+        start = parse(start, **parse_kwargs)
+
+    if isinstance(end, str):
+        end = parse(end, **parse_kwargs)
+
+    if end < start:
+        raise ValueError("End date must be greater than start date")
+
+    _check_freq(freq, step)
+
+    return _iter_grid(start, freq, step, _count(start, end, freq, step))
+
+
+def _epoch_values(period: Sequence[Datetime]) -> Tuple[epoch.Buffer, Optional[_tzinfo]]:
+    """Get the UTC epoch microseconds and timezone of a period or array."""
+    values = getattr(period, "values", None)
+    if values is not None:
+        return epoch.new_buffer(values), period.tzinfo  # type: ignore[attr-defined]
+
+    if not len(period):
+        return epoch.new_buffer(), None
+
+    start = period[0]
+    if getattr(period, "_regular", False):
+        # every element, including the wall times of a daylight saving gap
+        freq, step = period.freq, period.step  # type: ignore[attr-defined]
+        wall = _grid_wall_micros(start, freq, step, len(period))
+        return epoch.wall_to_utc(wall, start.tzinfo), start.tzinfo
+
+    return epoch.new_buffer(epoch.utc_micros(item) for item in period), start.tzinfo
+
 
 class Periodkwargs(TypedDict):
     """Types for Period class."""
@@ -289,7 +1919,7 @@ def get_week(
 def get_current_week(
     week_first_day: str = "monday",
     zone: str = "UTC",
-    **period_kwargs: Unpack[Periodkwargs]
+    **period_kwargs: Unpack[Periodkwargs],
 ) -> Period:
     """
     Get current week as a Period in days.